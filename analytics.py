@@ -0,0 +1,130 @@
+import math
+import threading
+import time
+
+from columnar import SPECTRUM_COLUMNS
+
+EMOTION_INDEX = {name: i for i, name in enumerate(SPECTRUM_COLUMNS)}
+
+
+class _AnalyticsScope:
+    """Counters for one session (or the global scope), updated per sample"""
+
+    __slots__ = ('counts', 'total', 'transitions', 'dwell', 'visits',
+                 'decayed', 'decayed_at', 'last_emotion', 'last_ts', 'run_start')
+
+    def __init__(self):
+        size = len(SPECTRUM_COLUMNS)
+        self.counts = {}
+        self.total = 0
+        self.transitions = [[0] * size for _ in range(size)]
+        self.dwell = {}
+        self.visits = {}
+        self.decayed = {}
+        self.decayed_at = None
+        self.last_emotion = None
+        self.last_ts = None
+        self.run_start = None
+
+    def record(self, emotion, ts, decay_rate, max_gap):
+        self.counts[emotion] = self.counts.get(emotion, 0) + 1
+        self.total += 1
+
+        if self.last_emotion is not None:
+            # Cap the gap so idle periods (camera off, app closed) don't count as dwell
+            gap = min(max(ts - self.last_ts, 0.0), max_gap)
+            self.dwell[self.last_emotion] = self.dwell.get(self.last_emotion, 0.0) + gap
+            prev = EMOTION_INDEX.get(self.last_emotion)
+            curr = EMOTION_INDEX.get(emotion)
+            if prev is not None and curr is not None:
+                self.transitions[prev][curr] += 1
+
+        if emotion != self.last_emotion:
+            self.visits[emotion] = self.visits.get(emotion, 0) + 1
+            self.run_start = ts
+
+        # Exponentially decayed frequency: fold elapsed decay in lazily, then add this sample
+        if self.decayed_at is not None:
+            factor = math.exp(-decay_rate * max(ts - self.decayed_at, 0.0))
+            for name in self.decayed:
+                self.decayed[name] *= factor
+        self.decayed[emotion] = self.decayed.get(emotion, 0.0) + 1.0
+        self.decayed_at = ts
+
+        self.last_emotion = emotion
+        self.last_ts = ts
+
+    def snapshot(self, now, decay_rate):
+        total = self.total or 1
+        factor = math.exp(-decay_rate * max(now - self.decayed_at, 0.0)) if self.decayed_at is not None else 0.0
+        decayed = {name: value * factor for name, value in self.decayed.items()}
+        decayed_total = sum(decayed.values()) or 1.0
+        return {
+            'sample_count': self.total,
+            'counts': dict(self.counts),
+            'distribution': {name: round(count / total, 4) for name, count in self.counts.items()},
+            'transition_matrix': {
+                'labels': list(SPECTRUM_COLUMNS),
+                'counts': [row[:] for row in self.transitions]
+            },
+            'dwell_seconds': {name: round(value, 2) for name, value in self.dwell.items()},
+            'mean_dwell_seconds': {
+                name: round(value / self.visits[name], 2)
+                for name, value in self.dwell.items() if self.visits.get(name)
+            },
+            'decayed_frequency': {name: round(value / decayed_total, 4) for name, value in decayed.items()},
+            'current_emotion': self.last_emotion,
+            'current_run_seconds': round(now - self.run_start, 2) if self.run_start is not None else 0
+        }
+
+
+class EmotionAnalyticsEngine:
+    """Incremental emotion statistics per session and globally.
+
+    Every sample updates counts, a transition matrix over the seven spectrum
+    emotions, dwell times and exponentially time-decayed frequencies, so reads
+    cost the same no matter how much history has been seen.
+    """
+
+    def __init__(self, half_life=600.0, max_gap=60.0):
+        self.half_life = half_life
+        self.decay_rate = math.log(2) / half_life
+        self.max_gap = max_gap
+        self.lock = threading.Lock()
+        self.global_scope = _AnalyticsScope()
+        self.sessions = {}
+
+    def record(self, emotion, timestamp=None, session_id=None):
+        """Fold one dominant-emotion sample into the global and session counters"""
+        emotion = emotion or 'unknown'
+        ts = timestamp if timestamp is not None else time.time()
+        with self.lock:
+            self.global_scope.record(emotion, ts, self.decay_rate, self.max_gap)
+            if session_id:
+                scope = self.sessions.get(session_id)
+                if scope is None:
+                    scope = self.sessions[session_id] = _AnalyticsScope()
+                scope.record(emotion, ts, self.decay_rate, self.max_gap)
+
+    def snapshot(self, session_id=None, now=None):
+        """Current statistics for a session, or globally when session_id is None"""
+        now = now if now is not None else time.time()
+        with self.lock:
+            scope = self.global_scope if session_id is None else self.sessions.get(session_id)
+            if scope is None:
+                return None
+            data = scope.snapshot(now, self.decay_rate)
+        data['scope'] = 'global' if session_id is None else session_id
+        data['half_life_seconds'] = self.half_life
+        return data
+
+    def session_count(self, session_id):
+        with self.lock:
+            scope = self.sessions.get(session_id)
+            return scope.total if scope else 0
+
+    def clear(self):
+        """Reset all counters"""
+        with self.lock:
+            self.global_scope = _AnalyticsScope()
+            self.sessions = {}
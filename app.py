@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 import logging
 import os
 from functools import wraps
-import requests      
+from urllib.parse import urlparse
 import glob
 from flask import send_file
 
@@ -18,6 +18,21 @@ from emotion import EmotionAnalyzer
 from companion import AICompanion
 from spark import SparkAPI
 from config import Config
+from history import HistoryIndex, parse_timestamp, decode_cursor
+from rollups import EmotionRollups, ROLLUP_RESOLUTIONS
+from columnar import ColumnarEmotionStore
+from retention import ColdArchive, apply_retention
+from export import iter_history_records, ndjson_stream
+from analytics import EmotionAnalyticsEngine
+from logging_utils import HotPathLogger, get_logging_stats
+from pi_client import PiServerClient
+from pi_channel import PiChannel
+from pi_async import AsyncPiClient
+from pi_stream import PixelStreamSender, EmotionLightStreamer
+
+logger = logging.getLogger('app')
+# Rate-limited logging for per-frame and per-request paths (NEXUS_HOT_PATH_LOGGING=false silences it)
+hot_log = HotPathLogger(logger)
 
 # ✅ FIXED: Add proper error handling for speech processor
 try:
@@ -57,7 +72,7 @@ except Exception as e:
             }
             
         def speak(self, text):
-            print(f"🔇 [TTS DEMO] Would speak: {text}")
+            hot_log.debug('tts_demo', "🔇 [TTS DEMO] Would speak: %.80s", text)
             return {
                 'status': 'error',
                 'message': 'Text-to-speech unavailable',
@@ -85,7 +100,7 @@ CORS(app, supports_credentials=True)
 config = Config()
 
 # Pi Server Configuration - UPDATE THIS WITH YOUR PI'S IP
-PI_SERVER_URL = "http://10.116.22.223:5001"  # Your pi_server.py URL
+PI_SERVER_URL = os.getenv('PI_SERVER_URL', "http://10.116.22.223:5001")  # Your pi_server.py URL (or pi_simulator.py)
 
 # Initialize components with error handling
 ai_components_initialized = False
@@ -127,12 +142,12 @@ try:
                             # Check if we got a fallback response
                             if any(word in response.lower() for word in ['fallback', 'optimizing', 'realigning']):
                                 raise Exception("Google AI returned fallback response")
-                            print(f"🤖 Google AI Response: {response[:80]}...")
+                            hot_log.debug('chat_response', "🤖 Google AI Response: %.80s...", response)
                             return response
                         else:
                             raise Exception("Google AI disabled")
                     except Exception as e:
-                        print(f"⚠️ Google AI failed, using AICompanion: {e}")
+                        logger.warning("⚠️ Google AI failed, using AICompanion: %s", e)
                         return self.fallback.generate_response(
                             message, emotion_context, user_id, interaction_count
                         )
@@ -148,7 +163,7 @@ try:
                         else:
                             raise Exception("Google AI disabled")
                     except Exception as e:
-                        print(f"⚠️ Google AI pep talk failed: {e}")
+                        logger.warning("⚠️ Google AI pep talk failed: %s", e)
                         return self.fallback.generate_pep_talk(emotion, user_id)
             
             ai_companion = EnhancedAICompanion(spark_api, AICompanion())
@@ -240,227 +255,16 @@ except Exception as e:
 
 
 
-# Enhanced Pi Server Client with robust error handling
-class PiServerClient:
-    def __init__(self, base_url):
-        self.base_url = base_url
-        self.connected = False
-        self.last_connection_check = None
-        self.connection_retries = 0
-        self.max_retries = 3
-        
-    def check_connection(self, force_check=False):
-        """Check connection to Pi server with better error handling"""
-        try:
-            # Don't check too frequently (every 30 seconds max)
-            current_time = datetime.now()
-            if (not force_check and 
-                self.last_connection_check and 
-                (current_time - self.last_connection_check).total_seconds() < 10):
-                return self.connected
-            
-            print(f"🔌 Checking Pi Server connection: {self.base_url}")
-            
-            # Try multiple endpoints in case health is not available
-            endpoints_to_try = [
-                "/api/health",
-                "/api/system/status", 
-                "/api/sensors/read"
-            ]
-            
-            for endpoint in endpoints_to_try:
-                try:
-                    full_url = f"{self.base_url}{endpoint}"
-                    print(f"📡 Trying endpoint: {full_url}")
-                    
-                    response = requests.get(full_url, timeout=5)
-                    print(f"📡 Response from {endpoint}: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        try:
-                            data = response.json()
-                            print(f"📋 Response data: {data}")
-                            self.connected = True
-                            self.connection_retries = 0
-                            self.last_connection_check = current_time
-                            print("✅ Pi Server connected successfully!")
-                            return True
-                        except ValueError as e:
-                            print(f"⚠️ Invalid JSON from {endpoint}: {e}")
-                            continue
-                        
-                except requests.exceptions.Timeout:
-                    print(f"⏰ Timeout on {endpoint}")
-                    continue
-                except requests.exceptions.ConnectionError:
-                    print(f"🔌 Connection refused on {endpoint}")
-                    continue
-                except Exception as e:
-                    print(f"⚠️ Endpoint {endpoint} failed: {e}")
-                    continue
-            
-            # If all endpoints failed
-            self.connected = False
-            self.connection_retries += 1
-            self.last_connection_check = current_time
-            print(f"❌ All Pi Server endpoints failed (retry {self.connection_retries}/{self.max_retries})")
-            return False
-            
-        except Exception as e:
-            print(f"❌ Pi Server connection check failed: {e}")
-            self.connected = False
-            self.last_connection_check = datetime.now()
-            return False
-    
-    def call_pi_api(self, endpoint, method="GET", data=None, timeout=10):
-        """Make API call to Pi server with auto-reconnection"""
-        # If not connected and we haven't maxed retries, try to reconnect
-        if not self.connected and self.connection_retries < self.max_retries:
-            self.check_connection(force_check=True)
-            
-        if not self.connected:
-            return {
-                'status': 'error', 
-                'message': 'Pi server not connected',
-                'demo_mode': True
-            }
-            
-        try:
-            url = f"{self.base_url}{endpoint}"
-            headers = {'Content-Type': 'application/json'}
-            
-            print(f"📤 Calling Pi API: {method} {url}")
-            if data:
-                print(f"📦 Request data: {data}")
-            
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=headers, timeout=timeout)
-            else:
-                return {'status': 'error', 'message': f'Unsupported method: {method}'}
-            
-            print(f"📥 Pi API response status: {response.status_code}")
-            
-            # Handle non-JSON responses
-            try:
-                response_data = response.json()
-                print(f"📥 Pi API response data: {response_data}")
-            except ValueError:
-                response_data = {
-                    'status': 'error', 
-                    'message': 'Invalid JSON response', 
-                    'raw_response': response.text[:100]  # First 100 chars
-                }
-            
-            return response_data
-            
-        except requests.exceptions.Timeout:
-            error_msg = f"Pi API timeout ({endpoint})"
-            print(f"❌ {error_msg}")
-            return {'status': 'error', 'message': error_msg}
-        except requests.exceptions.ConnectionError:
-            error_msg = f"Pi server connection refused ({endpoint})"
-            print(f"❌ {error_msg}")
-            self.connected = False
-            return {'status': 'error', 'message': error_msg}
-        except Exception as e:
-            error_msg = f"Pi API call failed ({endpoint}): {str(e)}"
-            print(f"❌ {error_msg}")
-            return {'status': 'error', 'message': error_msg}
-    
-    # Pi control methods with demo fallback
-    def led_on(self):
-        result = self.call_pi_api("/api/led/on", "POST")
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': 'LED ON (demo mode)', 'demo': True}
-        return result
-    
-    def led_off(self):
-        result = self.call_pi_api("/api/led/off", "POST")
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': 'LED OFF (demo mode)', 'demo': True}
-        return result
-    
-    def set_brightness(self, brightness):
-        result = self.call_pi_api("/api/led/brightness", "POST", {"brightness": brightness})
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': f'Brightness set to {brightness}% (demo mode)', 'demo': True}
-        return result
-    
-    def set_emotion_lighting(self, emotion):
-        result = self.call_pi_api("/api/led/emotion", "POST", {"emotion": emotion})
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': f'Emotion lighting: {emotion} (demo mode)', 'demo': True}
-        return result
-    
-    def update_display(self, message):
-        result = self.call_pi_api("/api/display/update", "POST", {"message": message})
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': f'Display updated: {message} (demo mode)', 'demo': True}
-        return result
-    
-    def clear_display(self):
-        result = self.call_pi_api("/api/display/clear", "POST")
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': 'Display cleared (demo mode)', 'demo': True}
-        return result
-    
-    def read_sensors(self):
-        result = self.call_pi_api("/api/sensors/read", "GET")
-        if result.get('status') != 'success':
-            # Return demo sensor data
-            return {
-                'status': 'success',
-                'sensor_data': {
-                    'temperature_c': 24.5 + (np.random.random() - 0.5) * 2,
-                    'humidity': 50 + (np.random.random() - 0.5) * 10,
-                    'pressure': 1013 + (np.random.random() - 0.5) * 5,
-                    'demo_data': True
-                },
-                'demo': True
-            }
-        return result
-    
-    def get_system_status(self):
-        result = self.call_pi_api("/api/system/status", "GET")
-        if result.get('status') != 'success':
-            # Return demo system status
-            return {
-                'status': 'success',
-                'system_status': {
-                    'device': 'Raspberry Pi (Demo Mode)',
-                    'led_available': True,
-                    'oled_available': True,
-                    'dht_available': True,
-                    'led_state': False,
-                    'led_brightness_percent': 50,
-                    'last_sensor_read': datetime.now().isoformat(),
-                    'demo_mode': True
-                },
-                'demo': True
-            }
-        return result
-    
-    def get_emotions_list(self):
-        result = self.call_pi_api("/api/emotions/list", "GET")
-        if result.get('status') != 'success':
-            return {
-                'status': 'success',
-                'emotions': ['joy', 'sadness', 'anger', 'fear', 'surprise', 'neutral', 'calm', 'energy', 'focus'],
-                'demo': True
-            }
-        return result
-    
-    def reboot_pi(self):
-        result = self.call_pi_api("/api/reboot", "POST")
-        if result.get('status') != 'success':
-            return {'status': 'success', 'message': 'Reboot command sent (demo mode)', 'demo': True}
-        return result
-
 # Initialize Pi Server Client
 pi_client = PiServerClient(PI_SERVER_URL)
 
+# Concurrent fan-out for endpoints that combine several Pi reads
+pi_async = AsyncPiClient(pi_client)
+
+# Optional persistent command channel: commands go over it while it is up, HTTP otherwise
+if config.enable_pi_channel:
+    pi_client.attach_channel(PiChannel(urlparse(PI_SERVER_URL).hostname, config.pi_channel_port))
+
 # Global state with thread safety
 class SystemState:
     def __init__(self):
@@ -475,6 +279,49 @@ class SystemState:
 
 system_state = SystemState()
 
+def on_pi_connection_change(connected):
+    """Keep the shared system state in step with the Pi client's circuit breaker"""
+    with system_state.lock:
+        system_state.pi_connected = connected
+
+pi_client.add_connection_listener(on_pi_connection_change)
+
+def current_emotion_for_lighting():
+    with system_state.lock:
+        emotion = system_state.current_emotion
+        return emotion.get('dominant_emotion', 'neutral'), emotion.get('quantum_confidence', 0.0)
+
+# App-rendered lighting streamed to the Pi as raw LED frames (UDP)
+light_streamer = EmotionLightStreamer(
+    PixelStreamSender(urlparse(PI_SERVER_URL).hostname, config.pi_stream_port, config.pi_led_count),
+    current_emotion_for_lighting,
+    fps=config.pi_stream_fps
+)
+
+background_services_lock = threading.Lock()
+background_services_started = False
+
+def start_background_services():
+    """Start Pi reconnection, the command channel and light streaming (once per process)"""
+    global background_services_started
+    with background_services_lock:
+        if background_services_started:
+            return
+        background_services_started = True
+    # Reconnection is owned by the background prober; request paths fail fast meanwhile
+    pi_client.start_health_prober()
+    if pi_client.channel:
+        pi_client.channel.start()
+    if config.enable_pi_stream:
+        light_streamer.start()
+
+@app.before_request
+def ensure_background_services():
+    # Started from the first request rather than __main__ so launchers that import
+    # the app (start_nexus.py) get them too, and the debug reloader's parent doesn't
+    if not background_services_started:
+        start_background_services()
+
 class CameraManager:
     def __init__(self):
         self.camera = None
@@ -495,16 +342,16 @@ class CameraManager:
                         if ret and frame is not None:
                             self.is_running = True
                             self.retry_count = 0
-                            print(f"✅ Camera started on index {camera_index}")
+                            logger.info("✅ Camera started on index %s", camera_index)
                             return True
                 
                 # If no camera found, use demo mode
-                print("⚠️ No camera found - using demo mode")
+                logger.warning("⚠️ No camera found - using demo mode")
                 self.is_running = True
                 return True
                 
             except Exception as e:
-                print(f"⚠️ Camera start error: {e} - using demo mode")
+                logger.warning("⚠️ Camera start error: %s - using demo mode", e)
                 self.is_running = True
                 return True
     
@@ -546,7 +393,7 @@ class CameraManager:
             if self.camera:
                 self.camera.release()
             self.current_frame = None
-            print("✅ Camera stopped")
+            logger.info("✅ Camera stopped")
 
 camera_manager = CameraManager()
 
@@ -568,7 +415,7 @@ def emotion_analysis_worker():
                             system_state.current_emotion['source'] = 'camera'
                         
                         # ✅ GUARANTEED SAVE: Always log emotion data
-                        print(f"📊 Analysis #{analysis_count}: {emotion_result.get('dominant_emotion')}")
+                        hot_log.info('analysis', "📊 Analysis #%s: %s", analysis_count, emotion_result.get('dominant_emotion'))
                         log_emotion_data(emotion_result)
                         
                         # Auto-update Pi hardware based on emotion
@@ -578,7 +425,7 @@ def emotion_analysis_worker():
                         analysis_count += 1
                         
         except Exception as e:
-            print(f"❌ Emotion analysis error: {e}")
+            hot_log.error('analysis_loop', "❌ Emotion analysis error: %s", e)
         
         time.sleep(2)  # Analyze every 2 seconds
 def auto_update_hardware(emotion_data):
@@ -587,15 +434,66 @@ def auto_update_hardware(emotion_data):
         dominant_emotion = emotion_data.get('dominant_emotion', 'neutral')
         
         # Update OLED display with current emotion
+        # Queued operations go out together as one batch request
         if system_state.pi_connected:
-            pi_client.update_display(f"Emotion: {dominant_emotion.title()}")
+            pi_client.submit('display_update', {'message': f"Emotion: {dominant_emotion.title()}"})
         
-        # Auto-adjust lighting based on emotion
-        if emotion_data.get('quantum_confidence', 0) > 0.6:
-            pi_client.set_emotion_lighting(dominant_emotion)
+        # Auto-adjust lighting based on emotion (the light stream already follows it)
+        if emotion_data.get('quantum_confidence', 0) > 0.6 and not light_streamer.running:
+            pi_client.submit('led_emotion', {'emotion': dominant_emotion})
             
     except Exception as e:
-        print(f"❌ Auto hardware update failed: {e}")
+        hot_log.error('auto_hardware', "❌ Auto hardware update failed: %s", e)
+
+# Serialize read-modify-write cycles on the JSON log files
+emotion_log_lock = threading.Lock()
+chat_log_lock = threading.Lock()
+
+# Compressed cold tier for history that ages out of the hot JSON logs
+cold_archive = ColdArchive(config.archive_dir)
+
+# Timestamp index over logs/emotions.json (plus the archive) for range queries and pagination
+emotion_history_index = HistoryIndex(os.path.join('logs', 'emotions.json'), archive=cold_archive)
+chat_history_index = HistoryIndex(os.path.join('logs', 'chat_history.json'), archive=cold_archive,
+                                  archive_kind='chats', log_key='chats')
+
+# Per-minute/per-hour aggregates served to the analytics dashboard, snapshotted to logs/rollups.json
+emotion_rollups = EmotionRollups(os.path.join('logs', 'emotions.json'), archive=cold_archive)
+
+# Incremental distributions, transitions, dwell times and decayed frequencies
+emotion_analytics = EmotionAnalyticsEngine()
+
+def warm_emotion_analytics():
+    """Replay the hot emotion log into the analytics engine at startup"""
+    log_file = os.path.join('logs', 'emotions.json')
+    if not os.path.exists(log_file):
+        return
+    try:
+        with open(log_file, 'r') as f:
+            entries = json.load(f).get('emotion_logs', [])
+        for entry in entries:
+            emotion_analytics.record(
+                entry.get('dominant_emotion'),
+                timestamp=parse_timestamp(entry.get('timestamp')),
+                session_id=entry.get('session_id')
+            )
+    except Exception as e:
+        logger.warning("⚠️ Could not warm emotion analytics: %s", e)
+
+warm_emotion_analytics()
+
+# Optional memory-mapped columnar copy of every sample for long-range scans
+columnar_store = None
+if config.enable_columnar_store:
+    try:
+        columnar_store = ColumnarEmotionStore(config.columnar_store_dir)
+        if columnar_store.is_empty() and os.path.exists(os.path.join('logs', 'emotions.json')):
+            with open(os.path.join('logs', 'emotions.json'), 'r') as f:
+                imported = columnar_store.import_entries(json.load(f).get('emotion_logs', []))
+            logger.info("✅ Columnar store initialized with %s existing samples", imported)
+    except Exception as e:
+        logger.warning("⚠️ Columnar store unavailable: %s", e)
+        columnar_store = None
 
 # Start background worker
 analysis_thread = threading.Thread(target=emotion_analysis_worker, daemon=True)
@@ -622,48 +520,63 @@ def log_emotion_data(emotion_data):
         os.makedirs(logs_dir, exist_ok=True)
         
         log_file = os.path.join(logs_dir, 'emotions.json')
-        print(f"📝 Saving emotion to: {log_file}")
+        hot_log.debug('emotion_log_path', "📝 Saving emotion to: %s", log_file)
         
-        # Initialize or load existing data
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, 'r') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, Exception) as e:
-                print(f"⚠️ Error reading existing log file, creating new: {e}")
+        with emotion_log_lock:
+            # Initialize or load existing data
+            if os.path.exists(log_file):
+                try:
+                    with open(log_file, 'r') as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, Exception) as e:
+                    logger.warning("⚠️ Error reading existing log file, creating new: %s", e)
+                    data = {'emotion_logs': [], 'sessions': {}}
+            else:
                 data = {'emotion_logs': [], 'sessions': {}}
-        else:
-            data = {'emotion_logs': [], 'sessions': {}}
-        
-        # Add new log entry
-        data['emotion_logs'].append(log_entry)
-        
-        # Keep only last 1000 entries to prevent file from growing too large
-        if len(data['emotion_logs']) > 1000:
-            data['emotion_logs'] = data['emotion_logs'][-1000:]
-        
-        # Update session data
-        session_id = system_state.session_data.get('session_id')
-        if session_id:
-            if 'sessions' not in data:
-                data['sessions'] = {}
-            if session_id not in data['sessions']:
-                data['sessions'][session_id] = {
-                    'start_time': system_state.session_data.get('start_time'),
-                    'emotion_count': 0
-                }
-            data['sessions'][session_id]['emotion_count'] = len(
-                [log for log in data['emotion_logs'] if log.get('session_id') == session_id]
+        
+            # Add new log entry
+            data['emotion_logs'].append(log_entry)
+        
+            # Move older entries into the compressed archive instead of dropping them
+            data['emotion_logs'] = apply_retention(
+                cold_archive, 'emotions', data['emotion_logs'],
+                config.retention_hot_entries, config.retention_segment_entries,
+                config.retention_archive_days
+            )
+        
+            # Keep the history index in step with the file
+            emotion_history_index.add(log_entry)
+            emotion_history_index.trim(len(data['emotion_logs']))
+            emotion_rollups.add(log_entry)
+            emotion_analytics.record(
+                log_entry['dominant_emotion'],
+                timestamp=parse_timestamp(log_entry['timestamp']),
+                session_id=log_entry['session_id']
             )
+            if columnar_store:
+                columnar_store.append(log_entry)
         
-        # Save to file
-        with open(log_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            # Update session data
+            session_id = system_state.session_data.get('session_id')
+            if session_id:
+                if 'sessions' not in data:
+                    data['sessions'] = {}
+                if session_id not in data['sessions']:
+                    data['sessions'][session_id] = {
+                        'start_time': system_state.session_data.get('start_time'),
+                        'emotion_count': 0
+                    }
+                # Counted incrementally: archived entries no longer live in emotion_logs
+                data['sessions'][session_id]['emotion_count'] = data['sessions'][session_id].get('emotion_count', 0) + 1
+        
+            # Save to file
+            with open(log_file, 'w') as f:
+                json.dump(data, f, indent=2)
         
-        print(f"✅ Emotion saved to JSON: {log_entry['dominant_emotion']} (Confidence: {log_entry['quantum_confidence']:.2f})")
+        hot_log.debug('emotion_saved', "✅ Emotion saved to JSON: %s (Confidence: %.2f)", log_entry['dominant_emotion'], log_entry['quantum_confidence'])
         
     except Exception as e:
-        print(f"❌ Emotion logging error: {e}")
+        hot_log.error('emotion_log', "❌ Emotion logging error: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -701,11 +614,13 @@ def system_init():
         # Initialize Pi hardware for new session
         if pi_client.connected:
             try:
-                pi_client.update_display("Nexus AI Ready")
-                pi_client.led_on()
-                print("✅ Pi hardware initialized for new session")
+                pi_client.batch([
+                    {'op': 'display_update', 'params': {'message': "Nexus AI Ready"}},
+                    {'op': 'led_on'}
+                ])
+                logger.info("✅ Pi hardware initialized for new session")
             except Exception as e:
-                print(f"⚠️ Pi hardware init failed: {e}")
+                logger.warning("⚠️ Pi hardware init failed: %s", e)
         
         return jsonify({
             'status': 'success',
@@ -726,15 +641,21 @@ def system_health():
     try:
         uptime = (datetime.now() - system_state.start_time).total_seconds()
         
-        # Get Pi system status if connected
+        # Get Pi system status and hardware health concurrently, with a bounded wait
         pi_status = {}
+        pi_hardware = {}
         if pi_client.connected:
             try:
-                pi_response = pi_client.get_system_status()
-                if pi_response.get('status') == 'success':
-                    pi_status = pi_response.get('system_status', {})
+                pi_results = pi_async.fan_out({
+                    'status': '/api/system/status',
+                    'health': '/api/health'
+                }, timeout=2.0)
+                if pi_results['status'].get('status') == 'success':
+                    pi_status = pi_results['status'].get('system_status', {})
+                if pi_results['health'].get('status') == 'success':
+                    pi_hardware = pi_results['health'].get('hardware', {})
             except Exception as e:
-                print(f"⚠️ Pi status check failed: {e}")
+                hot_log.warning('health_pi_status', "⚠️ Pi status check failed: %s", e)
 
         health_data = {
             'status': 'healthy',
@@ -742,6 +663,7 @@ def system_health():
             'system_uptime': uptime,
             'pi_connected': pi_client.connected,
             'pi_connection_retries': pi_client.connection_retries,
+            'pi_circuit_state': pi_client.breaker.state,
             'components': {
                 'emotion_engine': {
                     'status': 'active',
@@ -757,14 +679,17 @@ def system_health():
                     'status': 'active' if pi_client.connected else 'disconnected',
                     'pi_connected': pi_client.connected,
                     'pi_server_url': PI_SERVER_URL,
-                    'pi_hardware_status': pi_status
+                    'pi_hardware_status': pi_status,
+                    'pi_hardware': pi_hardware,
+                    'transport': pi_client.get_transport_stats()
                 },
                 'voice_interface': {
                     'status': 'active' if hasattr(speech_processor, 'listening') else 'inactive',
                     'listening': getattr(speech_processor, 'listening', False),
                     'microphone_available': getattr(speech_processor, 'microphone', None) is not None
                 }
-            }
+            },
+            'logging': get_logging_stats()
         }
         
         return jsonify(health_data)
@@ -860,7 +785,7 @@ def camera_feed():
                 else:
                     time.sleep(0.1)
             except Exception as e:
-                print(f"Camera feed error: {e}")
+                hot_log.error('camera_feed', "Camera feed error: %s", e)
                 time.sleep(0.1)
     
     return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame')
@@ -970,7 +895,7 @@ def chat_send():
 def execute_command(command, value=None):
     """Execute hardware and system commands"""
     try:
-        print(f"🎯 Executing command: {command}")
+        logger.info("🎯 Executing command: %s", command)
         
         if command == 'led_on':
             result = pi_client.led_on()
@@ -1067,7 +992,7 @@ def execute_command(command, value=None):
         return {'action': command, 'result': 'Command not implemented', 'success': False}
         
     except Exception as e:
-        print(f"❌ Command execution failed: {e}")
+        logger.error("❌ Command execution failed: %s", e)
         return {'action': command, 'result': f'Error: {str(e)}', 'success': False}
 
 @app.route('/api/chat/commands', methods=['GET'])
@@ -1126,6 +1051,18 @@ def chat_history():
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Failed to get chat history: {str(e)}'}), 500
 
+@app.route('/api/chat/archive', methods=['GET'])
+@require_session
+def chat_archive():
+    """Get a page of saved conversation turns (hot log + cold archive).
+
+    Takes the same query parameters as /api/memory/history.
+    """
+    try:
+        return history_page(chat_history_index, 'chats')
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Failed to get chat archive: {str(e)}'}), 500
+
 def save_chat_to_file(user_message, ai_response):
     """Save chat messages to JSON file for persistence"""
     try:
@@ -1134,38 +1071,44 @@ def save_chat_to_file(user_message, ai_response):
         
         chat_file = os.path.join(logs_dir, 'chat_history.json')
         
-        # Load existing chat history
-        if os.path.exists(chat_file):
-            try:
-                with open(chat_file, 'r') as f:
-                    data = json.load(f)
-            except:
+        with chat_log_lock:
+            # Load existing chat history
+            if os.path.exists(chat_file):
+                try:
+                    with open(chat_file, 'r') as f:
+                        data = json.load(f)
+                except:
+                    data = {'chats': []}
+            else:
                 data = {'chats': []}
-        else:
-            data = {'chats': []}
         
-        # Add new conversation turn
-        conversation_turn = {
-            'timestamp': datetime.now().isoformat(),
-            'session_id': system_state.session_data.get('session_id'),
-            'user_message': user_message,
-            'ai_response': ai_response
-        }
+            # Add new conversation turn
+            conversation_turn = {
+                'timestamp': datetime.now().isoformat(),
+                'session_id': system_state.session_data.get('session_id'),
+                'user_message': user_message,
+                'ai_response': ai_response
+            }
         
-        data['chats'].append(conversation_turn)
+            data['chats'].append(conversation_turn)
         
-        # Keep only last 1000 conversations
-        if len(data['chats']) > 1000:
-            data['chats'] = data['chats'][-1000:]
+            # Move older conversations into the compressed archive instead of dropping them
+            data['chats'] = apply_retention(
+                cold_archive, 'chats', data['chats'],
+                config.retention_hot_entries, config.retention_segment_entries,
+                config.retention_archive_days
+            )
+            chat_history_index.add(conversation_turn)
+            chat_history_index.trim(len(data['chats']))
         
-        # Save to file
-        with open(chat_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            # Save to file
+            with open(chat_file, 'w') as f:
+                json.dump(data, f, indent=2)
             
-        print(f"💬 Chat saved: {user_message.get('message', '')[:50]}...")
+        hot_log.debug('chat_saved', "💬 Chat saved: %.50s...", user_message.get('message', ''))
         
     except Exception as e:
-        print(f"⚠️ Failed to save chat: {e}")
+        logger.warning("⚠️ Failed to save chat: %s", e)
         
 @app.route('/api/chat/clear', methods=['POST'])
 @require_session
@@ -1245,11 +1188,26 @@ def pi_led_emotion():
         data = request.get_json()
         emotion = data.get('emotion', 'neutral')
         
-        result = pi_client.set_emotion_lighting(emotion)
+        result = pi_client.set_emotion_lighting(emotion, data.get('zone'), data.get('fade'))
         return jsonify(result)
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Emotion lighting failed: {str(e)}'}), 500
 
+@app.route('/api/pi/led/stream', methods=['GET', 'POST'])
+@require_session
+def pi_led_stream():
+    """Start/stop emotion-synced LED streaming (POST {"enabled": true}) or get its stats"""
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            if data.get('enabled', True):
+                light_streamer.start()
+            else:
+                light_streamer.stop()
+        return jsonify({'status': 'success', 'stream': light_streamer.get_stats()})
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'LED stream failed: {str(e)}'}), 500
+
 @app.route('/api/pi/display/update', methods=['POST'])
 @require_session
 def pi_display_update():
@@ -1278,7 +1236,8 @@ def pi_display_clear():
 def pi_status():
     """Get Pi system status"""
     try:
-        result = pi_client.get_system_status()
+        # Served from the client-side mirror; ?fresh=1 forces a read from the Pi
+        result = pi_client.get_system_status(fresh=request.args.get('fresh') == '1')
         return jsonify(result)
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Status check failed: {str(e)}'}), 500
@@ -1288,11 +1247,23 @@ def pi_status():
 def pi_sensors():
     """Get Pi sensor data"""
     try:
-        result = pi_client.read_sensors()
+        result = pi_client.read_sensors(fresh=request.args.get('fresh') == '1')
         return jsonify(result)
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Sensor read failed: {str(e)}'}), 500
 
+@app.route('/api/pi/sensors/history', methods=['GET'])
+@require_session
+def pi_sensors_history():
+    """Get sampled Pi sensor history (?window=<seconds>&limit=<n>)"""
+    try:
+        window = request.args.get('window', type=float)
+        limit = request.args.get('limit', type=int)
+        result = pi_client.get_sensor_history(window=window, limit=limit)
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Sensor history failed: {str(e)}'}), 500
+
 @app.route('/api/pi/reboot', methods=['POST'])
 @require_session
 def pi_reboot():
@@ -1321,9 +1292,12 @@ def pi_shutdown():
 def pi_diagnostic():
     """Run Pi diagnostic"""
     try:
-        # Get comprehensive diagnostic information from Pi server
-        status_result = pi_client.get_system_status()
-        sensors_result = pi_client.read_sensors()
+        # Get comprehensive diagnostic information from Pi server, both reads at once
+        pi_results = pi_async.fan_out({
+            'status': '/api/system/status',
+            'sensors': '/api/sensors/read'
+        }, fresh=True)
+        status_result, sensors_result = pi_results['status'], pi_results['sensors']
         
         diagnostic_report = "Pi System Diagnostic Report\n"
         diagnostic_report += "===========================\n"
@@ -1386,40 +1360,264 @@ def pi_emotions_list():
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Failed to get emotions list: {str(e)}'}), 500
 
+@app.route('/api/pi/events', methods=['GET'])
+@require_session
+def pi_pushed_events():
+    """Get the latest sensor, display and LED state pushed by the Pi over the command channel"""
+    try:
+        return jsonify({
+            'status': 'success',
+            'channel_enabled': pi_client.channel is not None,
+            'channel_connected': bool(pi_client.channel and pi_client.channel.connected),
+            'events': pi_client.get_pushed_state()
+        })
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Pushed state unavailable: {str(e)}'}), 500
+
+@app.route('/api/pi/transport', methods=['GET'])
+@require_session
+def pi_transport_stats():
+    """Get connection pool, retry and latency statistics for the Pi link"""
+    try:
+        return jsonify({'status': 'success', 'transport': pi_client.get_transport_stats()})
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Transport stats failed: {str(e)}'}), 500
+
+
+def history_page(index, entries_key):
+    """Answer a paged history request against one HistoryIndex.
+
+    Query parameters:
+      since, until  ISO-8601 timestamps or epoch seconds bounding the range
+      limit         page size (default 50, max 1000)
+      cursor        next_cursor from a previous page
+      order         'desc' pages back from the newest entry (default), 'asc' forward from the oldest
+      session_id    session to filter by; 'all' disables the filter
+
+    The response echoes the session_id filter applied (null for all sessions).
+    hot_count is the number of hot-log entries matching the filters and
+    total_count the size of the whole hot log, as before paging existed.
+    """
+    try:
+        since = parse_timestamp(request.args.get('since'))
+        until = parse_timestamp(request.args.get('until'))
+        limit = min(max(int(request.args.get('limit', 50)), 1), 1000)
+        cursor = request.args.get('cursor')
+        cursor = decode_cursor(cursor) if cursor else None
+    except (ValueError, TypeError) as e:
+        return jsonify({'status': 'error', 'message': f'Invalid query parameter: {str(e)}'}), 400
+    
+    order = request.args.get('order', 'desc').lower()
+    if order not in ('asc', 'desc'):
+        return jsonify({'status': 'error', 'message': "order must be 'asc' or 'desc'"}), 400
+    
+    # Default to the current session, falling back to all sessions if it has no entries yet
+    session_id = request.args.get('session_id')
+    if session_id is None:
+        current_session = system_state.session_data.get('session_id')
+        if current_session and index.has_session(current_session):
+            session_id = current_session
+    elif session_id == 'all':
+        session_id = None
+    
+    page = index.query(
+        since=since,
+        until=until,
+        session_id=session_id,
+        limit=limit,
+        cursor=cursor,
+        order=order
+    )
+    
+    return jsonify({
+        'status': 'success',
+        entries_key: page['entries'],
+        'count': len(page['entries']),
+        'next_cursor': page['next_cursor'],
+        'has_more': page['has_more'],
+        'session_id': session_id,
+        'hot_count': page['hot_count'],
+        'total_count': len(index)
+    })
 
 @app.route('/api/memory/history', methods=['GET'])
 @require_session
 def memory_history():
-    """Get emotion history from memory bank"""
+    """Get a page of emotion history from the memory bank (see history_page for parameters)"""
     try:
-        # Read from the emotion log file
-        log_file = 'logs/emotions.json'
-        
-        if os.path.exists(log_file):
-            with open(log_file, 'r') as f:
-                data = json.load(f)
-            
-            # Get emotion logs for current session
-            session_id = system_state.session_data.get('session_id')
-            emotion_logs = data.get('emotion_logs', [])
-            
-            # Filter by current session if needed, or return all
-            session_logs = [log for log in emotion_logs if log.get('session_id') == session_id]
-            
+        return history_page(emotion_history_index, 'emotion_history')
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Failed to load memory: {str(e)}'}), 500
+
+@app.route('/api/analytics/rollups', methods=['GET'])
+@require_session
+def analytics_rollups():
+    """Get precomputed emotion aggregates.
+
+    Query parameters:
+      resolution    'minute' (last 24h) or 'hour' (last 30 days), default 'minute'
+      since, until  ISO-8601 timestamps or epoch seconds bounding the range
+    """
+    try:
+        resolution = request.args.get('resolution', 'minute').lower()
+        if resolution not in ROLLUP_RESOLUTIONS:
             return jsonify({
-                'status': 'success',
-                'emotion_history': session_logs if session_logs else emotion_logs[-50:],  # Last 50 entries
-                'total_count': len(emotion_logs)
-            })
-        else:
+                'status': 'error',
+                'message': f"resolution must be one of: {', '.join(ROLLUP_RESOLUTIONS)}"
+            }), 400
+        
+        try:
+            since = parse_timestamp(request.args.get('since'))
+            until = parse_timestamp(request.args.get('until'))
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': f'Invalid query parameter: {str(e)}'}), 400
+        
+        points = emotion_rollups.query(resolution, since=since, until=until)
+        
+        return jsonify({
+            'status': 'success',
+            'resolution': resolution,
+            'bucket_seconds': ROLLUP_RESOLUTIONS[resolution][0],
+            'rollups': points,
+            'count': len(points),
+            'sample_count': sum(point['count'] for point in points)
+        })
+        
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Failed to load rollups: {str(e)}'}), 500
+
+@app.route('/api/analytics/patterns', methods=['GET'])
+@require_session
+def analytics_patterns():
+    """Get incrementally maintained emotion statistics.
+
+    Query parameters:
+      session_id    session to report on (default: current session); 'global' for all sessions
+    """
+    try:
+        session_id = request.args.get('session_id', system_state.session_data.get('session_id'))
+        
+        global_stats = emotion_analytics.snapshot()
+        session_stats = None if session_id == 'global' else emotion_analytics.snapshot(session_id)
+        
+        return jsonify({
+            'status': 'success',
+            'session': session_stats,
+            'global': global_stats
+        })
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Failed to get emotion patterns: {str(e)}'}), 500
+
+@app.route('/api/analytics/scan', methods=['GET'])
+@require_session
+def analytics_scan():
+    """Summarize a time range from the columnar store.
+
+    Query parameters:
+      since, until  ISO-8601 timestamps or epoch seconds bounding the range
+      bins          confidence histogram bins (default 10, max 100)
+    """
+    try:
+        if not columnar_store:
             return jsonify({
-                'status': 'success',
-                'emotion_history': [],
-                'total_count': 0
-            })
-            
+                'status': 'error',
+                'message': 'Columnar store disabled (set NEXUS_COLUMNAR_STORE=true)'
+            }), 503
+        
+        try:
+            since = parse_timestamp(request.args.get('since'))
+            until = parse_timestamp(request.args.get('until'))
+            bins = min(max(int(request.args.get('bins', 10)), 1), 100)
+        except (ValueError, TypeError) as e:
+            return jsonify({'status': 'error', 'message': f'Invalid query parameter: {str(e)}'}), 400
+        
+        summary = columnar_store.summarize(since=since, until=until, bins=bins)
+        summary['status'] = 'success'
+        return jsonify(summary)
+        
     except Exception as e:
-        return jsonify({'status': 'error', 'message': f'Failed to load memory: {str(e)}'}), 500
+        return jsonify({'status': 'error', 'message': f'Analytics scan failed: {str(e)}'}), 500
+
+@app.route('/api/memory/retention', methods=['GET'])
+@require_session
+def memory_retention():
+    """Get hot/cold storage statistics for emotion and chat history"""
+    try:
+        return jsonify({
+            'status': 'success',
+            'config': config.get_retention_config(),
+            'emotions': {
+                'hot_entries': len(emotion_history_index),
+                'archive': cold_archive.stats('emotions')
+            },
+            'chats': {
+                'hot_entries': len(chat_history_index),
+                'archive': cold_archive.stats('chats')
+            }
+        })
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Failed to get retention stats: {str(e)}'}), 500
+
+# History export: (log file, records key, write lock) per kind
+EXPORT_SOURCES = {
+    'emotions': (os.path.join('logs', 'emotions.json'), 'emotion_logs', emotion_log_lock),
+    'chats': (os.path.join('logs', 'chat_history.json'), 'chats', chat_log_lock)
+}
+
+def export_history(kind):
+    """Stream one kind of history (archive + hot log) as NDJSON"""
+    try:
+        since = parse_timestamp(request.args.get('since'))
+        until = parse_timestamp(request.args.get('until'))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': f'Invalid query parameter: {str(e)}'}), 400
+    
+    log_file, key, lock = EXPORT_SOURCES[kind]
+    
+    # Snapshot the segment list and the bounded hot window together, then stream lock-free
+    with lock:
+        segments = cold_archive.segments(kind, since, until)
+        hot_records = []
+        if os.path.exists(log_file):
+            try:
+                with open(log_file, 'r') as f:
+                    hot_records = json.load(f).get(key, [])
+            except json.JSONDecodeError as e:
+                logger.warning("⚠️ Export could not read %s: %s", log_file, e)
+    
+    records = iter_history_records(
+        cold_archive, kind, segments, hot_records,
+        since=since, until=until, session_id=request.args.get('session_id')
+    )
+    
+    compress = ('gzip' in request.headers.get('Accept-Encoding', '').lower()
+                and request.args.get('gzip', 'true').lower() != 'false')
+    headers = {
+        'Content-Disposition': f'attachment; filename={kind}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.ndjson',
+        'Vary': 'Accept-Encoding'
+    }
+    if compress:
+        headers['Content-Encoding'] = 'gzip'
+    
+    return Response(ndjson_stream(records, compress=compress), mimetype='application/x-ndjson', headers=headers)
+
+@app.route('/api/export/emotions', methods=['GET'])
+@require_session
+def export_emotions():
+    """Stream emotion history as NDJSON (since/until/session_id filters, gzip if accepted)"""
+    try:
+        return export_history('emotions')
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Emotion export failed: {str(e)}'}), 500
+
+@app.route('/api/export/chats', methods=['GET'])
+@require_session
+def export_chats():
+    """Stream chat history as NDJSON (since/until/session_id filters, gzip if accepted)"""
+    try:
+        return export_history('chats')
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': f'Chat export failed: {str(e)}'}), 500
 
 @app.route('/api/memory/clear', methods=['POST'])
 @require_session
@@ -1428,10 +1626,18 @@ def memory_clear():
     try:
         log_file = 'logs/emotions.json'
         
-        if os.path.exists(log_file):
-            # Keep the file structure but clear the logs
-            with open(log_file, 'w') as f:
-                json.dump({'emotion_logs': [], 'sessions': {}}, f, indent=2)
+        with emotion_log_lock:
+            if os.path.exists(log_file):
+                # Keep the file structure but clear the logs
+                with open(log_file, 'w') as f:
+                    json.dump({'emotion_logs': [], 'sessions': {}}, f, indent=2)
+            
+            cold_archive.clear('emotions')
+            emotion_history_index.clear()
+            emotion_rollups.clear()
+            emotion_analytics.clear()
+            if columnar_store:
+                columnar_store.clear()
         
         return jsonify({
             'status': 'success',
@@ -1450,14 +1656,14 @@ def scan_images_folder():
         data = request.get_json()
         folder_path = data.get('folder_path', 'images/')
         
-        print(f"📁 Scanning folder: {folder_path}")
+        logger.debug("📁 Scanning folder: %s", folder_path)
         
         # Ensure folder exists
         if not os.path.exists(folder_path):
-            print(f"❌ Folder does not exist: {folder_path}")
+            logger.error("❌ Folder does not exist: %s", folder_path)
             try:
                 os.makedirs(folder_path, exist_ok=True)
-                print(f"✅ Created folder: {folder_path}")
+                logger.info("✅ Created folder: %s", folder_path)
                 return jsonify({
                     'status': 'success',
                     'folder_path': folder_path,
@@ -1493,7 +1699,7 @@ def scan_images_folder():
         # Sort by filename
         images.sort(key=lambda x: x['name'])
         
-        print(f"✅ Found {len(images)} images in {folder_path}")
+        logger.debug("✅ Found %s images in %s", len(images), folder_path)
         
         return jsonify({
             'status': 'success',
@@ -1503,7 +1709,7 @@ def scan_images_folder():
         })
         
     except Exception as e:
-        print(f"❌ Error scanning folder: {str(e)}")
+        logger.error("❌ Error scanning folder: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 @app.route('/api/test/get-image')
@@ -1516,7 +1722,7 @@ def get_test_image():
         if not image_path:
             return jsonify({'status': 'error', 'message': 'No image path provided'}), 400
         
-        print(f"🖼️ Serving image: {image_path}")
+        hot_log.debug('serve_image', "🖼️ Serving image: %s", image_path)
         
         # Security check - ensure path exists
         if not os.path.exists(image_path):
@@ -1533,13 +1739,13 @@ def get_test_image():
                     image_path = path
                     break
             else:
-                print(f"❌ Image not found at any path: {image_path}")
+                logger.error("❌ Image not found at any path: %s", image_path)
                 return jsonify({'status': 'error', 'message': 'Image not found'}), 404
         
         return send_file(image_path)
         
     except Exception as e:
-        print(f"❌ Error serving image: {str(e)}")
+        logger.error("❌ Error serving image: %s", e)
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 def convert_numpy_types(obj):
@@ -1562,90 +1768,90 @@ def convert_numpy_types(obj):
 def process_test_image():
     """Process a test image through emotion analysis"""
     try:
-        print("=== DEBUG: Starting process_test_image ===")
+        logger.debug("=== DEBUG: Starting process_test_image ===")
         
         # Check request data
         if not request.is_json:
-            print("❌ Request is not JSON")
+            logger.error("❌ Request is not JSON")
             return jsonify({'status': 'error', 'message': 'Request must be JSON'}), 400
             
         data = request.get_json()
-        print(f"📦 Received data: {data}")
+        logger.debug("📦 Received data: %s", data)
         
         if not data:
-            print("❌ No data in request")
+            logger.error("❌ No data in request")
             return jsonify({'status': 'error', 'message': 'No JSON data received'}), 400
         
         image_path = data.get('image_path')
         image_name = data.get('image_name', 'Unknown')
         
-        print(f"🎯 Processing image: {image_name}")
-        print(f"📍 Image path: {image_path}")
+        logger.debug("🎯 Processing image: %s", image_name)
+        logger.debug("📍 Image path: %s", image_path)
         
         # Validate input
         if not image_path:
-            print("❌ No image_path provided")
+            logger.error("❌ No image_path provided")
             return jsonify({'status': 'error', 'message': 'Missing image_path'}), 400
         
         # Resolve and check path
         if not os.path.isabs(image_path):
             abs_path = os.path.abspath(os.path.join(os.getcwd(), image_path))
-            print(f"🔍 Resolved path: {abs_path}")
+            logger.debug("🔍 Resolved path: %s", abs_path)
         else:
             abs_path = image_path
             
-        print(f"📁 Current directory: {os.getcwd()}")
-        print(f"🔎 File exists: {os.path.exists(abs_path)}")
+        logger.debug("📁 Current directory: %s", os.getcwd())
+        logger.debug("🔎 File exists: %s", os.path.exists(abs_path))
         
         if not os.path.exists(abs_path):
-            print(f"❌ File not found: {abs_path}")
+            logger.error("❌ File not found: %s", abs_path)
             return jsonify({
                 'status': 'error', 
                 'message': f'Image not found: {abs_path}'
             }), 404
         
         # Try to load image
-        print("🖼️ Attempting to load image with OpenCV...")
+        logger.debug("🖼️ Attempting to load image with OpenCV...")
         image = cv2.imread(abs_path)
         
         if image is None:
-            print(f"❌ OpenCV failed to load image: {abs_path}")
+            logger.error("❌ OpenCV failed to load image: %s", abs_path)
             # Try alternative loading methods
             try:
                 from PIL import Image
-                print("🔄 Trying PIL fallback...")
+                logger.debug("🔄 Trying PIL fallback...")
                 pil_image = Image.open(abs_path)
                 image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-                print("✅ PIL fallback successful")
+                logger.debug("✅ PIL fallback successful")
             except ImportError:
-                print("❌ PIL not available")
+                logger.error("❌ PIL not available")
                 return jsonify({
                     'status': 'error', 
                     'message': 'OpenCV failed to load image and PIL not available'
                 }), 400
             except Exception as pil_error:
-                print(f"❌ PIL also failed: {pil_error}")
+                logger.error("❌ PIL also failed: %s", pil_error)
                 return jsonify({
                     'status': 'error', 
                     'message': f'Failed to load image with any method: {str(pil_error)}'
                 }), 400
         
-        print(f"✅ Image loaded successfully: {image.shape}")
+        logger.debug("✅ Image loaded successfully: %s", image.shape)
         
         # Check if emotion_analyzer exists
         if 'emotion_analyzer' not in globals():
-            print("❌ emotion_analyzer not found in globals!")
+            logger.error("❌ emotion_analyzer not found in globals!")
             return jsonify({
                 'status': 'error', 
                 'message': 'Emotion analyzer not initialized'
             }), 500
             
-        print("🧠 Starting emotion analysis...")
+        logger.debug("🧠 Starting emotion analysis...")
         
         # Analyze emotion
         emotion_result = emotion_analyzer.analyze_emotion(image)
         
-        print(f"✅ Emotion analysis complete: {emotion_result.get('dominant_emotion', 'unknown')}")
+        logger.debug("✅ Emotion analysis complete: %s", emotion_result.get('dominant_emotion', 'unknown'))
         
         # CONVERT NUMPY TYPES TO NATIVE PYTHON TYPES - THIS IS THE FIX!
         emotion_result = convert_numpy_types(emotion_result)
@@ -1657,7 +1863,7 @@ def process_test_image():
             'source': 'test_image'
         })
         
-        print("=== DEBUG: process_test_image completed successfully ===")
+        logger.debug("=== DEBUG: process_test_image completed successfully ===")
         
         return jsonify({
             'status': 'success',
@@ -1665,10 +1871,7 @@ def process_test_image():
         })
         
     except Exception as e:
-        print(f"❌ CRITICAL ERROR in process_test_image: {str(e)}")
-        import traceback
-        print("🔍 Full stack trace:")
-        traceback.print_exc()
+        logger.exception("❌ CRITICAL ERROR in process_test_image: %s", e)
         return jsonify({
             'status': 'error', 
             'message': f'Server error: {str(e)}'
@@ -1683,28 +1886,28 @@ def debug_process_image():
         image_path = data.get('image_path')
         image_name = data.get('image_name', 'Unknown')
         
-        print(f"🔍 DEBUG: Processing image: {image_name}")
-        print(f"🔍 DEBUG: Image path: {image_path}")
+        logger.debug("🔍 DEBUG: Processing image: %s", image_name)
+        logger.debug("🔍 DEBUG: Image path: %s", image_path)
         
         # Check if file exists
         if not image_path or not os.path.exists(image_path):
-            print(f"❌ DEBUG: Image file not found: {image_path}")
+            logger.error("❌ DEBUG: Image file not found: %s", image_path)
             return jsonify({'status': 'error', 'message': 'Image file not found', 'debug_path': image_path}), 404
         
         # Try to load the image
-        print(f"🔍 DEBUG: Attempting to load image...")
+        logger.debug("🔍 DEBUG: Attempting to load image...")
         image = cv2.imread(image_path)
         if image is None:
-            print(f"❌ DEBUG: Failed to load image with OpenCV")
+            logger.error("❌ DEBUG: Failed to load image with OpenCV")
             return jsonify({'status': 'error', 'message': 'Failed to load image with OpenCV'}), 400
         
-        print(f"✅ DEBUG: Image loaded successfully, shape: {image.shape}")
+        logger.debug("✅ DEBUG: Image loaded successfully, shape: %s", image.shape)
         
         # Try emotion analysis
-        print(f"🔍 DEBUG: Attempting emotion analysis...")
+        logger.debug("🔍 DEBUG: Attempting emotion analysis...")
         emotion_result = emotion_analyzer.analyze_emotion(image)
         
-        print(f"✅ DEBUG: Emotion analysis successful: {emotion_result.get('dominant_emotion', 'unknown')}")
+        logger.debug("✅ DEBUG: Emotion analysis successful: %s", emotion_result.get('dominant_emotion', 'unknown'))
         
         # CONVERT NUMPY TYPES TO NATIVE PYTHON TYPES - THIS IS THE FIX!
         emotion_result = convert_numpy_types(emotion_result)
@@ -1720,9 +1923,9 @@ def debug_process_image():
         })
         
     except Exception as e:
-        print(f"❌ DEBUG: Exception in process-image: {str(e)}")
+        logger.error("❌ DEBUG: Exception in process-image: %s", e)
         import traceback
-        print(f"❌ DEBUG: Traceback: {traceback.format_exc()}")
+        logger.error("❌ DEBUG: Traceback: %s", traceback.format_exc())
         return jsonify({
             'status': 'error', 
             'message': f'Debug error: {str(e)}',
@@ -1746,10 +1949,10 @@ def log_test_analysis(emotion_data, image_name):
         with open(log_file, 'a') as f:
             f.write(json.dumps(log_entry) + '\n')
             
-        print(f"📝 Logged test analysis for: {image_name}")
+        logger.debug("📝 Logged test analysis for: %s", image_name)
         
     except Exception as e:
-        print(f"⚠️ Failed to log test analysis: {e}")
+        logger.warning("⚠️ Failed to log test analysis: %s", e)
     
 @app.route('/api/test/health', methods=['GET'])
 @require_session
@@ -1776,7 +1979,7 @@ def save_emotion():
         if not emotion_data:
             return jsonify({'status': 'error', 'message': 'No emotion data provided'}), 400
         
-        print(f"💾 Manual save request for emotion: {emotion_data.get('dominant_emotion', 'unknown')}")
+        logger.info("💾 Manual save request for emotion: %s", emotion_data.get('dominant_emotion', 'unknown'))
         
         # Log the emotion data
         log_emotion_data(emotion_data)
@@ -1789,7 +1992,7 @@ def save_emotion():
         })
         
     except Exception as e:
-        print(f"❌ Emotion save error: {e}")
+        logger.error("❌ Emotion save error: %s", e)
         return jsonify({'status': 'error', 'message': f'Failed to save emotion: {str(e)}'}), 500
     
 
@@ -1924,7 +2127,7 @@ if __name__ == '__main__':
                 if hasattr(speech_processor, 'get_command') and callable(getattr(speech_processor, 'get_command')):
                     command = speech_processor.get_command()
                     if command:
-                        print(f"🎤 Voice command received: {command['text']}")
+                        logger.info("🎤 Voice command received: %s", command['text'])
                         
                         # Process the voice command through your existing chat system
                         ai_response = ai_companion.generate_response(
@@ -1943,7 +2146,7 @@ if __name__ == '__main__':
                     time.sleep(5)
                             
             except Exception as e:
-                print(f"❌ Voice command processing error: {e}")
+                hot_log.error('voice_worker', "❌ Voice command processing error: %s", e)
                 time.sleep(5)  # Longer sleep on error
             
             time.sleep(0.5)  # Check for commands every 0.5 seconds
@@ -1967,15 +2170,28 @@ if __name__ == '__main__':
         ("POST", "/api/pi/led/off", "Turn LED off"),
         ("POST", "/api/pi/led/brightness", "Set brightness"),
         ("POST", "/api/pi/led/emotion", "Emotion lighting"),
+        ("POST", "/api/pi/led/stream", "Emotion-synced LED stream"),
         ("POST", "/api/pi/display/update", "Update display"),
         ("POST", "/api/pi/display/clear", "Clear display"),
         ("GET", "/api/pi/status", "Pi status"),
         ("GET", "/api/pi/sensors", "Sensor data"),
+        ("GET", "/api/pi/sensors/history", "Sensor history"),
         ("POST", "/api/pi/reboot", "Reboot Pi"),
         ("POST", "/api/pi/shutdown", "Shutdown Pi"),
         ("GET", "/api/pi/diagnostic", "Run diagnostic"),
         ("POST", "/api/pi/update", "Check updates"),
         ("GET", "/api/pi/emotions/list", "Get emotions"),
+        ("GET", "/api/pi/transport", "Pi link transport stats"),
+        ("GET", "/api/pi/events", "State pushed by the Pi"),
+        # Memory & Analytics Endpoints
+        ("GET", "/api/memory/history", "Emotion history (paged)"),
+        ("GET", "/api/chat/archive", "Saved chats (paged)"),
+        ("GET", "/api/analytics/rollups", "Emotion rollups"),
+        ("GET", "/api/analytics/scan", "Columnar range summary"),
+        ("GET", "/api/analytics/patterns", "Emotion patterns & transitions"),
+        ("GET", "/api/memory/retention", "History retention stats"),
+        ("GET", "/api/export/emotions", "Export emotions (NDJSON)"),
+        ("GET", "/api/export/chats", "Export chats (NDJSON)"),
         # Test Mode Endpoints
         ("POST", "/api/test/scan-folder", "Scan images folder"),
         ("GET", "/api/test/get-image", "Get test image"),
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+bench_animations.py - Animation timing and jitter benchmark for pi_control.py
+
+Runs each LED effect on the virtual strip (see pi_simulator.py) for a fixed
+time, first idle and then while worker threads hammer the HTTP API, and
+reports the achieved render rate, frame-interval jitter percentiles and
+render-thread CPU time per frame:
+
+    python bench_animations.py --duration 5 --load-threads 8
+    python bench_animations.py --effects party,crossfade --fps 60 --json bench.json
+
+Jitter is how far each interval between render passes strays from the
+1/PI_LED_FPS target, in milliseconds.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+
+EFFECTS = ('party', 'calm', 'energy', 'focus', 'crossfade')
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+class RenderProbe:
+    """Wraps the controller's render pass to timestamp each tick and measure its CPU time"""
+
+    def __init__(self, controller):
+        self.original = controller._render_zones
+        self.ticks = []  # (perf_counter at start, render-thread CPU seconds)
+        self.recording = False
+        controller._render_zones = self._render
+
+    def _render(self):
+        started = time.perf_counter()
+        cpu = time.thread_time()
+        result = self.original()
+        if self.recording:
+            self.ticks.append((started, time.thread_time() - cpu))
+        return result
+
+    def start(self):
+        self.ticks = []
+        self.recording = True
+
+    def stop(self):
+        self.recording = False
+        return self.ticks
+
+
+class HttpLoad:
+    """Worker threads sending a mix of read and display requests as fast as they can"""
+
+    REQUESTS = (
+        ('GET', '/api/system/status', None),
+        ('POST', '/api/display/update', {'message': 'Benchmark load message long enough to scroll'}),
+        ('GET', '/api/sensors/read', None),
+        ('GET', '/api/health', None),
+    )
+
+    def __init__(self, base_url, threads):
+        self.base_url = base_url
+        self.threads = threads
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+        self.workers = []
+
+    def start(self):
+        self.stop_event.clear()
+        self.latencies = []
+        self.errors = 0
+        self.workers = [threading.Thread(target=self._worker, args=(i,), daemon=True) for i in range(self.threads)]
+        for worker in self.workers:
+            worker.start()
+
+    def stop(self):
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=5)
+
+    def _worker(self, offset):
+        import requests
+
+        session = requests.Session()
+        for method, path, body in itertools.islice(itertools.cycle(self.REQUESTS), offset, None):
+            if self.stop_event.is_set():
+                return
+            started = time.perf_counter()
+            try:
+                response = session.request(method, self.base_url + path, json=body, timeout=5)
+                ok = response.status_code < 500
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                if ok:
+                    self.latencies.append(elapsed)
+                else:
+                    self.errors += 1
+
+
+def set_effect(hw, effect):
+    if effect != 'crossfade':
+        hw.set_emotion_lighting(effect)
+
+
+def crossfade_driver(hw, stop_event, period=0.3):
+    """Keep retargeting between two animated effects, faster than the crossfade completes"""
+    for emotion in itertools.cycle(('calm', 'party', 'energy')):
+        hw.set_emotion_lighting(emotion)
+        if stop_event.wait(period):
+            return
+
+
+def run_case(pi_control, probe, effect, duration, warmup):
+    hw = pi_control.hw
+    stop_driver = threading.Event()
+    if effect == 'crossfade':
+        threading.Thread(target=crossfade_driver, args=(hw, stop_driver), daemon=True).start()
+    else:
+        set_effect(hw, effect)
+    time.sleep(warmup)
+
+    shows_before = sum(strip.show_count for strip in hw.strips)
+    probe.start()
+    time.sleep(duration)
+    ticks = probe.stop()
+    shows = sum(strip.show_count for strip in hw.strips) - shows_before
+    stop_driver.set()
+
+    target = 1.0 / pi_control.LED_FPS
+    starts = [started for started, _ in ticks]
+    intervals = [b - a for a, b in zip(starts, starts[1:])]
+    jitter_ms = [abs(interval - target) * 1000 for interval in intervals]
+    cpu_ms = [cpu * 1000 for _, cpu in ticks]
+    span = starts[-1] - starts[0] if len(starts) > 1 else 0.0
+    return {
+        'effect': effect,
+        'target_fps': pi_control.LED_FPS,
+        'render_fps': round((len(starts) - 1) / span, 2) if span else 0.0,
+        'shows_per_second': round(shows / duration, 2),
+        'jitter_ms': {
+            'p50': round(percentile(jitter_ms, 50), 3),
+            'p95': round(percentile(jitter_ms, 95), 3),
+            'p99': round(percentile(jitter_ms, 99), 3),
+            'max': round(max(jitter_ms), 3) if jitter_ms else 0.0
+        },
+        'cpu_ms_per_frame': {
+            'mean': round(sum(cpu_ms) / len(cpu_ms), 4) if cpu_ms else 0.0,
+            'p99': round(percentile(cpu_ms, 99), 4)
+        },
+        'frames': len(ticks)
+    }
+
+
+def print_table(title, results):
+    print(f"\n{title}")
+    print(f"{'effect':<11} {'fps':>7} {'shows/s':>8} {'jit p50':>8} {'jit p95':>8} {'jit p99':>8} "
+          f"{'jit max':>8} {'cpu ms':>7}")
+    for r in results:
+        j = r['jitter_ms']
+        print(f"{r['effect']:<11} {r['render_fps']:>7} {r['shows_per_second']:>8} {j['p50']:>8} {j['p95']:>8} "
+              f"{j['p99']:>8} {j['max']:>8} {r['cpu_ms_per_frame']['mean']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pi_control LED animation timing on virtual hardware')
+    parser.add_argument('--effects', default=','.join(EFFECTS), help=f"comma-separated, from {', '.join(EFFECTS)}")
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds measured per effect')
+    parser.add_argument('--warmup', type=float, default=1.0, help='seconds before measuring each effect')
+    parser.add_argument('--fps', type=int, default=None, help='override PI_LED_FPS')
+    parser.add_argument('--load-threads', type=int, default=4, help='HTTP load workers for the loaded run (0 skips it)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='serve with the pooled server (default: thread per request)')
+    parser.add_argument('--json', default=None, help='also write results to this file')
+    args = parser.parse_args()
+
+    effects = [e.strip() for e in args.effects.split(',') if e.strip()]
+    unknown = set(effects) - set(EFFECTS)
+    if unknown:
+        parser.error(f"unknown effects: {', '.join(sorted(unknown))}")
+
+    # Configure before pi_control is imported (it reads its settings at import time)
+    if args.fps:
+        os.environ['PI_LED_FPS'] = str(args.fps)
+    os.environ['PI_VIRTUAL_HW'] = '1'
+    os.environ.setdefault('PI_HOT_LOGGING', '0')
+
+    import pi_simulator
+    import pi_control
+
+    base_url = pi_simulator.start_in_background(workers=args.workers)
+    probe = RenderProbe(pi_control.hw)
+    report = {'idle': [], 'loaded': [], 'load': None}
+
+    for effect in effects:
+        report['idle'].append(run_case(pi_control, probe, effect, args.duration, args.warmup))
+    print_table('Idle', report['idle'])
+
+    if args.load_threads > 0:
+        load = HttpLoad(base_url, args.load_threads)
+        load.start()
+        started = time.perf_counter()
+        try:
+            for effect in effects:
+                report['loaded'].append(run_case(pi_control, probe, effect, args.duration, args.warmup))
+        finally:
+            load.stop()
+        elapsed = time.perf_counter() - started
+        latencies_ms = [latency * 1000 for latency in load.latencies]
+        report['load'] = {
+            'threads': args.load_threads,
+            'requests_per_second': round(len(latencies_ms) / elapsed, 1),
+            'errors': load.errors,
+            'latency_ms': {
+                'p50': round(percentile(latencies_ms, 50), 2),
+                'p95': round(percentile(latencies_ms, 95), 2),
+                'p99': round(percentile(latencies_ms, 99), 2)
+            }
+        }
+        print_table(f"Under HTTP load ({args.load_threads} threads, "
+                    f"{report['load']['requests_per_second']} req/s, "
+                    f"p99 {report['load']['latency_ms']['p99']} ms)", report['loaded'])
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
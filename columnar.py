@@ -0,0 +1,182 @@
+import os
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from history import parse_timestamp
+
+# Fixed column order for the emotion spectrum (matches EmotionAnalyzer.emotion_mapping)
+SPECTRUM_COLUMNS = ('anger', 'disgust', 'fear', 'joy', 'sadness', 'surprise', 'neutral')
+UNKNOWN_EMOTION = 255
+
+SAMPLE_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('confidence', '<f4'),
+    ('dominant', 'u1'),
+    ('spectrum', '<f4', (len(SPECTRUM_COLUMNS),)),
+])
+
+
+class ColumnarEmotionStore:
+    """Append-only, fixed-width emotion samples stored in one memory-mapped file per day.
+
+    Each day file is a flat array of SAMPLE_DTYPE records kept sorted by
+    timestamp. Appends write a single record to the end of the file (a late,
+    out-of-order sample rewrites its day file instead); scans memory-map the
+    files in range, so range queries, means and histograms run as numpy
+    operations without JSON parsing and without holding the history in RAM.
+    """
+
+    def __init__(self, data_dir=os.path.join('logs', 'columnar')):
+        self.data_dir = data_dir
+        self.lock = threading.Lock()
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _day_path(self, day):
+        return os.path.join(self.data_dir, f"emotions_{day.strftime('%Y-%m-%d')}.bin")
+
+    def _to_record(self, entry):
+        ts = parse_timestamp(entry.get('timestamp')) or datetime.now().timestamp()
+        spectrum = entry.get('emotion_spectrum') or {}
+        dominant = entry.get('dominant_emotion')
+        record = np.zeros(1, dtype=SAMPLE_DTYPE)
+        record['timestamp'] = ts
+        record['confidence'] = float(entry.get('quantum_confidence', 0) or 0)
+        record['dominant'] = SPECTRUM_COLUMNS.index(dominant) if dominant in SPECTRUM_COLUMNS else UNKNOWN_EMOTION
+        record['spectrum'] = [float(spectrum.get(name, 0) or 0) for name in SPECTRUM_COLUMNS]
+        return record
+
+    def _last_timestamp(self, path):
+        """Timestamp of the newest complete record in a day file, or None"""
+        if not os.path.exists(path):
+            return None
+        rows = os.path.getsize(path) // SAMPLE_DTYPE.itemsize
+        if rows == 0:
+            return None
+        with open(path, 'rb') as f:
+            f.seek((rows - 1) * SAMPLE_DTYPE.itemsize)
+            return float(np.frombuffer(f.read(SAMPLE_DTYPE.itemsize), dtype=SAMPLE_DTYPE)['timestamp'][0])
+
+    def _write_day(self, day, block):
+        """Add a timestamp-sorted block to a day file, keeping the file sorted.
+
+        Scans binary-search each file by timestamp, so a block that starts before
+        the newest stored record is merged in and the file rewritten rather than
+        appended out of order. Called with the lock held.
+        """
+        path = self._day_path(day)
+        last_ts = self._last_timestamp(path)
+        if last_ts is None or block['timestamp'][0] >= last_ts:
+            with open(path, 'ab') as f:
+                f.write(block.tobytes())
+            return
+        existing = np.array(self._open_day(path))
+        merged = np.insert(existing, np.searchsorted(existing['timestamp'], block['timestamp'], side='right'), block)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(merged.tobytes())
+        # Readers holding a map of the old file keep a consistent view
+        os.replace(tmp_path, path)
+
+    def append(self, entry):
+        """Append one logged emotion entry to its day file"""
+        record = self._to_record(entry)
+        day = datetime.fromtimestamp(float(record['timestamp'][0])).date()
+        with self.lock:
+            self._write_day(day, record)
+
+    def import_entries(self, entries):
+        """Bulk-load existing JSON log entries, e.g. when first enabling the store"""
+        by_day = {}
+        for entry in entries:
+            try:
+                record = self._to_record(entry)
+            except ValueError:
+                continue
+            day = datetime.fromtimestamp(float(record['timestamp'][0])).date()
+            by_day.setdefault(day, []).append(record)
+        with self.lock:
+            for day, records in by_day.items():
+                block = np.concatenate(records)
+                block.sort(order='timestamp', kind='stable')
+                self._write_day(day, block)
+        return sum(len(records) for records in by_day.values())
+
+    def is_empty(self):
+        return not any(name.endswith('.bin') for name in os.listdir(self.data_dir))
+
+    def clear(self):
+        """Delete all day files"""
+        with self.lock:
+            for name in os.listdir(self.data_dir):
+                if name.endswith('.bin'):
+                    os.remove(os.path.join(self.data_dir, name))
+
+    def _open_day(self, path):
+        size = os.path.getsize(path)
+        rows = size // SAMPLE_DTYPE.itemsize
+        if rows == 0:
+            return None
+        # A torn trailing record (crash mid-write) is ignored rather than misread
+        return np.memmap(path, dtype=SAMPLE_DTYPE, mode='r', shape=(rows,))
+
+    def iter_chunks(self, since=None, until=None):
+        """Yield memory-mapped record slices covering [since, until], one per day file"""
+        names = sorted(name for name in os.listdir(self.data_dir) if name.endswith('.bin'))
+        first_day = datetime.fromtimestamp(since).date() if since is not None else None
+        last_day = datetime.fromtimestamp(until).date() if until is not None else None
+        for name in names:
+            day = datetime.strptime(name[len('emotions_'):-len('.bin')], '%Y-%m-%d').date()
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            records = self._open_day(os.path.join(self.data_dir, name))
+            if records is None:
+                continue
+            ts = records['timestamp']
+            lo = 0 if since is None else int(np.searchsorted(ts, since, side='left'))
+            hi = len(records) if until is None else int(np.searchsorted(ts, until, side='right'))
+            if hi > lo:
+                yield records[lo:hi]
+
+    def summarize(self, since=None, until=None, bins=10):
+        """Vectorized summary of the samples in range: counts, means and histograms"""
+        count = 0
+        confidence_sum = 0.0
+        spectrum_sum = np.zeros(len(SPECTRUM_COLUMNS), dtype=np.float64)
+        dominant_counts = np.zeros(256, dtype=np.int64)
+        edges = np.linspace(0.0, 1.0, bins + 1)
+        confidence_hist = np.zeros(bins, dtype=np.int64)
+        first_ts = last_ts = None
+
+        for chunk in self.iter_chunks(since, until):
+            count += len(chunk)
+            confidence = chunk['confidence']
+            confidence_sum += float(confidence.sum(dtype=np.float64))
+            spectrum_sum += chunk['spectrum'].sum(axis=0, dtype=np.float64)
+            dominant_counts += np.bincount(chunk['dominant'], minlength=256)
+            confidence_hist += np.histogram(confidence, bins=edges)[0]
+            first_ts = float(chunk['timestamp'][0]) if first_ts is None else first_ts
+            last_ts = float(chunk['timestamp'][-1])
+
+        distribution = {
+            name: int(dominant_counts[i]) for i, name in enumerate(SPECTRUM_COLUMNS) if dominant_counts[i]
+        }
+        if dominant_counts[UNKNOWN_EMOTION]:
+            distribution['unknown'] = int(dominant_counts[UNKNOWN_EMOTION])
+
+        return {
+            'sample_count': count,
+            'first_timestamp': datetime.fromtimestamp(first_ts).isoformat() if first_ts else None,
+            'last_timestamp': datetime.fromtimestamp(last_ts).isoformat() if last_ts else None,
+            'mean_confidence': round(confidence_sum / count, 4) if count else 0,
+            'mean_spectrum': {
+                name: round(float(spectrum_sum[i] / count), 4) if count else 0
+                for i, name in enumerate(SPECTRUM_COLUMNS)
+            },
+            'dominant_distribution': distribution,
+            'confidence_histogram': {
+                'edges': [round(float(e), 4) for e in edges],
+                'counts': confidence_hist.tolist()
+            }
+        }
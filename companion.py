@@ -3,11 +3,13 @@ import json
 from datetime import datetime
 import logging
 
+from analytics import EmotionAnalyticsEngine
+
 class AICompanion:
     def __init__(self):
         self.user_profiles = {}
         self.conversation_history = {}
-        self.emotion_patterns = {}
+        self.emotion_analytics = EmotionAnalyticsEngine()
         self.interaction_count = 0
         self.personality_traits = {
             'empathy_level': 0.8,
@@ -304,14 +306,8 @@ class AICompanion:
         if len(self.conversation_history[user_id]) > 50:
             self.conversation_history[user_id] = self.conversation_history[user_id][-50:]
             
-        # Update emotion patterns
-        if user_id not in self.emotion_patterns:
-            self.emotion_patterns[user_id] = []
-            
-        self.emotion_patterns[user_id].append({
-            'timestamp': datetime.now().isoformat(),
-            'emotion': emotion
-        })
+        # Update emotion patterns (incremental counters, no per-message list)
+        self.emotion_analytics.record(emotion, session_id=user_id)
 
     def get_conversation_summary(self, user_id):
         """Get summary of recent conversations"""
@@ -328,14 +324,10 @@ class AICompanion:
 
     def analyze_emotional_patterns(self, user_id):
         """Analyze emotional patterns for insights"""
-        if user_id not in self.emotion_patterns or len(self.emotion_patterns[user_id]) < 3:
+        if self.emotion_analytics.session_count(user_id) < 3:
             return "Need more emotion data to identify patterns."
             
-        emotions = [entry['emotion'] for entry in self.emotion_patterns[user_id]]
-        emotion_counts = {}
-        
-        for emotion in emotions:
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+        emotion_counts = self.emotion_analytics.snapshot(user_id)['counts']
             
         most_common = max(emotion_counts.items(), key=lambda x: x[1])
         pattern_insight = f"Your dominant emotional pattern is {most_common[0]} ({most_common[1]} occurrences)"
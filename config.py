@@ -2,6 +2,8 @@ import os
 import logging
 from datetime import datetime
 
+from logging_utils import setup_logging, parse_module_levels
+
 class Config:
     def __init__(self):
         # Application Settings
@@ -38,6 +40,12 @@ class Config:
         # Hardware Settings
         self.pi_host = os.getenv('PI_HOST', '10.201.151.223')
         self.pi_port = int(os.getenv('PI_PORT', '5001'))
+        self.enable_pi_channel = os.getenv('NEXUS_PI_CHANNEL', 'False').lower() == 'true'
+        self.pi_channel_port = int(os.getenv('PI_CHANNEL_PORT', '5002'))
+        self.enable_pi_stream = os.getenv('NEXUS_PI_STREAM', 'False').lower() == 'true'
+        self.pi_stream_port = int(os.getenv('PI_STREAM_PORT', '5003'))
+        self.pi_stream_fps = int(os.getenv('NEXUS_PI_STREAM_FPS', '30'))
+        self.pi_led_count = int(os.getenv('PI_LED_COUNT', '16'))
         self.gpio_led_pin = 18
         self.gpio_button_pin = 17
         self.safety_mode_default = True
@@ -51,6 +59,9 @@ class Config:
         # Logging Configuration
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
         self.log_file = f"nexus_ai_{datetime.now().strftime('%Y%m%d')}.log"
+        self.module_log_levels = parse_module_levels(os.getenv('NEXUS_LOG_LEVELS', ''))  # e.g. "emotion=WARNING,pi_client=DEBUG"
+        self.hot_path_logging = os.getenv('NEXUS_HOT_PATH_LOGGING', 'True').lower() == 'true'
+        self.hot_path_log_interval = float(os.getenv('NEXUS_HOT_LOG_INTERVAL', '5'))  # seconds between repeats
         
         # Performance Settings
         self.thread_pool_size = 10
@@ -62,25 +73,45 @@ class Config:
         self.enable_emotion_analysis = True
         self.enable_hardware_control = True
         self.enable_voice_processing = False  # Future feature
+        self.enable_columnar_store = os.getenv('NEXUS_COLUMNAR_STORE', 'False').lower() == 'true'
+        
+        # Analytics Storage
+        self.columnar_store_dir = os.getenv('NEXUS_COLUMNAR_DIR', os.path.join('logs', 'columnar'))
+        
+        # History Retention (hot JSON window + gzip cold archive)
+        self.retention_hot_entries = int(os.getenv('NEXUS_HOT_ENTRIES', '1000'))
+        self.retention_segment_entries = int(os.getenv('NEXUS_ARCHIVE_SEGMENT', '500'))
+        self.retention_archive_days = int(os.getenv('NEXUS_ARCHIVE_DAYS', '0'))  # 0 = keep forever
+        self.archive_dir = os.getenv('NEXUS_ARCHIVE_DIR', os.path.join('logs', 'archive'))
         
         # Initialize logging
         self._setup_logging()
 
     def _setup_logging(self):
-        """Setup application logging"""
-        logging.basicConfig(
+        """Setup application logging (queue-based, so logging never blocks callers)"""
+        # Reduce verbose logging from libraries; explicit module levels win
+        module_levels = {
+            'werkzeug': 'WARNING',
+            'socketio': 'WARNING',
+            'engineio': 'WARNING',
+        }
+        module_levels.update(self.module_log_levels)
+        setup_logging(
             level=getattr(logging, self.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
+            module_levels=module_levels,
+            log_file=self.log_file,
+            hot_path=self.hot_path_logging,
+            hot_path_interval=self.hot_path_log_interval
         )
-        
-        # Reduce verbose logging from libraries
-        logging.getLogger('werkzeug').setLevel(logging.WARNING)
-        logging.getLogger('socketio').setLevel(logging.WARNING)
-        logging.getLogger('engineio').setLevel(logging.WARNING)
+
+    def get_logging_config(self):
+        """Get logging configuration"""
+        return {
+            'level': self.log_level,
+            'module_levels': self.module_log_levels,
+            'hot_path_logging': self.hot_path_logging,
+            'hot_path_log_interval': self.hot_path_log_interval
+        }
 
     def get_spark_config(self):
         """Get Spark API configuration"""
@@ -108,7 +139,17 @@ class Config:
             'analysis_interval': self.emotion_analysis_interval,
             'confidence_threshold': self.confidence_threshold,
             'max_history': self.max_emotion_history,
-            'enabled': self.enable_emotion_analysis
+            'enabled': self.enable_emotion_analysis,
+            'columnar_store': self.enable_columnar_store
+        }
+
+    def get_retention_config(self):
+        """Get history retention configuration"""
+        return {
+            'hot_entries': self.retention_hot_entries,
+            'segment_entries': self.retention_segment_entries,
+            'archive_days': self.retention_archive_days,
+            'archive_dir': self.archive_dir
         }
 
     def get_companion_config(self):
@@ -124,6 +165,12 @@ class Config:
         return {
             'pi_host': self.pi_host,
             'pi_port': self.pi_port,
+            'pi_channel_enabled': self.enable_pi_channel,
+            'pi_channel_port': self.pi_channel_port,
+            'pi_stream_enabled': self.enable_pi_stream,
+            'pi_stream_port': self.pi_stream_port,
+            'pi_stream_fps': self.pi_stream_fps,
+            'pi_led_count': self.pi_led_count,
             'gpio_led_pin': self.gpio_led_pin,
             'gpio_button_pin': self.gpio_button_pin,
             'safety_mode': self.safety_mode_default,
@@ -149,7 +196,8 @@ class Config:
                 'camera': self.enable_camera,
                 'emotion_analysis': self.enable_emotion_analysis,
                 'hardware_control': self.enable_hardware_control,
-                'voice_processing': self.enable_voice_processing
+                'voice_processing': self.enable_voice_processing,
+                'columnar_store': self.enable_columnar_store
             },
             'security': {
                 'safety_mode': self.safety_mode_default,
@@ -6,6 +6,11 @@ import random
 from collections import deque
 import logging
 
+from logging_utils import HotPathLogger
+
+logger = logging.getLogger(__name__)
+hot_log = HotPathLogger(logger)
+
 try:
     from deepface import DeepFace
     DEEPFACE_AVAILABLE = True
@@ -54,7 +59,7 @@ class EmotionAnalyzer:
             return self._analyze_with_haar(frame)
             
         except Exception as e:
-            print(f"❌ Emotion analysis error: {e}")
+            hot_log.error('analysis', "❌ Emotion analysis error: %s", e)
             return self._generate_fallback_data()
 
     def _analyze_with_deepface(self, frame):
@@ -103,7 +108,7 @@ class EmotionAnalyzer:
             return emotion_data
             
         except Exception as e:
-            print(f"⚠️ DeepFace analysis failed: {e}")
+            hot_log.warning('deepface', "⚠️ DeepFace analysis failed: %s", e)
             return self._analyze_with_haar(frame)  # Fallback to Haar
 
     def _analyze_with_haar(self, frame):
@@ -139,7 +144,7 @@ class EmotionAnalyzer:
             return emotion_data
             
         except Exception as e:
-            print(f"❌ Haar analysis error: {e}")
+            hot_log.error('haar', "❌ Haar analysis error: %s", e)
             return self._generate_fallback_data()
 
     def _map_deepface_emotions(self, deepface_emotions):
@@ -0,0 +1,53 @@
+import json
+import zlib
+
+from history import parse_timestamp
+
+# Records per yielded chunk; keeps per-chunk overhead low without buffering much
+EXPORT_BATCH_SIZE = 64
+
+
+def iter_history_records(archive, kind, segments, hot_records, since=None, until=None, session_id=None):
+    """Yield archived then hot records of one kind, oldest first, filtered by time and session.
+
+    segments and hot_records should be captured together under the log's write
+    lock so a retention pass in between cannot duplicate or skip records; after
+    that the export runs without holding any lock.
+    """
+    for _, record in archive.iter_records(kind, since=since, until=until, segments=segments):
+        if session_id and record.get('session_id') != session_id:
+            continue
+        yield record
+
+    for record in hot_records:
+        try:
+            ts = parse_timestamp(record.get('timestamp'))
+        except ValueError:
+            continue
+        if ts is None or (since is not None and ts < since) or (until is not None and ts > until):
+            continue
+        if session_id and record.get('session_id') != session_id:
+            continue
+        yield record
+
+
+def ndjson_stream(records, compress=False):
+    """Encode records as newline-delimited JSON, optionally gzip-compressed on the fly"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    batch = []
+    for record in records:
+        batch.append(json.dumps(record, separators=(',', ':')))
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            chunk = ('\n'.join(batch) + '\n').encode('utf-8')
+            batch = []
+            if compressor:
+                chunk = compressor.compress(chunk)
+                if not chunk:
+                    continue
+            yield chunk
+
+    tail = ('\n'.join(batch) + '\n').encode('utf-8') if batch else b''
+    if compressor:
+        yield compressor.compress(tail) + compressor.flush()
+    elif tail:
+        yield tail
@@ -0,0 +1,233 @@
+import base64
+import bisect
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def parse_timestamp(value):
+    """Parse an ISO-8601 string or epoch seconds into epoch seconds"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+
+
+def encode_cursor(key):
+    """Encode an index key as an opaque, URL-safe cursor"""
+    raw = f"{key[0]!r}:{key[1]}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor back into an index key"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    ts, seq = base64.urlsafe_b64decode(padded.encode()).decode().split(':')
+    return (float(ts), int(seq))
+
+
+class HistoryIndex:
+    """In-memory timestamp index over a JSON history log for range queries and pagination.
+
+    log_key names the list of records inside the log file ('emotion_logs' for
+    logs/emotions.json, 'chats' for logs/chat_history.json).
+
+    When an archive (retention.ColdArchive) is attached, pages continue into the
+    compressed segments once the hot entries in range are exhausted. Archived
+    entries carry cursors with a negative seq, which sort before every hot key.
+    """
+
+    def __init__(self, log_file=os.path.join('logs', 'emotions.json'), archive=None, archive_kind='emotions',
+                 log_key='emotion_logs'):
+        self.log_file = log_file
+        self.log_key = log_key
+        self.archive = archive
+        self.archive_kind = archive_kind
+        self.lock = threading.Lock()
+        self._keys = []      # sorted (epoch_seconds, seq) tuples
+        self._entries = []   # log entries aligned with _keys
+        self._session_counts = {}
+        self._seq = 0
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        entries = []
+        if os.path.exists(self.log_file):
+            try:
+                with open(self.log_file, 'r') as f:
+                    entries = json.load(f).get(self.log_key, [])
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("⚠️ History index could not read %s: %s", self.log_file, e)
+        for entry in entries:
+            self._insert(entry)
+        self._loaded = True
+
+    def _insert(self, entry):
+        try:
+            ts = parse_timestamp(entry.get('timestamp'))
+        except ValueError:
+            ts = None
+        if ts is None:
+            return
+        key = (ts, self._seq)
+        self._seq += 1
+        session_id = entry.get('session_id')
+        self._session_counts[session_id] = self._session_counts.get(session_id, 0) + 1
+        # Samples almost always arrive in order, so this is an append in practice
+        if not self._keys or key > self._keys[-1]:
+            self._keys.append(key)
+            self._entries.append(entry)
+        else:
+            pos = bisect.bisect_right(self._keys, key)
+            self._keys.insert(pos, key)
+            self._entries.insert(pos, entry)
+
+    def add(self, entry):
+        """Index a newly logged entry"""
+        with self.lock:
+            self._ensure_loaded()
+            self._insert(entry)
+
+    def trim(self, max_entries):
+        """Drop the oldest entries so the index mirrors the capped log file"""
+        with self.lock:
+            excess = len(self._keys) - max_entries
+            if excess > 0:
+                for entry in self._entries[:excess]:
+                    session_id = entry.get('session_id')
+                    self._session_counts[session_id] -= 1
+                    if not self._session_counts[session_id]:
+                        del self._session_counts[session_id]
+                del self._keys[:excess]
+                del self._entries[:excess]
+
+    def clear(self):
+        """Forget all indexed entries"""
+        with self.lock:
+            self._keys = []
+            self._entries = []
+            self._session_counts = {}
+            self._loaded = True
+
+    def __len__(self):
+        with self.lock:
+            self._ensure_loaded()
+            return len(self._keys)
+
+    def query(self, since=None, until=None, session_id=None, limit=50, cursor=None, order='desc'):
+        """Return one page of entries within [since, until] plus a cursor for the next page.
+
+        order='desc' pages backwards from the newest entry (the default, matching
+        the old "last 50" behaviour); order='asc' pages forwards from the oldest.
+        Entries inside a page are always returned in chronological order.
+        hot_count is how many hot (unarchived) entries match the filters.
+        """
+        limit = max(1, int(limit))
+        page = []
+        next_key = last_key = None
+        archive_cursor = cursor is not None and cursor[1] < 0
+
+        # Ascending pages start in the archive, which holds everything older than the hot log
+        if order == 'asc' and self.archive and (cursor is None or archive_cursor):
+            bound = cursor if cursor else None
+            next_key, last_key = self._collect_archived(page, since, until, session_id, limit, False, bound, last_key)
+
+        with self.lock:
+            self._ensure_loaded()
+            hot_count = self._count_hot(since, until, session_id)
+            if next_key is None:
+                next_key, last_key = self._collect_hot(page, since, until, session_id, limit, cursor, order, last_key)
+
+        # Descending pages continue into the archive once the hot entries run out
+        if order != 'asc' and next_key is None and self.archive:
+            bound = cursor if archive_cursor else None
+            next_key, last_key = self._collect_archived(page, since, until, session_id, limit, True, bound, last_key)
+
+        if order != 'asc':
+            page.reverse()
+        return {
+            'entries': page,
+            'next_cursor': encode_cursor(next_key) if next_key else None,
+            'has_more': next_key is not None,
+            'hot_count': hot_count
+        }
+
+    def _range(self, since, until):
+        lo = 0 if since is None else bisect.bisect_left(self._keys, (since, -1))
+        hi = len(self._keys) if until is None else bisect.bisect_right(self._keys, (until, float('inf')))
+        return lo, hi
+
+    def _count_hot(self, since, until, session_id):
+        lo, hi = self._range(since, until)
+        if not session_id:
+            return max(0, hi - lo)
+        return sum(1 for entry in self._entries[lo:hi] if entry.get('session_id') == session_id)
+
+    def _collect_hot(self, page, since, until, session_id, limit, cursor, order, last_key):
+        """Fill page from the in-memory index; returns (next cursor key or None, last key)"""
+        lo, hi = self._range(since, until)
+
+        if cursor is not None:
+            if order == 'asc':
+                lo = max(lo, bisect.bisect_right(self._keys, cursor))
+            else:
+                hi = min(hi, bisect.bisect_left(self._keys, cursor))
+
+        positions = range(lo, hi) if order == 'asc' else range(hi - 1, lo - 1, -1)
+        for pos in positions:
+            entry = self._entries[pos]
+            if session_id and entry.get('session_id') != session_id:
+                continue
+            if len(page) >= limit:
+                return last_key, last_key
+            page.append(entry)
+            last_key = self._keys[pos]
+        return None, last_key
+
+    def _collect_archived(self, page, since, until, session_id, limit, reverse, bound, last_key):
+        """Fill page from archived segments; returns (next cursor key or None, last key).
+
+        Archived keys are (timestamp, -1 - n) where n counts the earlier records
+        sharing that timestamp in walk order, so a page boundary that falls
+        inside a run of equal timestamps resumes at the next record of the run.
+        bound is such a key (or None): records up to and including it are skipped.
+        """
+        records = self.archive.iter_records(self.archive_kind, since=since, until=until, reverse=reverse)
+        run_ts, run_pos = None, -1
+        try:
+            for ts, entry in records:
+                if ts == run_ts:
+                    run_pos += 1
+                else:
+                    run_ts, run_pos = ts, 0
+                if bound is not None:
+                    if ts > bound[0] if reverse else ts < bound[0]:
+                        continue
+                    if ts == bound[0] and run_pos <= -1 - bound[1]:
+                        continue
+                if session_id and entry.get('session_id') != session_id:
+                    continue
+                if len(page) >= limit:
+                    return last_key, last_key
+                page.append(entry)
+                last_key = (ts, -1 - run_pos)
+        finally:
+            records.close()
+        return None, last_key
+
+    def has_session(self, session_id):
+        """Check whether any indexed entry belongs to the given session"""
+        with self.lock:
+            self._ensure_loaded()
+            return self._session_counts.get(session_id, 0) > 0
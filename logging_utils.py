@@ -0,0 +1,141 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import random
+import threading
+import time
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None
+_queue_handler = None
+_hot_path_enabled = True
+_hot_path_interval = 5.0
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records when the queue is full instead of blocking or erroring"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_module_levels(spec):
+    """Parse "emotion=WARNING,pi_client=DEBUG" into {logger name: level}"""
+    levels = {}
+    for item in (spec or '').split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def set_hot_path_logging(enabled, interval=None):
+    """Switch hot-path debug/info logging on or off and set its default rate limit"""
+    global _hot_path_enabled, _hot_path_interval
+    _hot_path_enabled = bool(enabled)
+    if interval is not None:
+        _hot_path_interval = float(interval)
+
+
+def setup_logging(level='INFO', module_levels=None, log_file=None, hot_path=True,
+                  hot_path_interval=None, queue_size=10000):
+    """Route all logging through a bounded queue drained by a background listener.
+
+    Callers only enqueue records (dropping them if the queue is full), so slow
+    console or disk I/O never stalls a request, analysis or animation thread.
+    Safe to call again to change levels; handlers are installed once.
+    """
+    global _listener, _queue_handler
+    set_hot_path_logging(hot_path, hot_path_interval)
+    root = logging.getLogger()
+    root.setLevel(level)
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(queue_size)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    root.handlers = [_queue_handler]
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
+
+
+def get_logging_stats():
+    return {
+        'hot_path_enabled': _hot_path_enabled,
+        'hot_path_interval': _hot_path_interval,
+        'queued': _queue_handler.queue.qsize() if _queue_handler else 0,
+        'dropped': _queue_handler.dropped if _queue_handler else 0
+    }
+
+
+class HotPathLogger:
+    """Logger wrapper for per-frame and per-request code paths.
+
+    Each call names a key. A key logs at most once per `interval` seconds and
+    the next emitted line reports how many were suppressed; with `sample_rate`
+    set, each call is instead logged with that probability. Switching hot-path
+    logging off silences debug and info; warnings and errors still get through,
+    rate-limited.
+    """
+
+    def __init__(self, logger, interval=None, sample_rate=None):
+        self.logger = logger if isinstance(logger, logging.Logger) else logging.getLogger(logger)
+        self.interval = interval
+        self.sample_rate = sample_rate
+        self.lock = threading.Lock()
+        self.last = {}  # key -> (last emitted at, suppressed since)
+
+    def log(self, level, key, msg, *args):
+        if level < logging.WARNING and not _hot_path_enabled:
+            return
+        if not self.logger.isEnabledFor(level):
+            return
+        if self.sample_rate is not None and level < logging.WARNING:
+            if random.random() < self.sample_rate:
+                self.logger.log(level, msg, *args)
+            return
+
+        interval = self.interval if self.interval is not None else _hot_path_interval
+        now = time.monotonic()
+        with self.lock:
+            last, suppressed = self.last.get(key, (None, 0))
+            if last is not None and now - last < interval:
+                self.last[key] = (last, suppressed + 1)
+                return
+            self.last[key] = (now, 0)
+        if suppressed:
+            msg = f"{msg} (+{suppressed} similar suppressed)"
+        self.logger.log(level, msg, *args)
+
+    def debug(self, key, msg, *args):
+        self.log(logging.DEBUG, key, msg, *args)
+
+    def info(self, key, msg, *args):
+        self.log(logging.INFO, key, msg, *args)
+
+    def warning(self, key, msg, *args):
+        self.log(logging.WARNING, key, msg, *args)
+
+    def error(self, key, msg, *args):
+        self.log(logging.ERROR, key, msg, *args)
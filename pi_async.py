@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError as e:
+    HTTPX_AVAILABLE = False
+    logger.warning("⚠️ httpx not available: %s — Pi fan-out will use worker threads", e)
+
+from pi_client import PI_DEFAULT_TIMEOUT, PI_ENDPOINT_TIMEOUTS, PI_UNAVAILABLE_STATUSES
+
+# Read endpoints that are mirrored by PiServerClient
+MIRRORED_ENDPOINTS = {
+    '/api/sensors/read': 'sensors',
+    '/api/system/status': 'system_status',
+    '/api/emotions/list': 'emotions',
+}
+
+
+class AsyncPiClient:
+    """asyncio Pi client for issuing independent Pi calls concurrently.
+
+    Shares the circuit breaker and state mirror of a synchronous PiServerClient,
+    so both APIs see the same connection state and cached reads. The event loop
+    (and its httpx connection pool) lives on a background thread; synchronous
+    Flask handlers use fan_out() to run several calls at once and get them back
+    in the time of the slowest one rather than the sum.
+    """
+
+    def __init__(self, client, max_connections=4):
+        self.client = client
+        self.base_url = client.base_url
+        self.max_connections = max_connections
+        self.loop = None
+        self.http = None
+        self.lock = threading.Lock()
+        self.executor = None if HTTPX_AVAILABLE else ThreadPoolExecutor(max_workers=max_connections)
+
+    def _ensure_loop(self):
+        with self.lock:
+            if self.loop is not None:
+                return self.loop
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            self.loop = loop
+            return loop
+
+    def _http(self):
+        # Created on the loop thread so the pool is bound to that loop
+        if self.http is None:
+            self.http = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                headers={'Content-Type': 'application/json'}
+            )
+        return self.http
+
+    async def call(self, endpoint, method="GET", data=None):
+        """Async counterpart of PiServerClient.call_pi_api (HTTP only)"""
+        client = self.client
+        if not client.breaker.allow_request():
+            return {'status': 'error', 'message': 'Pi server not connected',
+                    'demo_mode': True, 'circuit': client.breaker.state}
+        if method.upper() == "POST":
+            client.mirror.invalidate('system_status')
+
+        connect, read = PI_ENDPOINT_TIMEOUTS.get(endpoint, PI_DEFAULT_TIMEOUT)
+        try:
+            response = await self._http().request(
+                method.upper(), endpoint, json=data,
+                timeout=httpx.Timeout(read, connect=connect)
+            )
+        except httpx.TimeoutException:
+            client._record_failure()
+            return {'status': 'error', 'message': f"Pi API timeout ({endpoint})"}
+        except httpx.TransportError:
+            client._record_failure()
+            return {'status': 'error', 'message': f"Pi server connection refused ({endpoint})"}
+
+        if response.status_code in PI_UNAVAILABLE_STATUSES:
+            client._record_failure()
+        else:
+            client._record_success()
+        try:
+            return response.json()
+        except ValueError:
+            return {'status': 'error', 'message': 'Invalid JSON response',
+                    'raw_response': response.text[:100]}
+
+    async def read(self, endpoint, fresh=False):
+        """Mirror-aware GET: fresh mirror hits return without touching the network"""
+        mirror = self.client.mirror
+        resource = MIRRORED_ENDPOINTS.get(endpoint)
+        if resource and not fresh:
+            cached = mirror.get(resource)
+            if cached is not None:
+                return cached
+        result = await self.call(endpoint, "GET")
+        if resource is None:
+            return result
+        if result.get('status') == 'success':
+            mirror.put(resource, result)
+            view = dict(result)
+            view['cache'] = {'source': 'pi', 'stale': False, 'age_seconds': 0.0,
+                             'fetched_at': datetime.now().isoformat(),
+                             'ttl_seconds': mirror.ttls.get(resource)}
+            return view
+        return mirror.get_stale(resource) or result
+
+    async def gather(self, calls, fresh=False):
+        """Run {name: endpoint} GETs concurrently; returns {name: result}"""
+        names = list(calls)
+        results = await asyncio.gather(*(self.read(calls[name], fresh) for name in names))
+        return dict(zip(names, results))
+
+    def fan_out(self, calls, fresh=False, timeout=6.0):
+        """Blocking entry point for sync code: concurrent GETs of {name: endpoint}.
+
+        Calls that have not finished within `timeout` come back as error dicts.
+        """
+        started = time.perf_counter()
+        if not HTTPX_AVAILABLE:
+            futures = {name: self.executor.submit(self._sync_read, endpoint, fresh)
+                       for name, endpoint in calls.items()}
+            results = {}
+            for name, future in futures.items():
+                remaining = max(timeout - (time.perf_counter() - started), 0)
+                try:
+                    results[name] = future.result(remaining)
+                except FutureTimeoutError:
+                    results[name] = {'status': 'error', 'message': f"Pi call timed out ({calls[name]})"}
+            return results
+
+        future = asyncio.run_coroutine_threadsafe(self.gather(calls, fresh), self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            return {name: {'status': 'error', 'message': f"Pi call timed out ({endpoint})"}
+                    for name, endpoint in calls.items()}
+
+    def _sync_read(self, endpoint, fresh):
+        resource = MIRRORED_ENDPOINTS.get(endpoint)
+        if resource is None:
+            return self.client.call_pi_api(endpoint, "GET")
+        return self.client._read_mirrored(resource, endpoint, fresh) or {
+            'status': 'error', 'message': f"Pi server unavailable ({endpoint})"
+        }
@@ -0,0 +1,179 @@
+import itertools
+import logging
+import random
+import socket
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from pi_protocol import encode_frame, recv_frame
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelNotSentError(ConnectionError):
+    """The command never left the app (no bytes written), so it is safe to send another way"""
+
+
+class PiChannel:
+    """Persistent framed-JSON connection to the Pi's command channel.
+
+    Commands are sent with a correlation id and matched to their replies by a
+    reader thread, so several can be in flight at once over one socket. Event
+    frames the Pi pushes (sensor readings, display and LED state, finished
+    animations) go to registered listeners. A dropped connection fails the
+    pending commands and is re-established with jittered exponential backoff.
+    """
+
+    def __init__(self, host, port=5002, connect_timeout=2.0, max_backoff=30.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.max_backoff = max_backoff
+        self.sock = None
+        self.connected = False
+        self.send_lock = threading.Lock()
+        self.pending_lock = threading.Lock()
+        self.pending = {}
+        self.ids = itertools.count(1)
+        self.listeners = []
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stats = {
+            'connects': 0,
+            'disconnects': 0,
+            'commands': 0,
+            'command_failures': 0,
+            'events_received': 0,
+            'total_rtt_ms': 0.0
+        }
+
+    def add_event_listener(self, callback):
+        """Call callback(event, data) for every event frame pushed by the Pi"""
+        self.listeners.append(callback)
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self._close()
+
+    def _run(self):
+        attempt = 0
+        while not self.stop_event.is_set():
+            try:
+                sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+                sock.settimeout(None)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                attempt += 1
+                delay = random.uniform(0, min(self.max_backoff, 0.5 * (2 ** min(attempt, 10))))
+                self.stop_event.wait(delay)
+                continue
+
+            attempt = 0
+            self.sock = sock
+            self.connected = True
+            self.stats['connects'] += 1
+            logger.info("🔗 Pi command channel connected (%s:%s)", self.host, self.port)
+            try:
+                while True:
+                    self._dispatch(recv_frame(sock))
+            except (ConnectionError, OSError, ValueError) as e:
+                if not self.stop_event.is_set():
+                    logger.warning("🔗 Pi command channel lost: %s", e)
+            finally:
+                self.stats['disconnects'] += 1
+                self._close()
+
+    def _dispatch(self, frame):
+        kind = frame.get('type')
+        if kind == 'result':
+            with self.pending_lock:
+                future = self.pending.pop(frame.get('id'), None)
+            if future is not None and not future.done():
+                future.set_result(frame.get('result') or {})
+        elif kind in ('event', 'hello'):
+            self.stats['events_received'] += 1
+            event = frame.get('event', 'hello')
+            data = frame.get('data', frame.get('status'))
+            for callback in list(self.listeners):
+                try:
+                    callback(event, data)
+                except Exception as e:
+                    logger.warning("⚠️ Channel event listener failed (%s): %s", event, e)
+
+    def _close(self):
+        self.connected = False
+        sock, self.sock = self.sock, None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        with self.pending_lock:
+            pending, self.pending = self.pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError('Pi command channel closed'))
+
+    def request(self, payload, timeout=5.0):
+        """Send one frame and wait for its reply; raises ConnectionError or TimeoutError.
+
+        ChannelNotSentError (a ConnectionError) means no byte of the frame was
+        written; any other failure leaves it unknown whether the Pi applied it.
+        """
+        sock = self.sock
+        if not self.connected or sock is None:
+            raise ChannelNotSentError('Pi command channel not connected')
+        request_id = next(self.ids)
+        future = Future()
+        with self.pending_lock:
+            self.pending[request_id] = future
+        started = time.perf_counter()
+        self.stats['commands'] += 1
+        frame = memoryview(encode_frame(dict(payload, id=request_id)))
+        sent = 0
+        try:
+            try:
+                with self.send_lock:
+                    while sent < len(frame):
+                        sent += sock.send(frame[sent:])
+            except OSError:
+                # Wake the reader too; it reconnects after closing
+                sock.close()
+                if not sent:
+                    raise ChannelNotSentError('Pi command channel send failed')
+                raise ConnectionError('Pi command channel send failed mid-frame')
+            result = future.result(timeout)
+        except FutureTimeoutError:
+            self.stats['command_failures'] += 1
+            raise TimeoutError(f"No reply from Pi command channel within {timeout}s")
+        except ConnectionError:
+            self.stats['command_failures'] += 1
+            raise
+        finally:
+            with self.pending_lock:
+                self.pending.pop(request_id, None)
+        self.stats['total_rtt_ms'] += (time.perf_counter() - started) * 1000
+        return result
+
+    def command(self, op, params=None, timeout=5.0):
+        return self.request({'type': 'command', 'op': op, 'params': params or {}}, timeout)
+
+    def batch(self, operations, timeout=5.0):
+        return self.request({'type': 'batch', 'operations': operations}, timeout)
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        completed = stats['commands'] - stats['command_failures']
+        stats['avg_rtt_ms'] = round(stats['total_rtt_ms'] / completed, 2) if completed else 0.0
+        stats['total_rtt_ms'] = round(stats['total_rtt_ms'], 2)
+        stats['connected'] = self.connected
+        stats['endpoint'] = f"{self.host}:{self.port}"
+        return stats
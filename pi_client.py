@@ -0,0 +1,828 @@
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from logging_utils import HotPathLogger
+from pi_channel import ChannelNotSentError
+
+logger = logging.getLogger(__name__)
+hot_log = HotPathLogger(logger)
+
+# (connect, read) timeouts in seconds per Pi endpoint; anything else uses the default
+PI_ENDPOINT_TIMEOUTS = {
+    '/api/health': (1.5, 2.0),
+    '/api/system/status': (1.5, 3.0),
+    '/api/sensors/read': (1.5, 5.0),
+    '/api/sensors/history': (1.5, 5.0),
+    '/api/emotions/list': (1.5, 3.0),
+    '/api/reboot': (1.5, 5.0),
+}
+PI_DEFAULT_TIMEOUT = (2.0, 5.0)
+
+# Responses meaning the Pi server itself is down or overloaded (the pooled server
+# answers 503 when its queue is full); any other status is the endpoint's answer
+PI_UNAVAILABLE_STATUSES = (502, 503, 504)
+
+# Batchable operations (see OPERATIONS in pi_control.py) -> single-call endpoint; used to
+# route calls over the command channel and when the Pi server predates /api/batch
+PI_OPERATIONS = {
+    'led_on': ('/api/led/on', 'POST'),
+    'led_off': ('/api/led/off', 'POST'),
+    'led_brightness': ('/api/led/brightness', 'POST'),
+    'led_emotion': ('/api/led/emotion', 'POST'),
+    'display_update': ('/api/display/update', 'POST'),
+    'display_clear': ('/api/display/clear', 'POST'),
+    'sensors_read': ('/api/sensors/read', 'GET'),
+    'sensors_history': ('/api/sensors/history', 'GET'),
+    'system_status': ('/api/system/status', 'GET'),
+}
+ENDPOINT_OPERATIONS = {route: op for op, route in PI_OPERATIONS.items()}
+
+# Seconds a mirrored Pi resource stays fresh; the Pi samples the DHT every 30 s
+PI_STATE_TTLS = {
+    'sensors': 30.0,
+    'system_status': 5.0,
+    'emotions': 3600.0,
+}
+BATCH_WINDOW = 0.02
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff.
+
+    budget caps the seconds one call may spend across all its attempts and
+    backoffs; retries only get the time that is left of it.
+    """
+
+    def __init__(self, max_retries=2, base_delay=0.2, max_delay=2.0, budget=6.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+
+    def delay(self, attempt):
+        """Backoff before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+
+class PiTransport:
+    """Pooled keep-alive HTTP transport to the Pi server.
+
+    One requests.Session reuses TCP connections across calls instead of opening
+    a new one per request. Failed calls are retried per the RetryPolicy: GETs on
+    timeouts, connection errors and 502/503/504 responses; POSTs only when the
+    connection could not be established, so a command is never applied twice.
+    """
+
+    def __init__(self, base_url, pool_size=4, retry_policy=None, timeouts=None):
+        self.base_url = base_url
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeouts = dict(PI_ENDPOINT_TIMEOUTS if timeouts is None else timeouts)
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json', 'Connection': 'keep-alive'})
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self.lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'attempts': 0,
+            'retries': 0,
+            'failures': 0,
+            'total_latency_ms': 0.0
+        }
+
+    def timeout_for(self, endpoint):
+        return self.timeouts.get(endpoint, PI_DEFAULT_TIMEOUT)
+
+    def _count(self, **deltas):
+        with self.lock:
+            for key, value in deltas.items():
+                self.stats[key] += value
+
+    def request(self, method, endpoint, data=None, timeout=None, retries=None, params=None):
+        """Send one request, retrying per policy; raises the last requests exception on failure"""
+        method = method.upper()
+        url = f"{self.base_url}{endpoint}"
+        timeout = timeout or self.timeout_for(endpoint)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        max_retries = self.retry_policy.max_retries if retries is None else retries
+        started = time.perf_counter()
+        deadline = started + self.retry_policy.budget
+        self._count(requests=1)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            self._count(attempts=1)
+            try:
+                response = self.session.request(method, url, json=data, params=params, timeout=timeout)
+                if response.status_code in PI_UNAVAILABLE_STATUSES and method == 'GET' and attempt <= max_retries:
+                    raise requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+                self._count(total_latency_ms=(time.perf_counter() - started) * 1000)
+                return response
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.HTTPError) as e:
+                # A read timeout on a POST may mean the Pi already applied it - don't resend
+                retryable = method == 'GET' or isinstance(e, requests.exceptions.ConnectionError)
+                backoff = self.retry_policy.delay(attempt)
+                remaining = deadline - time.perf_counter() - backoff
+                if not retryable or attempt > max_retries or remaining <= 0:
+                    self._count(failures=1, total_latency_ms=(time.perf_counter() - started) * 1000)
+                    raise
+                self._count(retries=1)
+                time.sleep(backoff)
+                timeout = (min(timeout[0], remaining), min(timeout[1], remaining))
+
+    def get_stats(self):
+        """Request counters plus connection reuse figures from the urllib3 pool"""
+        with self.lock:
+            stats = dict(self.stats)
+        stats['connections_opened'] = 0
+        stats['pool_requests'] = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                stats['connections_opened'] += pool.num_connections
+                stats['pool_requests'] += pool.num_requests
+        stats['connection_reuse_ratio'] = (
+            round(1 - stats['connections_opened'] / stats['pool_requests'], 3)
+            if stats['pool_requests'] else 0.0
+        )
+        stats['avg_latency_ms'] = (
+            round(stats['total_latency_ms'] / stats['requests'], 2) if stats['requests'] else 0.0
+        )
+        stats['total_latency_ms'] = round(stats['total_latency_ms'], 2)
+        return stats
+
+    def close(self):
+        self.session.close()
+
+
+class RequestBatcher:
+    """Coalesces operations submitted within a short window into one /api/batch call.
+
+    submit() returns a Future right away; the first operation in an empty queue
+    starts a timer and everything submitted before it fires goes out together.
+    """
+
+    def __init__(self, client, window=BATCH_WINDOW, max_batch=16):
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        self.lock = threading.Lock()
+        self.pending = []
+        self.timer = None
+
+    def submit(self, op, params=None):
+        future = Future()
+        batch = None
+        with self.lock:
+            self.pending.append(({'op': op, 'params': params or {}}, future))
+            if len(self.pending) >= self.max_batch:
+                batch = self._take()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.window, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+        if batch:
+            self._send(batch)
+        return future
+
+    def _take(self):
+        batch, self.pending = self.pending, []
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        return batch
+
+    def flush(self):
+        """Send whatever is queued now"""
+        with self.lock:
+            batch = self._take()
+        if batch:
+            self._send(batch)
+
+    def _send(self, batch):
+        try:
+            results = self.client.batch([op for op, _ in batch])
+        except Exception as e:
+            results = [{'status': 'error', 'message': f'Batch failed: {e}'} for _ in batch]
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker guarding calls to the Pi.
+
+    Closed: requests flow, and failure_threshold consecutive failures open it.
+    Open: requests are refused immediately. After reset_timeout the health
+    prober moves it to half-open and sends one probe; success closes the
+    breaker, failure re-opens it with the timeout doubled (up to max_reset_timeout).
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=3, reset_timeout=5.0, max_reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow_request(self):
+        """True if a normal request may go to the Pi right now"""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            self.rejected += 1
+            return False
+
+    def try_half_open(self):
+        """Move an open breaker to half-open once its timeout has passed; True if it did"""
+        with self.lock:
+            if self.state != self.OPEN or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            return True
+
+    def record_success(self):
+        """Returns True if this closed a breaker that was open or half-open"""
+        with self.lock:
+            changed = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            return changed
+
+    def record_failure(self):
+        """Returns True if this failure opened the breaker"""
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+                return False
+            if self.state == self.CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+                return True
+            return False
+
+    def trip(self):
+        """Open immediately, e.g. when an explicit connection check fails"""
+        with self.lock:
+            was_closed = self.state == self.CLOSED
+            self.failures = max(self.failures, self.failure_threshold)
+            self._open()
+            return was_closed
+
+    def _open(self):
+        if self.state == self.CLOSED:
+            self.times_opened += 1
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'times_opened': self.times_opened,
+                'rejected_requests': self.rejected,
+                'reset_timeout': self.reset_timeout,
+                'open_for_seconds': round(time.monotonic() - self.opened_at, 1)
+                    if self.state != self.CLOSED and self.opened_at else 0
+            }
+
+
+class PiStateMirror:
+    """Client-side copy of Pi read resources with per-resource TTLs.
+
+    Reads are answered from the mirror while an entry is fresh. Commands
+    invalidate the resources they change, so an LED command forces the next
+    status read to go to the Pi. Expired entries are kept so the last known
+    value can still be served, flagged as stale, while the Pi is unreachable.
+    """
+
+    def __init__(self, ttls=None):
+        self.ttls = dict(PI_STATE_TTLS if ttls is None else ttls)
+        self.lock = threading.Lock()
+        self.entries = {}  # resource -> (value, stored_at monotonic, stored_at wall clock, valid)
+        self.stats = {'hits': 0, 'misses': 0, 'stale_served': 0, 'invalidations': 0}
+
+    def put(self, resource, value):
+        with self.lock:
+            self.entries[resource] = (value, time.monotonic(), datetime.now().isoformat(), True)
+
+    def invalidate(self, *resources):
+        """Mark resources expired; the last value stays available as a stale fallback"""
+        with self.lock:
+            for resource in resources:
+                entry = self.entries.get(resource)
+                if entry is not None and entry[3]:
+                    self.entries[resource] = entry[:3] + (False,)
+                    self.stats['invalidations'] += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+
+    def _view(self, resource, entry, stale):
+        value, stored_at, stored_wall, _ = entry
+        view = dict(value)
+        view['cache'] = {
+            'source': 'mirror',
+            'stale': stale,
+            'age_seconds': round(time.monotonic() - stored_at, 2),
+            'fetched_at': stored_wall,
+            'ttl_seconds': self.ttls.get(resource)
+        }
+        return view
+
+    def get(self, resource):
+        """Fresh mirrored value with a 'cache' age flag, or None"""
+        with self.lock:
+            entry = self.entries.get(resource)
+            if entry is None or not entry[3] or time.monotonic() - entry[1] > self.ttls.get(resource, 0):
+                self.stats['misses'] += 1
+                return None
+            self.stats['hits'] += 1
+            return self._view(resource, entry, stale=False)
+
+    def get_stale(self, resource):
+        """Last known value regardless of age, flagged stale, or None"""
+        with self.lock:
+            entry = self.entries.get(resource)
+            if entry is None:
+                return None
+            self.stats['stale_served'] += 1
+            return self._view(resource, entry, stale=True)
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['resources'] = sorted(self.entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+class HealthProber:
+    """Background thread that owns reconnection to the Pi.
+
+    While the breaker is closed it probes /api/health every `interval` seconds
+    so an outage is noticed without a user request paying for it; while open it
+    sends the half-open probe as soon as the breaker allows one.
+    """
+
+    def __init__(self, client, interval=15.0, poll=0.5):
+        self.client = client
+        self.interval = interval
+        self.poll = poll
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.last_probe = 0.0
+
+    def start(self):
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=2.0)
+
+    def _run(self):
+        breaker = self.client.breaker
+        while not self.stop_event.wait(self.poll):
+            try:
+                if breaker.try_half_open():
+                    self.client.probe()
+                elif (breaker.state == CircuitBreaker.CLOSED and
+                      time.monotonic() - self.last_probe >= self.interval):
+                    self.client.probe()
+                else:
+                    continue
+                self.last_probe = time.monotonic()
+            except Exception as e:
+                logger.warning("⚠️ Pi health probe error: %s", e)
+
+
+# Enhanced Pi Server Client with robust error handling
+class PiServerClient:
+    def __init__(self, base_url, transport=None, breaker=None):
+        self.base_url = base_url
+        self.transport = transport or PiTransport(base_url)
+        self.breaker = breaker or CircuitBreaker()
+        self.prober = HealthProber(self)
+        self.connected = False
+        self.last_connection_check = None
+        self.connection_retries = 0
+        self.batch_supported = True
+        self.batcher = RequestBatcher(self)
+        self.connection_listeners = []
+        self.channel = None
+        self.pushed_state = {}
+        self.mirror = PiStateMirror()
+
+    def add_connection_listener(self, callback):
+        """Call callback(connected) whenever the connection state changes"""
+        self.connection_listeners.append(callback)
+
+    def _set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        logger.info("🔌 Pi Server %s (%s)", 'connected' if connected else 'unreachable - demo mode', self.base_url)
+        for callback in self.connection_listeners:
+            try:
+                callback(connected)
+            except Exception as e:
+                logger.warning("⚠️ Connection listener failed: %s", e)
+
+    def _record_success(self):
+        self.breaker.record_success()
+        self.connection_retries = 0
+        self._set_connected(True)
+
+    def _record_failure(self):
+        if self.breaker.record_failure():
+            # Only the prober half-opens the breaker, so make sure one is running
+            self.prober.start()
+        self.connection_retries = self.breaker.failures
+        if self.breaker.state != CircuitBreaker.CLOSED:
+            self._set_connected(False)
+
+    def attach_channel(self, channel):
+        """Send commands over a persistent PiChannel while it is connected (HTTP otherwise)"""
+        self.channel = channel
+        channel.add_event_listener(self._on_channel_event)
+
+    def _on_channel_event(self, event, data):
+        self.pushed_state[event] = {'data': data, 'received_at': datetime.now().isoformat()}
+        # Pushed updates keep the mirror current without polling
+        if event == 'sensors':
+            self.mirror.put('sensors', {'status': 'success', 'sensor_data': data})
+        elif event == 'hello':
+            self.mirror.put('system_status', {'status': 'success', 'system_status': data})
+        elif event in ('state', 'display', 'animation_done'):
+            self.mirror.invalidate('system_status')
+
+    def get_pushed_state(self):
+        """Latest state the Pi pushed over the channel, by event type"""
+        return dict(self.pushed_state)
+
+    def _call_over_channel(self, endpoint, method, data, timeout):
+        """Returns the reply, or None if the call should go over HTTP instead"""
+        op = ENDPOINT_OPERATIONS.get((endpoint, method))
+        if op is None and endpoint != "/api/batch":
+            return None
+        if isinstance(timeout, tuple):
+            timeout = timeout[1]
+        timeout = timeout or PI_DEFAULT_TIMEOUT[1]
+        try:
+            if op is None:
+                result = self.channel.batch((data or {}).get('operations'), timeout=timeout)
+            else:
+                result = self.channel.command(op, data, timeout=timeout)
+        except ChannelNotSentError:
+            return None
+        except ConnectionError:
+            # Lost after the frame went out: reads can be repeated over HTTP, but
+            # a command may already have been applied, so don't resend it
+            if method == "GET":
+                return None
+            self._record_failure()
+            return {'status': 'error', 'message': f"Pi channel lost during command ({endpoint})"}
+        except TimeoutError:
+            # The command may still have been applied, so don't resend it over HTTP
+            self._record_failure()
+            return {'status': 'error', 'message': f"Pi channel timeout ({endpoint})"}
+        self._record_success()
+        return result
+
+    def start_health_prober(self, interval=None):
+        """Start background health probing and reconnection"""
+        if interval is not None:
+            self.prober.interval = interval
+        self.prober.start()
+
+    def probe(self):
+        """One fast /api/health check; updates the breaker and returns True if the Pi answered"""
+        self.last_connection_check = datetime.now()
+        try:
+            response = self.transport.request("GET", "/api/health", retries=0)
+            response.json()
+            ok = response.status_code == 200
+        except (requests.exceptions.RequestException, ValueError):
+            ok = False
+        if ok:
+            self._record_success()
+        else:
+            self._record_failure()
+        return ok
+        
+    def check_connection(self, force_check=False):
+        """Check connection to Pi server with better error handling"""
+        try:
+            # Don't check too frequently (every 10 seconds max)
+            current_time = datetime.now()
+            if (not force_check and 
+                self.last_connection_check and 
+                (current_time - self.last_connection_check).total_seconds() < 10):
+                return self.connected
+            
+            logger.debug("🔌 Checking Pi Server connection: %s", self.base_url)
+            
+            # Try multiple endpoints in case health is not available
+            endpoints_to_try = [
+                "/api/health",
+                "/api/system/status", 
+                "/api/sensors/read"
+            ]
+            
+            for endpoint in endpoints_to_try:
+                try:
+                    # Single attempt per endpoint: the fallback list is the retry
+                    response = self.transport.request("GET", endpoint, retries=0)
+                    
+                    if response.status_code == 200:
+                        try:
+                            response.json()
+                            self._record_success()
+                            self.last_connection_check = current_time
+                            logger.info("✅ Pi Server connected successfully via %s", endpoint)
+                            return True
+                        except ValueError as e:
+                            logger.warning("⚠️ Invalid JSON from %s: %s", endpoint, e)
+                            continue
+                    logger.debug("📡 %s returned %s", endpoint, response.status_code)
+                        
+                except requests.exceptions.Timeout:
+                    logger.debug("⏰ Timeout on %s", endpoint)
+                    # Later endpoints would just time out too
+                    break
+                except requests.exceptions.ConnectionError:
+                    logger.debug("🔌 Connection refused on %s", endpoint)
+                    break
+                except Exception as e:
+                    logger.warning("⚠️ Endpoint %s failed: %s", endpoint, e)
+                    continue
+            
+            # If all endpoints failed, open the breaker; the prober takes over reconnecting
+            self.breaker.trip()
+            self.prober.start()
+            self.connection_retries = self.breaker.failures
+            self._set_connected(False)
+            self.last_connection_check = current_time
+            logger.warning("❌ Pi Server unreachable, failing fast until the health prober reconnects")
+            return False
+            
+        except Exception as e:
+            logger.error("❌ Pi Server connection check failed: %s", e)
+            self._set_connected(False)
+            self.last_connection_check = datetime.now()
+            return False
+    
+    def call_pi_api(self, endpoint, method="GET", data=None, timeout=None, params=None):
+        """Make API call to Pi server over the pooled transport, failing fast while the breaker is open.
+
+        params go in the query string (use them for GET filters); data is the JSON body.
+        """
+        if not self.breaker.allow_request():
+            return {
+                'status': 'error', 
+                'message': 'Pi server not connected',
+                'demo_mode': True,
+                'circuit': self.breaker.state
+            }
+        
+        if method.upper() not in ("GET", "POST"):
+            return {'status': 'error', 'message': f'Unsupported method: {method}'}
+        
+        if method.upper() == "POST":
+            # Invalidate up front: even a failed or timed-out command may have changed the Pi
+            if endpoint == "/api/reboot":
+                self.mirror.invalidate(*PI_STATE_TTLS)
+            else:
+                self.mirror.invalidate('system_status')
+        
+        if self.channel is not None and self.channel.connected:
+            result = self._call_over_channel(endpoint, method.upper(), data or params, timeout)
+            if result is not None:
+                return result
+            
+        try:
+            response = self.transport.request(method, endpoint, data=data, timeout=timeout, params=params)
+            hot_log.debug(endpoint, "📥 Pi API %s %s: %s", method.upper(), endpoint, response.status_code)
+            if response.status_code in PI_UNAVAILABLE_STATUSES:
+                self._record_failure()
+            else:
+                self._record_success()
+            
+            # Handle non-JSON responses
+            try:
+                response_data = response.json()
+            except ValueError:
+                response_data = {
+                    'status': 'error', 
+                    'message': 'Invalid JSON response', 
+                    'raw_response': response.text[:100]  # First 100 chars
+                }
+            
+            return response_data
+            
+        except requests.exceptions.Timeout:
+            error_msg = f"Pi API timeout ({endpoint})"
+            hot_log.error(f"{endpoint}:timeout", "❌ %s", error_msg)
+            self._record_failure()
+            return {'status': 'error', 'message': error_msg}
+        except requests.exceptions.ConnectionError:
+            error_msg = f"Pi server connection refused ({endpoint})"
+            hot_log.error(f"{endpoint}:refused", "❌ %s", error_msg)
+            self._record_failure()
+            return {'status': 'error', 'message': error_msg}
+        except Exception as e:
+            error_msg = f"Pi API call failed ({endpoint}): {str(e)}"
+            hot_log.error(f"{endpoint}:error", "❌ %s", error_msg)
+            return {'status': 'error', 'message': error_msg}
+
+    def batch(self, operations):
+        """Apply operations ({'op': name, 'params': {...}}) in one round trip.
+
+        Returns one result dict per operation, in order. Falls back to one call
+        per operation if the Pi server has no /api/batch endpoint.
+        """
+        if not operations:
+            return []
+        if self.batch_supported:
+            result = self.call_pi_api("/api/batch", "POST", {'operations': operations})
+            results = result.get('results')
+            if isinstance(results, list) and len(results) == len(operations):
+                return results
+            if 'raw_response' not in result:
+                # Not connected or transport error: every operation shares the outcome
+                return [dict(result, op=op.get('op')) for op in operations]
+            # Non-JSON reply means the endpoint is missing on this Pi server
+            logger.warning("⚠️ Pi server has no /api/batch, sending operations individually")
+            self.batch_supported = False
+
+        results = []
+        for op in operations:
+            endpoint, method = PI_OPERATIONS.get(op.get('op'), (None, None))
+            if endpoint is None:
+                results.append({'status': 'error', 'op': op.get('op'), 'message': 'Unknown operation'})
+                continue
+            results.append(dict(self.call_pi_api(endpoint, method, op.get('params') or None), op=op.get('op')))
+        return results
+
+    def submit(self, op, params=None):
+        """Queue an operation to be combined with others sent in the same window; returns a Future"""
+        return self.batcher.submit(op, params)
+
+    def get_transport_stats(self):
+        """Connection pool and retry statistics for monitoring"""
+        stats = self.transport.get_stats()
+        stats['connected'] = self.connected
+        stats['circuit_breaker'] = self.breaker.get_stats()
+        stats['channel'] = self.channel.get_stats() if self.channel else None
+        stats['mirror'] = self.mirror.get_stats()
+        stats['base_url'] = self.base_url
+        return stats
+    
+    # Pi control methods with demo fallback
+    def led_on(self, zone=None):
+        result = self.call_pi_api("/api/led/on", "POST", {"zone": zone} if zone else None)
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': 'LED ON (demo mode)', 'demo': True}
+        return result
+    
+    def led_off(self, zone=None):
+        result = self.call_pi_api("/api/led/off", "POST", {"zone": zone} if zone else None)
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': 'LED OFF (demo mode)', 'demo': True}
+        return result
+    
+    def set_brightness(self, brightness):
+        result = self.call_pi_api("/api/led/brightness", "POST", {"brightness": brightness})
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': f'Brightness set to {brightness}% (demo mode)', 'demo': True}
+        return result
+    
+    def set_emotion_lighting(self, emotion, zone=None, fade=None):
+        data = {"emotion": emotion}
+        if zone:
+            data["zone"] = zone
+        if fade is not None:
+            data["fade"] = fade
+        result = self.call_pi_api("/api/led/emotion", "POST", data)
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': f'Emotion lighting: {emotion} (demo mode)', 'demo': True}
+        return result
+    
+    def update_display(self, message):
+        result = self.call_pi_api("/api/display/update", "POST", {"message": message})
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': f'Display updated: {message} (demo mode)', 'demo': True}
+        return result
+    
+    def clear_display(self):
+        result = self.call_pi_api("/api/display/clear", "POST")
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': 'Display cleared (demo mode)', 'demo': True}
+        return result
+    
+    def _read_mirrored(self, resource, endpoint, fresh=False):
+        """Serve a read from the mirror, fetching from the Pi when expired (or fresh=True).
+
+        Returns None when the Pi cannot be reached and nothing was ever mirrored.
+        """
+        if not fresh:
+            cached = self.mirror.get(resource)
+            if cached is not None:
+                return cached
+        result = self.call_pi_api(endpoint, "GET")
+        if result.get('status') == 'success':
+            self.mirror.put(resource, result)
+            view = dict(result)
+            view['cache'] = {'source': 'pi', 'stale': False, 'age_seconds': 0.0,
+                             'fetched_at': datetime.now().isoformat(),
+                             'ttl_seconds': self.mirror.ttls.get(resource)}
+            return view
+        return self.mirror.get_stale(resource)
+
+    def read_sensors(self, fresh=False):
+        result = self._read_mirrored('sensors', "/api/sensors/read", fresh) or {}
+        if result.get('status') != 'success':
+            # Return demo sensor data
+            return {
+                'status': 'success',
+                'sensor_data': {
+                    'temperature_c': 24.5 + (np.random.random() - 0.5) * 2,
+                    'humidity': 50 + (np.random.random() - 0.5) * 10,
+                    'pressure': 1013 + (np.random.random() - 0.5) * 5,
+                    'demo_data': True
+                },
+                'demo': True
+            }
+        return result
+    
+    def get_sensor_history(self, window=None, limit=None):
+        """Sampled readings with min/max/mean from the Pi's ring buffer"""
+        params = {key: value for key, value in (('window', window), ('limit', limit)) if value is not None}
+        return self.call_pi_api("/api/sensors/history", "GET", params=params or None)
+
+    def get_system_status(self, fresh=False):
+        result = self._read_mirrored('system_status', "/api/system/status", fresh) or {}
+        if result.get('status') != 'success':
+            # Return demo system status
+            return {
+                'status': 'success',
+                'system_status': {
+                    'device': 'Raspberry Pi (Demo Mode)',
+                    'led_available': True,
+                    'oled_available': True,
+                    'dht_available': True,
+                    'led_state': False,
+                    'led_brightness_percent': 50,
+                    'last_sensor_read': datetime.now().isoformat(),
+                    'demo_mode': True
+                },
+                'demo': True
+            }
+        return result
+    
+    def get_emotions_list(self):
+        result = self._read_mirrored('emotions', "/api/emotions/list") or {}
+        if result.get('status') != 'success':
+            return {
+                'status': 'success',
+                'emotions': ['joy', 'sadness', 'anger', 'fear', 'surprise', 'neutral', 'calm', 'energy', 'focus'],
+                'demo': True
+            }
+        return result
+    
+    def reboot_pi(self):
+        result = self.call_pi_api("/api/reboot", "POST")
+        if result.get('status') != 'success':
+            return {'status': 'success', 'message': 'Reboot command sent (demo mode)', 'demo': True}
+        return result
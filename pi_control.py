@@ -7,15 +7,52 @@ OLED Layout (EXACTLY like test version):
 - Header: Time (left) | Temp|Humidity (right) - font_header (10px)
 - Center: Main messages with circular scrolling - font_mid (15px bold)
 - Footer: Status notifications - font_footer (9px)
+
+Copy pi_protocol.py (command channel framing) and logging_utils.py to the Pi
+alongside this file.
 """
 
+import io
 import os
+import json
+import logging
+import queue
+import socket
+import struct
 import time
 import threading
 import random
+import select
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from flask_cors import CORS  # Add CORS support
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+from werkzeug.test import run_wsgi_app
+
+from logging_utils import HotPathLogger, parse_module_levels, setup_logging
+from pi_protocol import encode_frame, recv_frame
+
+# ---------------------------
+# Logging
+# ---------------------------
+# Records go through logging_utils' bounded queue drained by a listener thread,
+# so console I/O never stalls the animation, OLED or request threads.
+# PI_LOG_LEVEL sets the level and PI_LOG_LEVELS per-module levels (e.g.
+# "werkzeug=INFO" to see access lines); PI_HOT_LOGGING=0 silences
+# per-frame/per-command lines entirely.
+LOG_LEVEL = os.environ.get('PI_LOG_LEVEL', 'INFO').upper()
+HOT_LOGGING = os.environ.get('PI_HOT_LOGGING', '1') == '1'
+HOT_LOG_INTERVAL = float(os.environ.get('PI_HOT_LOG_INTERVAL', '5'))
+
+# One access line per request is too much on the Pi; explicit module levels win
+_module_levels = {'werkzeug': 'WARNING'}
+_module_levels.update(parse_module_levels(os.environ.get('PI_LOG_LEVELS', '')))
+setup_logging(LOG_LEVEL, module_levels=_module_levels, hot_path=HOT_LOGGING, hot_path_interval=HOT_LOG_INTERVAL)
+
+logger = logging.getLogger('pi_control')
+hot_log = HotPathLogger(logger)
 
 # ---------------------------
 # Hardware config (user)
@@ -41,15 +78,28 @@ try:
 except Exception as e:
     print(f"⚠️ rpi_ws281x not available: {e} — running in DEMO LED mode")
 
+    def Color(red, green, blue, white=0):
+        """Same 0xWWRRGGBB packing as rpi_ws281x.Color (used with the virtual strip)."""
+        return (white << 24) | (red << 16) | (green << 8) | blue
+
 try:
     from luma.core.interface.serial import i2c
     from luma.oled.device import sh1106, ssd1306
     from luma.core.render import canvas
-    from PIL import ImageFont, ImageDraw
+    from PIL import Image, ImageFont, ImageDraw
     OLED_AVAILABLE = True
 except Exception as e:
     print(f"⚠️ OLED (luma) not available: {e} — running in DEMO OLED mode")
 
+# Without the hardware libraries, LEDs and OLED render into virtual in-memory
+# backends (previewed at /api/virtual/*); PI_VIRTUAL_HW=0 falls back to log lines
+VIRTUAL_HW = os.environ.get('PI_VIRTUAL_HW', '1') == '1'
+try:
+    from PIL import Image, ImageFont, ImageDraw
+    PIL_AVAILABLE = True
+except Exception:
+    PIL_AVAILABLE = False
+
 try:
     import board
     import adafruit_dht
@@ -84,6 +134,20 @@ def wheel(pos):
     pos -= 170
     return (0, pos * 3, 255 - pos * 3)
 
+def scale_color(color, factor):
+    """Scale an RGB color's intensity by factor (0.0-1.0)."""
+    return (int(color[0] * factor), int(color[1] * factor), int(color[2] * factor))
+
+def blend_frames(frame1, frame2, factor, size):
+    """Interpolate two effect frames (one RGB tuple or a list per pixel) for a zone of `size` pixels."""
+    single1 = isinstance(frame1[0], int)
+    single2 = isinstance(frame2[0], int)
+    if single1 and single2:
+        return interpolate_color(frame1, frame2, factor)
+    pixels1 = [frame1] * size if single1 else frame1
+    pixels2 = [frame2] * size if single2 else frame2
+    return [interpolate_color(a, b, factor) for a, b in zip(pixels1, pixels2)]
+
 def interpolate_color(color1, color2, factor):
     """Interpolate between two RGB colors."""
     return (
@@ -92,6 +156,267 @@ def interpolate_color(color1, color2, factor):
         int(color1[2] + (color2[2] - color1[2]) * factor)
     )
 
+# ---------------------------
+# LED render loop timing & lookup tables
+# ---------------------------
+LED_FPS = int(os.environ.get('PI_LED_FPS', '50'))
+LUT_SIZE = 256
+
+# One period of a 0 -> 1 -> 0 triangle wave, the envelope for pulse and breathing
+TRIANGLE_LUT = tuple(1.0 - abs(2.0 * i / LUT_SIZE - 1.0) for i in range(LUT_SIZE))
+RAINBOW_LUT = tuple(wheel(i) for i in range(256))
+
+# Periods (seconds) matching the original step/sleep loops
+PULSE_PERIOD = 1.26      # 42 steps x 30 ms
+BREATHING_PERIOD = 5.1   # 102 steps x 50 ms
+RAINBOW_PERIOD = 6.4     # 256 positions at 2 per 50 ms
+
+# Default crossfade between effects (seconds); rapid switches retarget a fade in
+# progress, keeping at most MAX_FADE_DEPTH effects blending at once
+CROSSFADE_SECONDS = float(os.environ.get('PI_LED_CROSSFADE', '0.5'))
+MAX_FADE_DEPTH = 3
+
+# UDP pixel stream: b'NX' + uint16 sequence + one RGB byte triple per pixel of the default zone
+STREAM_ENABLED = os.environ.get('PI_STREAM', '1') == '1'
+STREAM_PORT = int(os.environ.get('PI_STREAM_PORT', '5003'))
+STREAM_TIMEOUT = float(os.environ.get('PI_STREAM_TIMEOUT', '2.0'))  # seconds without frames ends the stream
+STREAM_MAGIC = b'NX'
+STREAM_HEADER = struct.Struct('>2sH')
+
+def _rainbow_frames(count):
+    """Every frame of the rainbow party for `count` pixels, one per wheel position."""
+    offsets = [i * 256 // count for i in range(count)]
+    return [[RAINBOW_LUT[(offset + pos) & 255] for offset in offsets] for pos in range(256)]
+
+# ---------------------------
+# LED layout: strips and zones
+# ---------------------------
+# PI_LED_LAYOUT holds JSON (or a path to a .json file) describing the strips and
+# named zones, each zone an index range on one strip running its own effect.
+# Later zones draw over earlier ones where they overlap. For example:
+#   {"strips": [{"pin": 18, "count": 60}, {"pin": 13, "count": 30, "channel": 1}],
+#    "zones": {"backlight": {"strip": 0}, "ambient": {"strip": 1, "start": 0, "end": 30}}}
+# Without it there is one strip of LED_COUNT pixels and a single 'main' zone.
+DEFAULT_LED_LAYOUT = {
+    'strips': [{'pin': LED_PIN, 'count': LED_COUNT, 'channel': LED_CHANNEL, 'dma': LED_DMA}],
+    'zones': {'main': {'strip': 0, 'start': 0, 'end': LED_COUNT}}
+}
+
+def load_led_layout(spec):
+    """Parse and validate a layout spec; falls back to DEFAULT_LED_LAYOUT if it is invalid."""
+    if not spec:
+        return DEFAULT_LED_LAYOUT
+    try:
+        if spec.strip().endswith('.json'):
+            with open(spec.strip()) as f:
+                layout = json.load(f)
+        else:
+            layout = json.loads(spec)
+        strips = [{
+            'pin': int(cfg.get('pin', LED_PIN)),
+            'count': int(cfg['count']),
+            'channel': int(cfg.get('channel', LED_CHANNEL)),
+            'dma': int(cfg.get('dma', LED_DMA))
+        } for cfg in layout['strips']]
+        zones = {}
+        for name, cfg in (layout.get('zones') or {'main': {'strip': 0}}).items():
+            strip = int(cfg.get('strip', 0))
+            start = int(cfg.get('start', 0))
+            end = int(cfg.get('end', strips[strip]['count']))
+            if not 0 <= start < end <= strips[strip]['count']:
+                raise ValueError(f"zone {name} range {start}-{end} is outside strip {strip}")
+            zones[name] = {'strip': strip, 'start': start, 'end': end}
+        if not strips or not zones:
+            raise ValueError('layout needs at least one strip and one zone')
+        return {'strips': strips, 'zones': zones}
+    except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+        logger.warning("⚠️ Invalid PI_LED_LAYOUT (%s) — using a single %s-pixel strip", e, LED_COUNT)
+        return DEFAULT_LED_LAYOUT
+
+def _fade_depth(effect):
+    """Number of effects blending in a chain of crossfades"""
+    depth = 1
+    while effect[3] is not None:
+        effect = effect[3][0]
+        depth += 1
+    return depth
+
+class LedZone:
+    """Named pixel range [start, end) on one strip, running its own effect"""
+
+    def __init__(self, name, strip, start, end):
+        self.name = name
+        self.strip = strip
+        self.start = start
+        self.end = end
+        self.size = end - start
+        self.effect = None  # (name, render, started, fade); fade = (outgoing effect, seconds) or None
+
+# ---------------------------
+# Sensor sampling
+# ---------------------------
+# Only the sampler thread touches the DHT22; requests read its ring buffer
+SENSOR_INTERVAL = float(os.environ.get('PI_SENSOR_INTERVAL', '30'))
+SENSOR_HISTORY_SIZE = int(os.environ.get('PI_SENSOR_HISTORY', '2880'))  # 24 h at 30 s
+
+# ---------------------------
+# SH1106 dirty-page display backend
+# ---------------------------
+OLED_WIDTH = 128
+OLED_HEIGHT = 64
+OLED_PAGES = OLED_HEIGHT // 8
+OLED_SCROLL_FPS = float(os.environ.get('PI_OLED_SCROLL_FPS', '25'))
+
+class PagedOledBackend:
+    """Sends only the changed part of each frame to an SH1106.
+
+    The controller's RAM is 8 pages of 128 column bytes (bit 0 = top row of
+    the page). Each frame is converted to that layout, compared with the last
+    frame sent, and for every page that changed only the span from the first
+    to the last differing column is written. A clock tick or a footer change
+    then costs one short page write instead of the full 1 KB frame.
+    """
+
+    COLUMN_OFFSET = 2  # SH1106 RAM is 132 columns wide; the panel shows 2..129
+
+    def __init__(self, device):
+        self.device = device
+        self.last_pages = None
+        self.stats = {'frames': 0, 'skipped_frames': 0, 'page_writes': 0, 'bytes_sent': 0}
+
+    def invalidate(self):
+        """Force the next frame to be sent in full"""
+        self.last_pages = None
+
+    @staticmethod
+    def to_pages(image):
+        # Rotating clockwise turns each display column into a row of 8 bytes,
+        # one per page in reverse order, with the page's top pixel as bit 0
+        data = image.convert('1').transpose(Image.ROTATE_270).tobytes()
+        return [data[OLED_PAGES - 1 - page::OLED_PAGES] for page in range(OLED_PAGES)]
+
+    def display(self, image):
+        pages = self.to_pages(image)
+        last = self.last_pages
+        self.stats['frames'] += 1
+        if last == pages:
+            self.stats['skipped_frames'] += 1
+            return
+        for page, data in enumerate(pages):
+            if last is None:
+                start, end = 0, OLED_WIDTH
+            else:
+                previous = last[page]
+                if data == previous:
+                    continue
+                start = 0
+                while data[start] == previous[start]:
+                    start += 1
+                end = OLED_WIDTH
+                while data[end - 1] == previous[end - 1]:
+                    end -= 1
+            column = start + self.COLUMN_OFFSET
+            self.device.command(0xB0 | page, column & 0x0F, 0x10 | (column >> 4))
+            self.device.data(list(data[start:end]))
+            self.stats['page_writes'] += 1
+            self.stats['bytes_sent'] += end - start
+        self.last_pages = pages
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        sent = stats['frames'] - stats['skipped_frames']
+        stats['avg_bytes_per_frame'] = round(stats['bytes_sent'] / sent, 1) if sent else 0.0
+        return stats
+
+# ---------------------------
+# Virtual hardware (demo mode)
+# ---------------------------
+class VirtualPixelStrip:
+    """In-memory stand-in for rpi_ws281x.PixelStrip.
+
+    setPixelColor writes a working buffer that show() copies to the visible
+    frame, like the real strip, so previews show exactly what was pushed.
+    """
+
+    def __init__(self, num, pin=None, freq_hz=None, dma=None, invert=False, brightness=255, channel=0):
+        self.count = num
+        self.brightness = brightness
+        self.buffer = [0] * num
+        self.frame = [0] * num
+        self.show_count = 0
+        self.last_show = None
+        self.lock = threading.Lock()
+
+    def begin(self):
+        pass
+
+    def numPixels(self):
+        return self.count
+
+    def setPixelColor(self, n, color):
+        self.buffer[n] = color
+
+    def setBrightness(self, brightness):
+        self.brightness = brightness
+
+    def show(self):
+        with self.lock:
+            self.frame = list(self.buffer)
+            self.show_count += 1
+            self.last_show = time.time()
+
+    def get_frame(self):
+        """Shown pixels as (r, g, b), before brightness scaling"""
+        with self.lock:
+            frame = list(self.frame)
+        return [((c >> 16) & 255, (c >> 8) & 255, c & 255) for c in frame]
+
+
+class VirtualOledDevice:
+    """SH1106 stand-in for PagedOledBackend.
+
+    Interprets the page/column address commands and data writes into the
+    controller's 132-column x 8-page RAM, which to_image() turns back into
+    the 128x64 picture the panel would show.
+    """
+
+    width = OLED_WIDTH
+    height = OLED_HEIGHT
+
+    def __init__(self):
+        self.ram = [bytearray(OLED_WIDTH + 2 * PagedOledBackend.COLUMN_OFFSET) for _ in range(OLED_PAGES)]
+        self.page = 0
+        self.column = 0
+        self.lock = threading.Lock()
+        self.stats = {'commands': 0, 'data_writes': 0, 'data_bytes': 0}
+
+    def command(self, *commands):
+        for cmd in commands:
+            if 0xB0 <= cmd <= 0xB7:
+                self.page = cmd & 0x07
+            elif cmd <= 0x0F:
+                self.column = (self.column & 0xF0) | cmd
+            elif cmd <= 0x1F:
+                self.column = (self.column & 0x0F) | ((cmd & 0x0F) << 4)
+        self.stats['commands'] += 1
+
+    def data(self, values):
+        with self.lock:
+            row = self.ram[self.page]
+            end = min(self.column + len(values), len(row))
+            row[self.column:end] = bytes(values[:end - self.column])
+            self.column = end
+        self.stats['data_writes'] += 1
+        self.stats['data_bytes'] += len(values)
+
+    def to_image(self):
+        # Inverse of PagedOledBackend.to_pages
+        offset = PagedOledBackend.COLUMN_OFFSET
+        with self.lock:
+            data = bytes(self.ram[OLED_PAGES - 1 - page][x + offset]
+                         for x in range(OLED_WIDTH) for page in range(OLED_PAGES))
+        return Image.frombytes('1', (OLED_HEIGHT, OLED_WIDTH), data).transpose(Image.ROTATE_90)
+
 # ---------------------------
 # Enhanced Pi Hardware Controller
 # ---------------------------
@@ -100,6 +425,8 @@ class EnhancedPiHardwareController:
         # hardware objects
         self.strip = None
         self.device = None  # Fixed: changed from self.oled to self.device
+        self.oled_backend = None
+        self.oled_frame = None
         self.dht = None
 
         # state
@@ -109,10 +436,37 @@ class EnhancedPiHardwareController:
         self.current_message = "Hello! Smart Desk Buddy is Active"
         self.last_sensor_read = None
         self.sensor_data = {'temperature_c': 24, 'humidity': 52}  # Default demo values
-
-        # animation control
-        self.anim_thread = None
-        self.anim_stop = threading.Event()
+        self.sensor_history = deque(maxlen=SENSOR_HISTORY_SIZE)  # (epoch seconds, reading)
+        self.sensor_lock = threading.Lock()
+        self.sensor_errors = 0
+        self.last_sensor_error = None
+
+        # LED strips and zones, one frame buffer per strip (composited) plus the
+        # frame last shown on it, and cached lookup tables for the render loop
+        self.led_layout = load_led_layout(os.environ.get('PI_LED_LAYOUT'))
+        self.strips = [None] * len(self.led_layout['strips'])
+        self.frame_buffers = [[(0, 0, 0)] * cfg['count'] for cfg in self.led_layout['strips']]
+        self.shown_frames = [list(buffer) for buffer in self.frame_buffers]
+        self.zones = {name: LedZone(name, **zone) for name, zone in self.led_layout['zones'].items()}
+        self.default_zone = next(iter(self.zones.values()))
+        self.effect_lock = threading.Lock()
+        self.effect_changed = threading.Event()
+        self.effect_tables = {}
+        self.brightness_dirty = False
+        self.frames_pushed = 0
+        self.led_running = True
+        self.led_thread = None
+
+        # Last complete frame received from the pixel stream (see PixelStreamServer)
+        self.stream_frame = None
+        self.stream_frame_at = 0.0
+        self.stream_frames = 0
+
+        # serializes hardware commands so a batch is applied without interleaving
+        self.command_lock = threading.RLock()
+
+        # callbacks(event, data) for pushed state changes (the command channel subscribes)
+        self.event_listeners = []
 
         # OLED state (EXACTLY like test version)
         self.scroll_x = 0
@@ -121,6 +475,15 @@ class EnhancedPiHardwareController:
         self.bottom_status = "System ready"
         self.bottom_status_expire = 0
 
+        # OLED renderer wakes on this; set whenever something on screen changes
+        self.oled_dirty = threading.Event()
+        self.oled_scrolling = False
+        self.oled_frames_drawn = 0
+
+        # (font, text) -> pixel width, and the pre-rendered scrolling message
+        self.text_widths = {}
+        self.marquee = None  # (text, period, 1-bit bitmap)
+
         # emotion color palette (no emojis)
         self.emotion_colors = {
             'joy': (255, 255, 0),       # Bright yellow
@@ -159,298 +522,417 @@ class EnhancedPiHardwareController:
         self._enhanced_startup_sequence()
 
         # start background tasks
+        self._start_led_renderer()
         self._start_oled_updater()
         self._start_sensor_monitoring()
 
-        print("✅ Enhanced PiHardwareController initialized")
+        logger.info("✅ Enhanced PiHardwareController initialized")
+
+    # ---------- State Change Events ----------
+    def add_event_listener(self, callback):
+        self.event_listeners.append(callback)
+
+    def _emit(self, event, data):
+        for callback in list(self.event_listeners):
+            try:
+                callback(event, data)
+            except Exception as e:
+                hot_log.warning(f"listener:{event}", "⚠️ Event listener error (%s): %s", event, e)
+
+    # ---------- LED Render Loop ----------
+    # Each zone runs an effect: a function of (elapsed seconds, zone size)
+    # returning (frame, finished), where a frame is one RGB tuple for the whole
+    # zone or a list with one per pixel. A single thread renders every zone into
+    # its strip's frame buffer at LED_FPS, then pushes each strip that changed
+    # with one show(). Requests just swap effects.
+    def _start_led_renderer(self):
+        self.led_thread = threading.Thread(target=self._led_loop, daemon=True)
+        self.led_thread.start()
+
+    def shutdown_leds(self, timeout=1.0):
+        """Stop the render loop and blank the strips (server shutdown)"""
+        self.led_running = False
+        self.effect_changed.set()
+        if self.led_thread:
+            self.led_thread.join(timeout)
+        for buffer in self.frame_buffers:
+            buffer[:] = [(0, 0, 0)] * len(buffer)
+        self._show_strips()
+
+    def _zones_for(self, zone):
+        return [self.zones[zone]] if zone else list(self.zones.values())
+
+    def _set_effect(self, render, name=None, zone=None, fade=None):
+        """Run render on one zone, or on every zone when zone is None.
+
+        The zone crossfades from what it was showing over `fade` seconds
+        (CROSSFADE_SECONDS by default, 0 to cut). An animated outgoing effect
+        keeps running while it fades out; switching again mid-fade retargets
+        the blend instead of restarting it.
+        """
+        fade = CROSSFADE_SECONDS if fade is None else fade
+        started = time.monotonic()
+        with self.effect_lock:
+            for target in self._zones_for(zone):
+                previous = target.effect
+                if fade <= 0:
+                    target.effect = (name, render, started, None)
+                    continue
+                if previous is None or _fade_depth(previous) >= MAX_FADE_DEPTH:
+                    # Static or deeply nested: fade out from a snapshot of the zone
+                    snapshot = self.frame_buffers[target.strip][target.start:target.end]
+                    previous = (None, self._fx_frame(snapshot), started, None)
+                target.effect = (name, render, started, (previous, fade))
+        self.effect_changed.set()
+
+    def _render_effect(self, effect, now, size):
+        """(frame, finished) of an effect, blended with its outgoing effect while fading"""
+        name, render, started, fade = effect
+        frame, finished = render(now - started, size)
+        if fade is None:
+            return frame, finished
+        previous, duration = fade
+        progress = (now - started) / duration
+        if progress >= 1.0:
+            return frame, finished
+        outgoing, _ = self._render_effect(previous, now, size)
+        return blend_frames(outgoing, frame, progress, size), False
+
+    def _led_loop(self):
+        interval = 1.0 / LED_FPS
+        deadline = time.monotonic()
+        while self.led_running:
+            self.effect_changed.clear()
+            if not self._render_zones():
+                # Nothing animating: push any pending brightness change, then sleep
+                self._show_strips()
+                self.effect_changed.wait()
+                deadline = time.monotonic()
+                continue
+
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                # Fell behind; drop the missed frames rather than bursting
+                deadline = time.monotonic()
+                delay = 0
+            self.effect_changed.wait(delay)
+
+    def _render_zones(self):
+        """Composite one frame of every zone and show it; returns True while any zone animates"""
+        now = time.monotonic()
+        animating = False
+        finished_zones = []
+        with self.effect_lock:
+            effects = []
+            for zone in self.zones.values():
+                effect = zone.effect
+                if effect is None:
+                    continue
+                if effect[3] is not None and now - effect[2] >= effect[3][1]:
+                    # Fade complete: drop the outgoing effect
+                    effect = zone.effect = effect[:3] + (None,)
+                effects.append((zone, effect))
+        for zone, effect in effects:
+            name = effect[0]
+            try:
+                frame, finished = self._render_effect(effect, now, zone.size)
+            except Exception as e:
+                hot_log.warning("led_render", "⚠️ LED render error (%s): %s", zone.name, e)
+                frame, finished, name = None, True, None
+            if frame is not None:
+                if isinstance(frame[0], int):
+                    pixels = [frame] * zone.size
+                else:
+                    pixels = list(frame[:zone.size])
+                    pixels.extend([(0, 0, 0)] * (zone.size - len(pixels)))
+                self.frame_buffers[zone.strip][zone.start:zone.end] = pixels
+            if finished:
+                finished_zones.append((zone, effect, name))
+            else:
+                animating = True
+        self._show_strips()
+
+        for zone, effect, name in finished_zones:
+            with self.effect_lock:
+                current = zone.effect is effect
+                if current:
+                    zone.effect = None
+            # Only finite animations finish; superseded ones don't report
+            if current and name:
+                self._emit('animation_done', {'animation': name, 'zone': zone.name})
+        return animating
+
+    def _show_strips(self):
+        brightness_dirty = self.brightness_dirty
+        self.brightness_dirty = False
+        for index, buffer in enumerate(self.frame_buffers):
+            shown = self.shown_frames[index]
+            if buffer == shown and not brightness_dirty:
+                continue
+            strip = self.strips[index]
+            if strip is None:
+                hot_log.debug("demo_color", "[DEMO] strip %s -> %s", index, buffer[0])
+                shown[:] = buffer
+                continue
+            try:
+                if brightness_dirty:
+                    strip.setBrightness(map_percent_to_255(self.led_brightness_percent))
+                for i, rgb in enumerate(buffer):
+                    if rgb != shown[i]:
+                        strip.setPixelColor(i, Color(rgb[0], rgb[1], rgb[2]))
+                strip.show()
+                shown[:] = buffer
+                self.frames_pushed += 1
+            except Exception as e:
+                hot_log.warning("led_color", "⚠️ LED show error (strip %s): %s", index, e)
+
+    def _lut(self, key, build):
+        table = self.effect_tables.get(key)
+        if table is None:
+            table = self.effect_tables[key] = build()
+        return table
+
+    def _zone_color(self, zone):
+        """Color currently shown at the start of a zone"""
+        return self.frame_buffers[zone.strip][zone.start]
 
     # ---------- Enhanced LED Control ----------
     def _init_led(self):
         if not LED_AVAILABLE:
-            print("LED: DEMO mode (no rpi_ws281x).")
+            if VIRTUAL_HW:
+                self.strips = [VirtualPixelStrip(cfg['count'], brightness=LED_BRIGHTNESS)
+                               for cfg in self.led_layout['strips']]
+                self.strip = self.strips[0]
+                logger.info("LED: virtual strip (no rpi_ws281x).")
+                return
+            logger.info("LED: DEMO mode (no rpi_ws281x).")
             return
-        try:
-            self.strip = PixelStrip(LED_COUNT, LED_PIN, LED_FREQ_HZ, LED_DMA, LED_INVERT,
-                                    LED_BRIGHTNESS, LED_CHANNEL)
-            self.strip.begin()
-            print("✅ LED strip initialized.")
-        except Exception as e:
-            print(f"⚠️ LED init failed: {e}")
-            self.strip = None
-
-    def _apply_brightness_hardware(self):
-        if not self.strip:
-            return
-        try:
-            val = map_percent_to_255(self.led_brightness_percent)
-            self.strip.setBrightness(val)
-            self.strip.show()
-        except Exception as e:
-            print("⚠️ setBrightness error:", e)
+        for index, cfg in enumerate(self.led_layout['strips']):
+            try:
+                strip = PixelStrip(cfg['count'], cfg['pin'], LED_FREQ_HZ, cfg['dma'], LED_INVERT,
+                                   LED_BRIGHTNESS, cfg['channel'])
+                strip.begin()
+                self.strips[index] = strip
+                logger.info("✅ LED strip %s initialized (%s pixels on GPIO %s).", index, cfg['count'], cfg['pin'])
+            except Exception as e:
+                logger.warning("⚠️ LED init failed for strip %s: %s", index, e)
+        self.strip = self.strips[0]
 
     def _set_brightness(self, percent):
         self.led_brightness_percent = int(max(0, min(100, int(percent))))
-        if self.strip:
-            self._apply_brightness_hardware()
-        else:
-            print(f"[DEMO] brightness set -> {self.led_brightness_percent}%")
-
-    def _set_strip_color_all(self, rgb):
-        rgb = clamp_rgb(rgb)
+        # Applied by the render loop together with the next show()
+        self.brightness_dirty = True
+        self.effect_changed.set()
         if not self.strip:
-            print(f"[DEMO] set color all -> {rgb}")
-            self.led_on_state = True
-            return True
-        try:
-            for i in range(LED_COUNT):
-                self.strip.setPixelColor(i, Color(rgb[0], rgb[1], rgb[2]))
-            self.strip.show()
-            self.led_on_state = True
-            return True
-        except Exception as e:
-            print("⚠️ set color all error:", e)
-            return False
+            hot_log.debug("demo_brightness", "[DEMO] brightness set -> %s%%", self.led_brightness_percent)
 
-    def led_on(self):
-        return self._set_strip_color_all(self.current_color)
+    def _set_strip_color_all(self, rgb, zone=None):
+        self._set_effect(self._fx_solid(rgb), zone=zone)
+        self.led_on_state = True
+        return True
 
-    def led_off(self):
-        if not self.strip:
-            print("[DEMO] LEDs off")
-            self.led_on_state = False
-            return True
-        try:
-            for i in range(LED_COUNT):
-                self.strip.setPixelColor(i, Color(0, 0, 0))
-            self.strip.show()
+    def led_on(self, zone=None):
+        return self._set_strip_color_all(self.current_color, zone)
+
+    def led_off(self, zone=None):
+        self._set_effect(self._fx_solid((0, 0, 0)), zone=zone)
+        if zone is None:
             self.led_on_state = False
-            self._stop_animation()
-            return True
-        except Exception as e:
-            print("⚠️ led_off error:", e)
-            return False
+        return True
+
+    def get_zones(self):
+        with self.effect_lock:
+            return {
+                name: {
+                    'strip': zone.strip,
+                    'start': zone.start,
+                    'end': zone.end,
+                    'effect': zone.effect[0] if zone.effect else None,
+                    'color': self._zone_color(zone)
+                }
+                for name, zone in self.zones.items()
+            }
 
     # ---------- Enhanced Animations ----------
-    def _stop_animation(self):
-        if self.anim_thread and self.anim_thread.is_alive():
-            self.anim_stop.set()
-            self.anim_thread.join(timeout=1.0)
-        self.anim_stop.clear()
-        self.anim_thread = None
-
-    def _start_animation(self, target_fn, *args, **kwargs):
-        self._stop_animation()
-        self.anim_stop.clear()
-        self.anim_thread = threading.Thread(target=target_fn, args=args, kwargs=kwargs, daemon=True)
-        self.anim_thread.start()
-
-    def set_emotion_lighting(self, emotion):
+    def set_emotion_lighting(self, emotion, zone=None, fade=None):
+        """Switch a zone (or all zones) to an emotion's effect, crossfading over `fade` seconds."""
         e = str(emotion).lower() if emotion else "neutral"
+        self.led_on_state = True
 
         # Special animations
         if e == 'focus':
             self.current_color = self.emotion_colors['focus']
-            self._start_animation(self._anim_focus_alternate)
+            self._set_effect(self._fx_cycle([self.emotion_colors['focus'], (200, 200, 255)], 0.8),
+                             'focus_alternate', zone, fade)
             return True
         elif e == 'party':
-            self._start_animation(self._anim_rainbow_party)
+            self._set_effect(self._fx_rainbow(), 'rainbow_party', zone, fade)
             return True
         elif e == 'surprise':
-            self._start_animation(self._anim_surprise_flash)
+            # The flashes should hit at once, so cut in unless a fade is asked for
+            self._set_effect(self._fx_surprise_flash(), 'surprise_flash', zone, fade or 0)
             return True
         elif e == 'energy':
-            self._start_animation(self._anim_energy_pulse)
+            base = self.emotion_colors['energy']
+            table = self._lut(('pulse', base), lambda: [scale_color(base, f) for f in TRIANGLE_LUT])
+            self._set_effect(self._fx_table(table, PULSE_PERIOD), 'energy_pulse', zone, fade)
             return True
         elif e == 'calm':
-            self._start_animation(self._anim_calm_breathing)
+            base = self.emotion_colors['calm']
+            table = self._lut(('breathing', base),
+                              lambda: [scale_color(base, 0.3 + 0.7 * f) for f in TRIANGLE_LUT])
+            self._set_effect(self._fx_table(table, BREATHING_PERIOD), 'calm_breathing', zone, fade)
             return True
 
-        # Static colors with smooth transition
+        # Static colors with smooth transition (1 s by default) from whatever each zone shows now
         color = self.emotion_colors.get(e, (255, 255, 255))
-        self._stop_animation()
         self.current_color = color
-        self._start_animation(self._anim_smooth_transition, color)
+        self._set_effect(self._fx_solid(color), 'smooth_transition', zone, 1.0 if fade is None else fade)
         return True
 
-    def _anim_smooth_transition(self, target_color, duration=1.0):
-        """Smoothly transition from current color to target color."""
-        start_color = self.current_color
-        steps = 30
-        try:
-            for i in range(steps):
-                if self.anim_stop.is_set():
-                    break
-                factor = i / steps
-                current = interpolate_color(start_color, target_color, factor)
-                self._set_strip_color_all(current)
-                time.sleep(duration / steps)
-            if not self.anim_stop.is_set():
-                self._set_strip_color_all(target_color)
-        except Exception as e:
-            print("Smooth transition error:", e)
-
-    def _anim_focus_alternate(self):
-        """Alternate between focus blue and white for concentration."""
-        colors = [self.emotion_colors['focus'], (200, 200, 255)]
-        try:
-            while not self.anim_stop.is_set():
-                for color in colors:
-                    if self.anim_stop.is_set():
-                        break
-                    self._set_strip_color_all(color)
-                    time.sleep(0.8)
-        finally:
-            if not self.anim_stop.is_set():
-                self._set_strip_color_all(self.current_color)
-
-    def _anim_rainbow_party(self):
-        """Enhanced rainbow party animation."""
-        try:
-            pos = 0
-            while not self.anim_stop.is_set():
-                for i in range(LED_COUNT):
-                    if self.anim_stop.is_set():
-                        break
-                    color = wheel((i * 256 // LED_COUNT + pos) % 256)
-                    self.strip.setPixelColor(i, Color(color[0], color[1], color[2]))
-                self.strip.show()
-                pos = (pos + 2) % 256
-                time.sleep(0.05)
-        except Exception as e:
-            print("Rainbow party error:", e)
-        finally:
-            if not self.anim_stop.is_set():
-                self._set_strip_color_all(self.current_color)
-
-    def _anim_surprise_flash(self):
-        """Quick white flashes followed by color burst."""
-        try:
-            # Quick white flashes
-            for _ in range(4):
-                if self.anim_stop.is_set():
-                    return
-                self._set_strip_color_all((255, 255, 255))
-                time.sleep(0.1)
-                self.led_off()
-                time.sleep(0.1)
-            
-            # Color burst
-            if not self.anim_stop.is_set():
-                colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]
-                for color in colors:
-                    if self.anim_stop.is_set():
-                        break
-                    self._set_strip_color_all(color)
-                    time.sleep(0.2)
-                
-                # Settle on surprise color
-                if not self.anim_stop.is_set():
-                    self._set_strip_color_all(self.emotion_colors['surprise'])
-        except Exception as e:
-            print("Surprise flash error:", e)
+    def _fx_solid(self, rgb):
+        rgb = clamp_rgb(rgb)
+        return lambda t, size: (rgb, True)
+
+    def _fx_frame(self, frame):
+        return lambda t, size: (frame, True)
+
+    def _fx_cycle(self, colors, step):
+        """Alternate between colors every `step` seconds (focus mode)."""
+        colors = [clamp_rgb(c) for c in colors]
+        return lambda t, size: (colors[int(t / step) % len(colors)], False)
+
+    def _fx_table(self, table, period):
+        """Loop over a precomputed table of frames once every `period` seconds."""
+        count = len(table)
+        return lambda t, size: (table[int(t * count / period) % count], False)
+
+    def _fx_rainbow(self):
+        """Rainbow party; frames are precomputed once per zone length."""
+        def render(t, size):
+            frames = self._lut(('rainbow', size), lambda: _rainbow_frames(size))
+            return frames[int(t * 256 / RAINBOW_PERIOD) & 255], False
+        return render
+
+    def _fx_sequence(self, steps):
+        """Show each (rgb, seconds) step in turn and hold the last color."""
+        timeline = []
+        end = 0.0
+        for rgb, seconds in steps:
+            end += seconds
+            timeline.append((clamp_rgb(rgb), end))
+
+        def render(t, size):
+            for rgb, step_end in timeline:
+                if t < step_end:
+                    return rgb, False
+            return timeline[-1][0], True
+        return render
+
+    def push_stream_frame(self, pixels):
+        """Publish a complete streamed frame; the render loop shows it on its next tick.
+
+        Streams drive the default (first) zone. The first frame switches it to
+        the 'stream' effect. While frames keep arriving the stream owns the
+        zone; once none have come for STREAM_TIMEOUT seconds the last frame is
+        held and normal effects resume with the next request.
+        """
+        self.stream_frame = pixels
+        self.stream_frame_at = time.monotonic()
+        self.stream_frames += 1
+        effect = self.default_zone.effect
+        if effect is None or effect[0] != 'stream':
+            self.led_on_state = True
+            self._set_effect(self._fx_stream(), 'stream', self.default_zone.name, fade=0)
 
-    def _anim_energy_pulse(self):
-        """Pulsing energy animation."""
-        try:
-            base_color = self.emotion_colors['energy']
-            while not self.anim_stop.is_set():
-                for intensity in range(0, 101, 5):
-                    if self.anim_stop.is_set():
-                        break
-                    factor = intensity / 100.0
-                    color = (
-                        int(base_color[0] * factor),
-                        int(base_color[1] * factor),
-                        int(base_color[2] * factor)
-                    )
-                    self._set_strip_color_all(color)
-                    time.sleep(0.03)
-                for intensity in range(100, -1, -5):
-                    if self.anim_stop.is_set():
-                        break
-                    factor = intensity / 100.0
-                    color = (
-                        int(base_color[0] * factor),
-                        int(base_color[1] * factor),
-                        int(base_color[2] * factor)
-                    )
-                    self._set_strip_color_all(color)
-                    time.sleep(0.03)
-        except Exception as e:
-            print("Energy pulse error:", e)
+    def _fx_stream(self):
+        def render(t, size):
+            finished = time.monotonic() - self.stream_frame_at > STREAM_TIMEOUT
+            return self.stream_frame, finished
+        return render
 
-    def _anim_calm_breathing(self):
-        """Slow breathing animation for calm state."""
-        try:
-            base_color = self.emotion_colors['calm']
-            while not self.anim_stop.is_set():
-                # Slow pulse
-                for i in range(0, 101, 2):
-                    if self.anim_stop.is_set():
-                        break
-                    factor = 0.3 + 0.7 * (i / 100.0)
-                    color = (
-                        int(base_color[0] * factor),
-                        int(base_color[1] * factor),
-                        int(base_color[2] * factor)
-                    )
-                    self._set_strip_color_all(color)
-                    time.sleep(0.05)
-                for i in range(100, -1, -2):
-                    if self.anim_stop.is_set():
-                        break
-                    factor = 0.3 + 0.7 * (i / 100.0)
-                    color = (
-                        int(base_color[0] * factor),
-                        int(base_color[1] * factor),
-                        int(base_color[2] * factor)
-                    )
-                    self._set_strip_color_all(color)
-                    time.sleep(0.05)
-        except Exception as e:
-            print("Calm breathing error:", e)
+    def _fx_surprise_flash(self):
+        """Quick white flashes followed by color burst, settling on the surprise color."""
+        flashes = [((255, 255, 255), 0.1), ((0, 0, 0), 0.1)] * 4
+        burst = [(color, 0.2) for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0)]]
+        return self._fx_sequence(flashes + burst + [(self.emotion_colors['surprise'], 0)])
 
     # ---------- EXACT OLED UI from test version ----------
     def _init_oled(self):
         if not OLED_AVAILABLE:
-            print("OLED: DEMO mode (no luma).")
+            if VIRTUAL_HW and PIL_AVAILABLE:
+                self._attach_oled(VirtualOledDevice())
+                logger.info("OLED: virtual 128x64 framebuffer (no luma).")
+                return
+            logger.info("OLED: DEMO mode (no luma).")
             return
         try:
             serial = i2c(port=1, address=0x3C)
-            self.device = sh1106(serial, width=128, height=64)
-            
-            # EXACT fonts from test version
-            try:
-                self.font_header = ImageFont.truetype("DejaVuSans.ttf", 10)
-                self.font_mid = ImageFont.truetype("DejaVuSans-Bold.ttf", 15)
-                self.font_footer = ImageFont.truetype("DejaVuSans.ttf", 9)
-            except:
-                # Fallback to default fonts
-                self.font_header = ImageFont.load_default()
-                self.font_mid = ImageFont.load_default()
-                self.font_footer = ImageFont.load_default()
-            
-            print("✅ OLED initialized with EXACT test version fonts.")
+            self._attach_oled(sh1106(serial, width=128, height=64))
+            logger.info("✅ OLED initialized with EXACT test version fonts.")
         except Exception as e:
-            print("⚠️ OLED init error:", e)
+            logger.warning("⚠️ OLED init error: %s", e)
             self.device = None
 
+    def _attach_oled(self, device):
+        self.device = device
+        self.oled_backend = PagedOledBackend(self.device)
+        self.oled_frame = Image.new('1', (OLED_WIDTH, OLED_HEIGHT))
+        
+        # EXACT fonts from test version
+        try:
+            self.font_header = ImageFont.truetype("DejaVuSans.ttf", 10)
+            self.font_mid = ImageFont.truetype("DejaVuSans-Bold.ttf", 15)
+            self.font_footer = ImageFont.truetype("DejaVuSans.ttf", 9)
+        except:
+            # Fallback to default fonts
+            self.font_header = ImageFont.load_default()
+            self.font_mid = ImageFont.load_default()
+            self.font_footer = ImageFont.load_default()
+
     def _get_text_width(self, draw, text, font):
-        bbox = draw.textbbox((0, 0), text, font=font)
-        return bbox[2] - bbox[0]
+        key = (font, text)
+        width = self.text_widths.get(key)
+        if width is None:
+            if len(self.text_widths) >= 512:
+                self.text_widths.clear()
+            bbox = draw.textbbox((0, 0), text, font=font)
+            width = self.text_widths[key] = bbox[2] - bbox[0]
+        return width
+
+    def _get_marquee_window(self, text, text_w, height):
+        """128px window of the scrolling message at the current scroll_x.
+
+        The message is rasterized once, twice side by side with the 30px gap,
+        into a 1-bit bitmap; each frame only crops the visible slice out of it.
+        """
+        period = text_w + 30
+        if self.marquee is None or self.marquee[0] != text:
+            bitmap = Image.new('1', (period + 128, height))
+            bitmap_draw = ImageDraw.Draw(bitmap)
+            bitmap_draw.text((0, 0), text, font=self.font_mid, fill=255)
+            bitmap_draw.text((period, 0), text, font=self.font_mid, fill=255)
+            self.marquee = (text, period, bitmap)
+        offset = -self.scroll_x
+        return self.marquee[2].crop((offset, 0, offset + 128, height))
 
     def display_message(self, message):
         """Set center message - main content area."""
         self.current_message = str(message)
         self.scroll_x = 0
         self.scroll_reset_timer = 0
-        print(f"[OLED] Center message -> {self.current_message}")
+        hot_log.info("oled_message", "[OLED] Center message -> %s", self.current_message)
+        self.oled_dirty.set()
+        self._emit('display', {'message': self.current_message, 'bottom_status': self.bottom_status})
 
     def set_bottom_status(self, text, duration=4.0):
         """Set bottom status - for notifications, success messages."""
         self.bottom_status = str(text)
         self.bottom_status_expire = time.time() + float(duration)
-        print(f"[OLED] Bottom status -> {text} (for {duration}s)")
+        hot_log.info("oled_status", "[OLED] Bottom status -> %s (for %ss)", text, duration)
+        self.oled_dirty.set()
+        self._emit('display', {'message': self.current_message, 'bottom_status': self.bottom_status})
 
     def clear_display(self):
         self.current_message = ""
@@ -458,18 +940,11 @@ class EnhancedPiHardwareController:
         self.bottom_status_expire = time.time() + 3
         self.scroll_x = 0
         self.scroll_reset_timer = 0
-        
+        # The renderer redraws with the empty message; only it touches the I2C bus
+        self.oled_dirty.set()
         if not self.device:
-            print("[DEMO] OLED cleared")
-            return True
-        
-        try:
-            with canvas(self.device) as draw:
-                draw.rectangle(self.device.bounding_box, outline=0, fill=0)
-            return True
-        except Exception as e:
-            print("⚠️ OLED clear error:", e)
-            return False
+            logger.debug("[DEMO] OLED cleared")
+        return True
 
     def _get_next_quote(self):
         """Get next quote sequentially with timing control"""
@@ -495,60 +970,86 @@ class EnhancedPiHardwareController:
             # Demo output
             temp = self.sensor_data.get('temperature_c', 24)
             hum = self.sensor_data.get('humidity', 52)
-            print(f"[OLED] {datetime.now().strftime('%H:%M')} | {temp}C {hum}% | {self.current_message[:20]}... | {self.bottom_status}")
+            hot_log.debug("oled_frame", "[OLED] %s | %sC %s%% | %s... | %s", datetime.now().strftime('%H:%M'),
+                          temp, hum, self.current_message[:20], self.bottom_status)
+            self.oled_scrolling = False
             return
 
         try:
-            with canvas(self.device) as draw:
-                # ✅ HEADER (EXACT from test)
-                now = datetime.now().strftime("%H:%M")
-                draw.text((0, 0), now, font=self.font_header, fill=255)
-
-                temp_hum = f"{int(self.sensor_data['temperature_c'])}°C {int(self.sensor_data['humidity'])}%"
-                tw = self._get_text_width(draw, temp_hum, self.font_header)
-                draw.text((128 - tw, 0), temp_hum, font=self.font_header, fill=255)
-
-                # ✅ CURRENT MID MESSAGE (EXACT scrolling logic from test)
-                text = self.current_message
-                mid_y = 25
-                text_w = self._get_text_width(draw, text, self.font_mid)
-
-                # No scroll needed → center + time-based change
-                if text_w <= 128:
-                    draw.text(((128 - text_w) // 2, mid_y), text, font=self.font_mid, fill=255)
-                else:
-                    # Circular scrolling effect (EXACT from test)
-                    # Draw the text twice for seamless looping
-                    draw.text((self.scroll_x, mid_y), text, font=self.font_mid, fill=255)
-                    draw.text((self.scroll_x + text_w + 30, mid_y), text, font=self.font_mid, fill=255)
-                    
-                    # Scroll to the left
-                    self.scroll_x -= 1
-                    
-                    # Reset position when first copy is completely off screen
-                    if self.scroll_x <= -text_w - 30:
-                        self.scroll_x = 0
-                        self.scroll_reset_timer += 1
-
-                # ✅ FOOTER (EXACT from test but with SEQUENTIAL quotes)
-                footer_text = self.bottom_status
-                if time.time() > self.bottom_status_expire:
-                    # Show sequential quote if no active status (reduced randomness)
-                    footer_text = self._get_next_quote()
+            # Drawn into a reused frame; the backend sends only what changed
+            frame = self.oled_frame
+            draw = ImageDraw.Draw(frame)
+            draw.rectangle((0, 0, OLED_WIDTH - 1, OLED_HEIGHT - 1), outline=0, fill=0)
+
+            # ✅ HEADER (EXACT from test)
+            now = datetime.now().strftime("%H:%M")
+            draw.text((0, 0), now, font=self.font_header, fill=255)
+
+            temp_hum = f"{int(self.sensor_data['temperature_c'])}°C {int(self.sensor_data['humidity'])}%"
+            tw = self._get_text_width(draw, temp_hum, self.font_header)
+            draw.text((128 - tw, 0), temp_hum, font=self.font_header, fill=255)
+
+            # ✅ CURRENT MID MESSAGE (EXACT scrolling logic from test)
+            text = self.current_message
+            mid_y = 25
+            text_w = self._get_text_width(draw, text, self.font_mid)
+            self.oled_scrolling = text_w > 128
+
+            # No scroll needed → center + time-based change
+            if text_w <= 128:
+                draw.text(((128 - text_w) // 2, mid_y), text, font=self.font_mid, fill=255)
+            else:
+                # Circular scrolling effect (EXACT from test), blitted from the
+                # pre-rendered bitmap instead of drawing the text twice per frame
+                window = self._get_marquee_window(text, text_w, 64 - mid_y)
+                draw.bitmap((0, mid_y), window, fill=255)
                 
-                fw = self._get_text_width(draw, footer_text, self.font_footer)
-                draw.text(((128 - fw) // 2, 52), footer_text, font=self.font_footer, fill=255)
+                # Scroll to the left
+                self.scroll_x -= 1
+                
+                # Reset position when first copy is completely off screen
+                if self.scroll_x <= -text_w - 30:
+                    self.scroll_x = 0
+                    self.scroll_reset_timer += 1
+
+            # ✅ FOOTER (EXACT from test but with SEQUENTIAL quotes)
+            footer_text = self.bottom_status
+            if time.time() > self.bottom_status_expire:
+                # Show sequential quote if no active status (reduced randomness)
+                footer_text = self._get_next_quote()
+            
+            fw = self._get_text_width(draw, footer_text, self.font_footer)
+            draw.text(((128 - fw) // 2, 52), footer_text, font=self.font_footer, fill=255)
+            self.oled_backend.display(frame)
 
         except Exception as e:
-            print("⚠️ OLED draw error:", e)
+            # A failed write leaves the panel in an unknown state; resend everything next time
+            self.oled_backend.invalidate()
+            hot_log.warning("oled_draw", "⚠️ OLED draw error: %s", e)
+
+    def _oled_idle_timeout(self):
+        """Seconds until the screen changes on its own: minute tick, status expiry or next quote."""
+        now = time.time()
+        deadlines = [60.0 - now % 60.0]
+        if self.bottom_status_expire > now:
+            deadlines.append(self.bottom_status_expire - now)
+        elif hasattr(self, 'last_quote_time'):
+            deadlines.append(self.last_quote_time + 60.0 - now)
+        return max(min(deadlines), 0.05)
 
     def _start_oled_updater(self):
-        """Background thread for OLED updates - EXACT timing from test."""
+        """Background thread for OLED updates.
+
+        Redraws when display_message/set_bottom_status/clear_display or a
+        changed sensor reading set oled_dirty, on the minute tick and when a
+        status expires. Only scrolling text redraws continuously, at
+        OLED_SCROLL_FPS (25 like the test version); otherwise the thread
+        sleeps and the I2C bus stays idle.
+        """
         def oled_loop():
             while True:
+                self.oled_dirty.clear()
                 try:
-                    self._draw_oled_ui()
-                    
                     # Clear expired status messages
                     if (self.bottom_status and 
                         self.bottom_status_expire > 0 and 
@@ -556,11 +1057,18 @@ class EnhancedPiHardwareController:
                         
                         self.bottom_status = ""
                         self.bottom_status_expire = 0
-                            
+
+                    self._draw_oled_ui()
+                    self.oled_frames_drawn += 1
                 except Exception as e:
-                    print("OLED updater error:", e)
-                
-                time.sleep(0.04)  # EXACT timing from test version
+                    hot_log.warning("oled_updater", "OLED updater error: %s", e)
+                    self.oled_dirty.wait(1.0)
+                    continue
+
+                if self.oled_scrolling:
+                    time.sleep(1.0 / OLED_SCROLL_FPS)  # 25 fps (EXACT timing from test version) by default
+                else:
+                    self.oled_dirty.wait(self._oled_idle_timeout())
 
         t = threading.Thread(target=oled_loop, daemon=True)
         t.start()
@@ -568,16 +1076,17 @@ class EnhancedPiHardwareController:
     # ---------- Sensor Management ----------
     def _init_dht(self):
         if not DHT_AVAILABLE:
-            print("DHT: DEMO mode.")
+            logger.info("DHT: DEMO mode.")
             return
         try:
             self.dht = adafruit_dht.DHT22(board.D4)
-            print("✅ DHT22 initialized.")
+            logger.info("✅ DHT22 initialized.")
         except Exception as e:
-            print("⚠️ DHT init failed:", e)
+            logger.warning("⚠️ DHT init failed: %s", e)
             self.dht = None
 
-    def read_sensors(self):
+    def _sample_sensors(self):
+        """Read the DHT22 once; only ever called from the sampler thread."""
         data = {
             'timestamp': datetime.now().isoformat(), 
             'temperature_c': None, 
@@ -603,21 +1112,81 @@ class EnhancedPiHardwareController:
                         'success': True
                     })
             except Exception as e:
-                print("⚠️ DHT read error:", e)
+                hot_log.warning("dht_read", "⚠️ DHT read error: %s", e)
                 data['error'] = str(e)
-        
-        self.sensor_data = data
-        self.last_sensor_read = datetime.now()
+
+        if not data['success']:
+            # Keep serving the last good reading; report the failure alongside it
+            self.sensor_errors += 1
+            self.last_sensor_error = {'timestamp': data['timestamp'], 'error': data.get('error', 'no reading')}
+            return data
+
+        # The OLED header shows whole degrees and percent; only redraw when those change
+        if (int(data['temperature_c']) != int(self.sensor_data.get('temperature_c') or 0) or
+                int(data['humidity']) != int(self.sensor_data.get('humidity') or 0)):
+            self.oled_dirty.set()
+        with self.sensor_lock:
+            self.sensor_history.append((time.time(), data))
+            self.sensor_data = data
+            self.last_sensor_read = datetime.now()
+        self._emit('sensors', data)
         return data
 
+    def read_sensors(self):
+        """Latest sampled reading; never touches the sensor."""
+        with self.sensor_lock:
+            if not self.sensor_history:
+                data = {'timestamp': None, 'temperature_c': None, 'humidity': None, 'success': False}
+            else:
+                sampled_at, reading = self.sensor_history[-1]
+                data = dict(reading, age_seconds=round(time.time() - sampled_at, 1))
+        data['cached'] = True
+        data['sample_interval'] = SENSOR_INTERVAL
+        if self.last_sensor_error:
+            data['last_error'] = self.last_sensor_error
+        return data
+
+    def get_sensor_history(self, window=None, limit=None):
+        """Samples from the last `window` seconds (all if None), newest `limit` of them, with stats."""
+        now = time.time()
+        with self.sensor_lock:
+            samples = list(self.sensor_history)
+        if window is not None:
+            samples = [(ts, reading) for ts, reading in samples if now - ts <= window]
+        if limit is not None:
+            samples = samples[-limit:] if limit > 0 else []
+
+        stats = {}
+        for field in ('temperature_c', 'humidity'):
+            values = [reading[field] for _, reading in samples]
+            stats[field] = {
+                'min': min(values),
+                'max': max(values),
+                'mean': round(sum(values) / len(values), 2)
+            } if values else None
+        return {
+            'samples': [dict(reading, epoch=round(ts, 3)) for ts, reading in samples],
+            'count': len(samples),
+            'window_seconds': window,
+            'stats': stats,
+            'capacity': self.sensor_history.maxlen,
+            'sample_interval': SENSOR_INTERVAL
+        }
+
     def _start_sensor_monitoring(self):
+        # First sample before serving, so reads never come back empty
+        try:
+            self._sample_sensors()
+        except Exception as e:
+            hot_log.warning("sensor_monitor", "Sensor monitor error: %s", e)
+
         def monitor():
             while True:
+                time.sleep(SENSOR_INTERVAL)  # Read every 30 seconds by default
                 try:
-                    self.read_sensors()
+                    self._sample_sensors()
                 except Exception as e:
-                    print("Sensor monitor error:", e)
-                time.sleep(30)  # Read every 30 seconds
+                    hot_log.warning("sensor_monitor", "Sensor monitor error: %s", e)
         t = threading.Thread(target=monitor, daemon=True)
         t.start()
 
@@ -630,8 +1199,18 @@ class EnhancedPiHardwareController:
             'led_state': self.led_on_state,
             'led_brightness_percent': self.led_brightness_percent,
             'current_color': self.current_color,
+            'led_effect': self.default_zone.effect[0] if self.default_zone.effect else None,
+            'led_zones': self.get_zones(),
+            'led_frames_pushed': self.frames_pushed,
+            'led_stream_frames': self.stream_frames,
+            'virtual_hardware': {
+                'led': isinstance(self.strip, VirtualPixelStrip),
+                'oled': isinstance(self.device, VirtualOledDevice)
+            },
             'current_message': self.current_message,
             'bottom_status': self.bottom_status,
+            'oled_frames_drawn': self.oled_frames_drawn,
+            'oled_io': self.oled_backend.get_stats() if self.oled_backend else None,
             'last_sensor_read': self.last_sensor_read.isoformat() if self.last_sensor_read else None,
             'sensors': self.sensor_data,
             'emotions_available': list(self.emotion_colors.keys())
@@ -639,7 +1218,7 @@ class EnhancedPiHardwareController:
 
     # ---------- Enhanced Startup Sequence ----------
     def _enhanced_startup_sequence(self):
-        print("🚀 Running enhanced startup sequence...")
+        logger.info("🚀 Running enhanced startup sequence...")
         
         # Set initial messages (EXACTLY like you wanted)
         self.display_message("Hello! Smart Desk Buddy is Active")
@@ -654,17 +1233,12 @@ class EnhancedPiHardwareController:
         ]
         
         if self.strip:
-            try:
-                for color in test_colors:
-                    self._set_strip_color_all(color)
-                    time.sleep(0.3)
-                self.led_off()
-            except Exception as e:
-                print("LED startup error:", e)
+            # Runs on the render loop, so the server is up while the test plays
+            self._set_effect(self._fx_sequence([(color, 0.3) for color in test_colors] + [((0, 0, 0), 0)]), fade=0)
         else:
-            print("[DEMO] LED color test")
+            logger.debug("[DEMO] LED color test")
 
-        print("✅ Enhanced startup complete. System ready!")
+        logger.info("✅ Enhanced startup complete. System ready!")
 
 # ---------------------------
 # Flask App & Enhanced Routes
@@ -674,6 +1248,108 @@ CORS(app)  # Enable CORS for all routes
 
 hw = EnhancedPiHardwareController()
 
+# ---------------------------
+# Request latency metrics
+# ---------------------------
+METRICS_WINDOW = int(os.environ.get('PI_METRICS_WINDOW', '512'))  # latest requests kept per endpoint
+
+def _percentile(ordered, pct):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+class RequestMetrics:
+    """Per-endpoint request counts, errors and latency percentiles over a recent window.
+
+    Also tracks requests in flight and how long commands waited for the
+    hardware command lock, which is where concurrent clients queue up.
+    """
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.window = window
+        self.lock = threading.Lock()
+        self.endpoints = {}  # route -> {'count', 'errors', 'latencies'}
+        self.in_flight = 0
+        self.lock_waits = deque(maxlen=window)
+        self.started = time.time()
+
+    def begin(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def end(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def record(self, endpoint, seconds, status_code):
+        with self.lock:
+            entry = self.endpoints.get(endpoint)
+            if entry is None:
+                entry = self.endpoints[endpoint] = {
+                    'count': 0, 'errors': 0, 'latencies': deque(maxlen=self.window)
+                }
+            entry['count'] += 1
+            if status_code >= 500:
+                entry['errors'] += 1
+            entry['latencies'].append(seconds)
+
+    def record_lock_wait(self, seconds):
+        self.lock_waits.append(seconds)
+
+    @staticmethod
+    def _summary(samples):
+        ordered = sorted(samples)
+        return {
+            'p50_ms': round(_percentile(ordered, 50) * 1000, 2),
+            'p95_ms': round(_percentile(ordered, 95) * 1000, 2),
+            'p99_ms': round(_percentile(ordered, 99) * 1000, 2),
+            'max_ms': round(ordered[-1] * 1000, 2) if ordered else 0.0
+        }
+
+    def snapshot(self):
+        with self.lock:
+            endpoints = {name: (entry['count'], entry['errors'], list(entry['latencies']))
+                         for name, entry in self.endpoints.items()}
+            in_flight = self.in_flight
+        return {
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'in_flight': in_flight,
+            'requests': sum(count for count, _, _ in endpoints.values()),
+            'endpoints': {
+                name: dict(self._summary(latencies), count=count, errors=errors)
+                for name, (count, errors, latencies) in sorted(endpoints.items())
+            },
+            'command_lock_wait': self._summary(list(self.lock_waits))
+        }
+
+request_metrics = RequestMetrics()
+
+def _record_request(started, status_code):
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    request_metrics.record(endpoint, time.perf_counter() - started, status_code)
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+    g.request_in_flight = True
+    request_metrics.begin()
+
+@app.after_request
+def _record_request_latency(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        _record_request(started, response.status_code)
+    return response
+
+@app.teardown_request
+def _finish_request(exc):
+    # Always runs, unlike after_request, which an unhandled exception skips
+    started = g.pop('request_started', None)
+    if started is not None:
+        _record_request(started, 500)
+    if g.pop('request_in_flight', False):
+        request_metrics.end()
+
 @app.route('/')
 def root():
     return jsonify({
@@ -700,115 +1376,358 @@ def api_health():
         }
     })
 
-@app.route('/api/led/on', methods=['POST'])
-def api_led_on():
+# ---------------------------
+# Virtual hardware previews (demo mode)
+# ---------------------------
+def _png_response(image):
+    buf = io.BytesIO()
+    image.save(buf, format='PNG')
+    return Response(buf.getvalue(), mimetype='image/png', headers={'Cache-Control': 'no-store'})
+
+@app.route('/api/virtual/led', methods=['GET'])
+def api_virtual_led():
+    """Current LED frames as JSON, or ?format=png (&scale=<px per LED>) with one row per strip"""
+    strips = [strip for strip in hw.strips if isinstance(strip, VirtualPixelStrip)]
+    if not strips:
+        return jsonify({'status': 'error', 'message': 'No virtual LED strip (real hardware or PI_VIRTUAL_HW=0)'}), 404
+    frames = [strip.get_frame() for strip in strips]
+
+    if request.args.get('format') == 'png':
+        if not PIL_AVAILABLE:
+            return jsonify({'status': 'error', 'message': 'PNG preview needs Pillow'}), 501
+        scale = max(1, min(64, request.args.get('scale', 16, type=int)))
+        image = Image.new('RGB', (max(len(frame) for frame in frames) * scale, len(frames) * scale))
+        draw = ImageDraw.Draw(image)
+        edge = scale - (2 if scale >= 4 else 1)  # leave a 1px gap between larger LEDs
+        for row, (strip, frame) in enumerate(zip(strips, frames)):
+            level = strip.brightness / 255.0
+            for i, rgb in enumerate(frame):
+                draw.rectangle((i * scale, row * scale, i * scale + edge, row * scale + edge),
+                               fill=scale_color(rgb, level))
+        return _png_response(image)
+
+    return jsonify({
+        'status': 'success',
+        'strips': [{
+            'pixels': frame,
+            'brightness': strip.brightness,
+            'show_count': strip.show_count,
+            'last_show': strip.last_show
+        } for strip, frame in zip(strips, frames)],
+        'zones': hw.get_zones()
+    })
+
+@app.route('/api/virtual/oled', methods=['GET'])
+def api_virtual_oled():
+    """Current 128x64 OLED frame as JSON rows of '0'/'1', or ?format=png (&scale=<n>)"""
+    device = hw.device if isinstance(hw.device, VirtualOledDevice) else None
+    if device is None:
+        return jsonify({'status': 'error', 'message': 'No virtual OLED (real hardware, no Pillow or PI_VIRTUAL_HW=0)'}), 404
+    image = device.to_image()
+
+    if request.args.get('format') == 'png':
+        scale = max(1, min(8, request.args.get('scale', 4, type=int)))
+        if scale > 1:
+            image = image.resize((OLED_WIDTH * scale, OLED_HEIGHT * scale), Image.NEAREST)
+        return _png_response(image)
+
+    pixels = image.load()
+    rows = [''.join('1' if pixels[x, y] else '0' for x in range(OLED_WIDTH)) for y in range(OLED_HEIGHT)]
+    return jsonify({
+        'status': 'success',
+        'width': OLED_WIDTH,
+        'height': OLED_HEIGHT,
+        'rows': rows,
+        'frames_drawn': hw.oled_frames_drawn,
+        'io': hw.oled_backend.get_stats(),
+        'device': dict(device.stats)
+    })
+
+@app.route('/api/virtual/stats', methods=['GET'])
+def api_virtual_stats():
+    """Frame counters for the LED and OLED pipelines"""
+    return jsonify({
+        'status': 'success',
+        'led': {
+            'fps_target': LED_FPS,
+            'frames_pushed': hw.frames_pushed,
+            'stream_frames': hw.stream_frames,
+            'stream': stream_server.get_stats() if stream_server else None,
+            'show_counts': [strip.show_count for strip in hw.strips if isinstance(strip, VirtualPixelStrip)]
+        },
+        'oled': {
+            'frames_drawn': hw.oled_frames_drawn,
+            'io': hw.oled_backend.get_stats() if hw.oled_backend else None,
+            'device': dict(hw.device.stats) if isinstance(hw.device, VirtualOledDevice) else None
+        },
+        'virtual_hardware': hw.get_system_status()['virtual_hardware']
+    })
+
+# ---------------------------
+# Command operations (shared by the single routes and /api/batch)
+# ---------------------------
+MAX_BATCH_OPERATIONS = 32
+
+def _op_led_on(params):
+    ok = hw.led_on(params.get('zone'))
+    hw.set_bottom_status("LED turned on", duration=3)
+    return {
+        'status': 'success' if ok else 'error',
+        'message': 'LED turned on successfully'
+    }
+
+def _op_led_off(params):
+    ok = hw.led_off(params.get('zone'))
+    hw.set_bottom_status("LED turned off", duration=3)
+    return {
+        'status': 'success' if ok else 'error',
+        'message': 'LED turned off successfully'
+    }
+
+def _op_led_brightness(params):
+    brightness = params['brightness']
+    hw._set_brightness(brightness)
+    hw.set_bottom_status(f"Brightness {int(brightness)}%", duration=2)
+    return {
+        'status': 'success', 
+        'brightness': hw.led_brightness_percent,
+        'message': f'Brightness set to {brightness}%'
+    }
+
+def _op_led_emotion(params):
+    emotion = params.get('emotion', 'neutral')
+    ok = hw.set_emotion_lighting(emotion, params.get('zone'), params.get('fade'))
+    hw.set_bottom_status(f"Emotion: {emotion}", duration=3)
+    return {
+        'status': 'success' if ok else 'error', 
+        'emotion': emotion,
+        'color': hw.emotion_colors.get(emotion.lower(), (255,255,255)),
+        'message': f'Emotion lighting set to {emotion}'
+    }
+
+def _op_display_update(params):
+    message = params['message']
+    hw.display_message(message)
+    hw.set_bottom_status("Message updated", duration=2)
+    return {
+        'status': 'success', 
+        'message': message,
+        'display_message': 'Message displayed successfully'
+    }
+
+def _op_display_clear(params):
+    ok = hw.clear_display()
+    return {
+        'status': 'success' if ok else 'error',
+        'message': 'Display cleared successfully'
+    }
+
+def _op_sensors_read(params):
+    return {
+        'status': 'success', 
+        'sensor_data': hw.read_sensors(),
+        'message': 'Sensor data read successfully'
+    }
+
+def _op_sensors_history(params):
+    return {
+        'status': 'success',
+        'history': hw.get_sensor_history(params.get('window'), params.get('limit')),
+        'message': 'Sensor history retrieved successfully'
+    }
+
+def _op_system_status(params):
+    return {
+        'status': 'success', 
+        'system_status': hw.get_system_status(),
+        'message': 'System status retrieved successfully'
+    }
+
+# name -> (handler, required params, changes hardware state)
+OPERATIONS = {
+    'led_on': (_op_led_on, (), True),
+    'led_off': (_op_led_off, (), True),
+    'led_brightness': (_op_led_brightness, ('brightness',), True),
+    'led_emotion': (_op_led_emotion, (), True),
+    'display_update': (_op_display_update, ('message',), True),
+    'display_clear': (_op_display_clear, (), True),
+    'sensors_read': (_op_sensors_read, (), False),
+    'sensors_history': (_op_sensors_history, (), False),
+    'system_status': (_op_system_status, (), False),
+}
+
+def validate_operation(name, params):
+    """Return an error message if the operation cannot run, else None."""
+    if name not in OPERATIONS:
+        return f'unknown operation: {name}'
+    if not isinstance(params, dict):
+        return 'params must be an object'
+    for key in OPERATIONS[name][1]:
+        if params.get(key) is None or params.get(key) == '':
+            return f'{key} parameter missing'
+    if params.get('zone') is not None and params['zone'] not in hw.zones:
+        return f"unknown LED zone: {params['zone']}"
+    if params.get('fade') is not None:
+        try:
+            params['fade'] = max(0.0, float(params['fade']))
+        except (TypeError, ValueError):
+            return 'fade must be a number of seconds'
+    if name == 'led_brightness':
+        try:
+            int(params['brightness'])
+        except (TypeError, ValueError):
+            return 'brightness must be an integer'
+    if name == 'sensors_history':
+        for key, cast in (('window', float), ('limit', int)):
+            if params.get(key) is None:
+                continue
+            try:
+                params[key] = cast(params[key])
+            except (TypeError, ValueError):
+                return f'{key} must be a number'
+    return None
+
+@contextmanager
+def command_lock():
+    """Hold the hardware command lock, recording how long the caller queued for it."""
+    started = time.perf_counter()
+    with hw.command_lock:
+        request_metrics.record_lock_wait(time.perf_counter() - started)
+        yield
+
+def run_operation(name, params=None):
+    """Run one validated operation; state-changing ones hold the command lock."""
+    handler, _, mutates = OPERATIONS[name]
+    params = params or {}
+    if not mutates:
+        return handler(params)
+    with command_lock():
+        result = handler(params)
+    hw._emit('state', {
+        'led_state': hw.led_on_state,
+        'led_brightness_percent': hw.led_brightness_percent,
+        'current_color': hw.current_color
+    })
+    return result
+
+def _operation_response(name, params=None):
+    params = params or {}
+    error = validate_operation(name, params)
+    if error:
+        return jsonify({'status': 'error', 'message': error}), 400
     try:
-        ok = hw.led_on()
-        hw.set_bottom_status("LED turned on", duration=3)
-        return jsonify({
-            'status': 'success' if ok else 'error',
-            'message': 'LED turned on successfully'
-        })
+        return jsonify(run_operation(name, params))
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.route('/api/led/on', methods=['POST'])
+def api_led_on():
+    data = request.get_json(force=True, silent=True) or {}
+    return _operation_response('led_on', data)
+
 @app.route('/api/led/off', methods=['POST'])
 def api_led_off():
-    try:
-        ok = hw.led_off()
-        hw.set_bottom_status("LED turned off", duration=3)
-        return jsonify({
-            'status': 'success' if ok else 'error',
-            'message': 'LED turned off successfully'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    data = request.get_json(force=True, silent=True) or {}
+    return _operation_response('led_off', data)
 
 @app.route('/api/led/brightness', methods=['POST'])
 def api_led_brightness():
-    try:
-        data = request.get_json(force=True, silent=True) or {}
-        brightness = data.get('brightness')
-        if brightness is None:
-            return jsonify({'status': 'error', 'message': 'brightness parameter missing'}), 400
-        
-        hw._set_brightness(brightness)
-        hw.set_bottom_status(f"Brightness {int(brightness)}%", duration=2)
-        return jsonify({
-            'status': 'success', 
-            'brightness': hw.led_brightness_percent,
-            'message': f'Brightness set to {brightness}%'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    data = request.get_json(force=True, silent=True) or {}
+    return _operation_response('led_brightness', data)
 
 @app.route('/api/led/emotion', methods=['POST'])
 def api_led_emotion():
-    try:
-        data = request.get_json(force=True, silent=True) or {}
-        emotion = data.get('emotion', 'neutral')
-        ok = hw.set_emotion_lighting(emotion)
-        hw.set_bottom_status(f"Emotion: {emotion}", duration=3)
-        return jsonify({
-            'status': 'success' if ok else 'error', 
-            'emotion': emotion,
-            'color': hw.emotion_colors.get(emotion.lower(), (255,255,255)),
-            'message': f'Emotion lighting set to {emotion}'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    data = request.get_json(force=True, silent=True) or {}
+    return _operation_response('led_emotion', data)
 
 @app.route('/api/display/update', methods=['POST'])
 def api_display_update():
-    try:
-        data = request.get_json(force=True, silent=True) or {}
-        message = data.get('message', '')
-        
-        if not message:
-            return jsonify({'status': 'error', 'message': 'message parameter missing'}), 400
-        
-        hw.display_message(message)
-        hw.set_bottom_status("Message updated", duration=2)
-        return jsonify({
-            'status': 'success', 
-            'message': message,
-            'display_message': 'Message displayed successfully'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    data = request.get_json(force=True, silent=True) or {}
+    return _operation_response('display_update', data)
 
 @app.route('/api/display/clear', methods=['POST'])
 def api_display_clear():
-    try:
-        ok = hw.clear_display()
-        return jsonify({
-            'status': 'success' if ok else 'error',
-            'message': 'Display cleared successfully'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    return _operation_response('display_clear')
+
+@app.route('/api/led/zones', methods=['GET'])
+def api_led_zones():
+    return jsonify({'status': 'success', 'zones': hw.get_zones()})
 
 @app.route('/api/sensors/read', methods=['GET'])
 def api_sensors_read():
-    try:
-        data = hw.read_sensors()
-        return jsonify({
-            'status': 'success', 
-            'sensor_data': data,
-            'message': 'Sensor data read successfully'
-        })
-    except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)}), 500
+    return _operation_response('sensors_read')
+
+@app.route('/api/sensors/history', methods=['GET'])
+def api_sensors_history():
+    """Query: ?window=<seconds>&limit=<n>"""
+    return _operation_response('sensors_history', request.args.to_dict())
 
 @app.route('/api/system/status', methods=['GET'])
 def api_system_status():
+    return _operation_response('system_status')
+
+def run_batch(operations):
+    """Validate and apply a list of operations; returns (response payload, HTTP status).
+
+    The whole batch is validated first, so a bad entry rejects it without
+    touching the hardware; the operations then run back to back under the
+    command lock, so no other command can interleave with them.
+    """
+    if not isinstance(operations, list) or not operations:
+        return {'status': 'error', 'message': 'operations list missing'}, 400
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return {
+            'status': 'error',
+            'message': f'too many operations (max {MAX_BATCH_OPERATIONS})'
+        }, 400
+
+    errors = []
+    for op in operations:
+        if not isinstance(op, dict):
+            errors.append('operation must be an object')
+        else:
+            errors.append(validate_operation(op.get('op'), op.get('params') or {}))
+    if any(errors):
+        return {
+            'status': 'error',
+            'message': 'batch rejected, nothing applied',
+            'results': [
+                {
+                    'op': op.get('op') if isinstance(op, dict) else None,
+                    'status': 'error' if error else 'skipped',
+                    'message': error or 'not applied'
+                }
+                for op, error in zip(operations, errors)
+            ]
+        }, 400
+
+    results = []
+    with command_lock():
+        for op in operations:
+            try:
+                result = run_operation(op['op'], op.get('params') or {})
+            except Exception as e:
+                result = {'status': 'error', 'message': str(e)}
+            result['op'] = op['op']
+            results.append(result)
+
+    all_ok = all(r.get('status') == 'success' for r in results)
+    return {
+        'status': 'success' if all_ok else 'partial',
+        'results': results,
+        'count': len(results)
+    }, 200
+
+@app.route('/api/batch', methods=['POST'])
+def api_batch():
+    """Apply a list of operations in order and return one result per operation.
+
+    Body: {"operations": [{"op": "display_update", "params": {"message": "Hi"}}, {"op": "led_on"}]}
+    """
     try:
-        status = hw.get_system_status()
-        return jsonify({
-            'status': 'success', 
-            'system_status': status,
-            'message': 'System status retrieved successfully'
-        })
+        data = request.get_json(force=True, silent=True) or {}
+        payload, status_code = run_batch(data.get('operations'))
+        return jsonify(payload), status_code
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
@@ -827,7 +1746,8 @@ def api_emotions_list():
 @app.route('/api/reboot', methods=['POST'])
 def api_reboot():
     try:
-        hw.set_bottom_status("Rebooting system", duration=5)
+        with command_lock():
+            hw.set_bottom_status("Rebooting system", duration=5)
         # Don't actually reboot in demo - just show message
         if LED_AVAILABLE or OLED_AVAILABLE or DHT_AVAILABLE:
             threading.Thread(target=lambda: (time.sleep(2), os.system("sudo reboot")), daemon=True).start()
@@ -843,6 +1763,419 @@ def api_reboot():
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+# ---------------------------
+# Persistent command channel (length-prefixed JSON over TCP)
+# ---------------------------
+CHANNEL_ENABLED = os.environ.get('PI_CHANNEL', '1') == '1'
+CHANNEL_PORT = int(os.environ.get('PI_CHANNEL_PORT', '5002'))
+CHANNEL_SEND_QUEUE = int(os.environ.get('PI_CHANNEL_SEND_QUEUE', '256'))  # frames buffered per client
+
+class CommandChannelServer:
+    """Keeps app connections open, answers command frames and pushes controller events.
+
+    Each frame is a 4-byte big-endian length followed by UTF-8 JSON. Requests
+    carry an 'id' echoed on the reply, so the app can keep several in flight;
+    events ({'type': 'event'}) are pushed to every connected app as they happen.
+
+    Frames are encoded by the caller and handed to a per-client writer thread
+    through a bounded queue, so replying or broadcasting never blocks on the
+    network - including from the render loop or with the command lock held.
+    A client that stops reading fills its queue and is dropped.
+    """
+
+    def __init__(self, controller, host='0.0.0.0', port=CHANNEL_PORT):
+        self.controller = controller
+        self.host = host
+        self.port = port
+        self.clients = {}  # socket -> outgoing frame queue
+        self.lock = threading.Lock()
+        self.server_sock = None
+        self.stats = {'clients_dropped_slow': 0}
+        controller.add_event_listener(self.broadcast)
+
+    def start(self):
+        self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_sock.bind((self.host, self.port))
+        self.port = self.server_sock.getsockname()[1]
+        self.server_sock.listen(4)
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        logger.info("🔗 Command channel listening on port %s", self.port)
+
+    def _accept_loop(self):
+        while True:
+            try:
+                sock, addr = self.server_sock.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            outgoing = queue.Queue(CHANNEL_SEND_QUEUE)
+            with self.lock:
+                self.clients[sock] = outgoing
+            logger.info("🔗 Channel client connected: %s", addr[0])
+            threading.Thread(target=self._write, args=(sock, outgoing), daemon=True).start()
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _send(self, sock, payload):
+        self._enqueue(sock, encode_frame(payload))
+
+    def _enqueue(self, sock, frame):
+        outgoing = self.clients.get(sock)
+        if outgoing is None:
+            return
+        try:
+            outgoing.put_nowait(frame)
+        except queue.Full:
+            self.stats['clients_dropped_slow'] += 1
+            hot_log.warning("channel_slow", "⚠️ Channel client stopped reading, dropping it")
+            self._drop(sock)
+
+    def _write(self, sock, outgoing):
+        while True:
+            frame = outgoing.get()
+            if frame is None:
+                return
+            try:
+                sock.sendall(frame)
+            except OSError:
+                self._drop(sock)
+                return
+
+    def _drop(self, sock):
+        with self.lock:
+            outgoing = self.clients.pop(sock, None)
+        if outgoing is not None:
+            try:
+                outgoing.put_nowait(None)  # stop the writer once it drains
+            except queue.Full:
+                pass  # the shutdown below fails its blocked send instead
+        try:
+            # shutdown() also wakes a writer blocked in sendall and the reader in recv
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def _serve(self, sock):
+        self._send(sock, {'type': 'hello', 'status': hw.get_system_status()})
+        try:
+            while True:
+                frame = recv_frame(sock)
+                self._send(sock, self._handle(frame))
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            self._drop(sock)
+
+    def _handle(self, frame):
+        reply = {'type': 'result', 'id': frame.get('id') if isinstance(frame, dict) else None}
+        try:
+            kind = frame.get('type')
+            if kind == 'ping':
+                reply['result'] = {'status': 'success'}
+            elif kind == 'command':
+                name, params = frame.get('op'), frame.get('params') or {}
+                error = validate_operation(name, params)
+                reply['result'] = ({'status': 'error', 'message': error} if error
+                                   else run_operation(name, params))
+            elif kind == 'batch':
+                reply['result'] = run_batch(frame.get('operations'))[0]
+            else:
+                reply['result'] = {'status': 'error', 'message': f'unknown frame type: {kind}'}
+        except Exception as e:
+            reply['result'] = {'status': 'error', 'message': str(e)}
+        return reply
+
+    def broadcast(self, event, data):
+        """Push an event frame to every connected app"""
+        with self.lock:
+            clients = list(self.clients)
+        if not clients:
+            return
+        frame = encode_frame({'type': 'event', 'event': event, 'data': data, 'timestamp': time.time()})
+        for sock in clients:
+            self._enqueue(sock, frame)
+
+    def get_stats(self):
+        with self.lock:
+            clients = len(self.clients)
+        return dict(self.stats, clients=clients, port=self.port)
+
+channel_server = None  # set once the command channel is listening
+
+# ---------------------------
+# Pixel stream (raw LED frames over UDP)
+# ---------------------------
+class PixelStreamServer:
+    """Low-overhead LED frame input for effects rendered on the app side.
+
+    Each datagram is STREAM_MAGIC, a big-endian uint16 sequence number and one
+    RGB byte triple per pixel. Pixels past the default LED zone are ignored and
+    missing ones are black, so senders need not know the zone size.
+    Datagrams land in one reused receive buffer; only complete, in-order
+    frames are published to the render loop, which swaps the newest one in on
+    its next tick, so the strip never shows a half-written frame.
+    Late (reordered) datagrams are dropped; after a pause any sequence number
+    starts a new stream.
+    """
+
+    def __init__(self, controller, host='0.0.0.0', port=STREAM_PORT):
+        self.controller = controller
+        self.host = host
+        self.port = port
+        self.sock = None
+        self.stats = {'frames': 0, 'dropped_late': 0, 'invalid': 0, 'truncated': 0}
+
+    def start(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((self.host, self.port))
+        self.port = self.sock.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+        logger.info("🌈 Pixel stream listening on UDP port %s", self.port)
+
+    def _serve(self):
+        header = STREAM_HEADER.size
+        pixel_count = self.controller.default_zone.size
+        frame_size = header + 3 * pixel_count
+        buf = bytearray(65535)  # room for any UDP payload
+        last_seq = None
+        last_at = 0.0
+        while True:
+            try:
+                size = self.sock.recv_into(buf)
+            except OSError:
+                return
+            if size < header or (size - header) % 3:
+                self.stats['invalid'] += 1
+                continue
+            magic, seq = STREAM_HEADER.unpack_from(buf)
+            if magic != STREAM_MAGIC:
+                self.stats['invalid'] += 1
+                continue
+
+            now = time.monotonic()
+            if last_seq is not None and now - last_at < STREAM_TIMEOUT:
+                # Ahead of the last frame modulo 2^16, else it arrived out of order
+                if not 0 < (seq - last_seq) & 0xFFFF < 0x8000:
+                    self.stats['dropped_late'] += 1
+                    continue
+            last_seq, last_at = seq, now
+
+            if size > frame_size:
+                self.stats['truncated'] += 1
+                size = frame_size
+            pixels = [tuple(buf[i:i + 3]) for i in range(header, size, 3)]
+            pixels.extend([(0, 0, 0)] * (pixel_count - len(pixels)))
+            self.controller.push_stream_frame(pixels)
+            self.stats['frames'] += 1
+
+    def get_stats(self):
+        return dict(self.stats, port=self.port)
+
+stream_server = None  # set once the pixel stream is listening
+
+# ---------------------------
+# HTTP server (bounded worker pool)
+# ---------------------------
+SERVER_MODE = os.environ.get('PI_SERVER_MODE', 'pool')  # 'pool', or 'dev' for Flask's thread-per-request server
+SERVER_PORT = int(os.environ.get('PI_SERVER_PORT', '5001'))
+SERVER_WORKERS = int(os.environ.get('PI_SERVER_WORKERS', '4'))
+SERVER_QUEUE = int(os.environ.get('PI_SERVER_QUEUE', '32'))  # accepted connections waiting for a worker
+SERVER_CLIENT_TIMEOUT = float(os.environ.get('PI_SERVER_CLIENT_TIMEOUT', '5'))
+SERVER_KEEPALIVE = float(os.environ.get('PI_SERVER_KEEPALIVE', '5'))  # idle seconds a connection may hold a worker
+OVERLOADED_RESPONSE = (b'HTTP/1.0 503 Service Unavailable\r\n'
+                       b'Content-Type: application/json\r\nRetry-After: 1\r\nConnection: close\r\n\r\n'
+                       b'{"status": "error", "message": "server busy"}')
+
+class _RequestBody:
+    """wsgi.input that stops at Content-Length, so the unread rest can be drained before the next request"""
+
+    def __init__(self, stream, length):
+        self.stream = stream
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.stream.read(size) if size else b''
+        self.remaining = self.remaining - len(data) if data else 0
+        return data
+
+    def readinto(self, buf):
+        data = self.read(len(buf))
+        buf[:len(data)] = data
+        return len(data)
+
+    def readline(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.stream.readline(size) if size else b''
+        self.remaining = self.remaining - len(data) if data else 0
+        return data
+
+    def drain(self):
+        while self.remaining and self.read(min(self.remaining, 65536)):
+            pass
+
+class _PooledRequestHandler(WSGIRequestHandler):
+    """Request handler that keeps HTTP/1.1 connections open between requests.
+
+    Werkzeug's own response writer always answers "Connection: close", which
+    would make every pooled app connection pay a new TCP handshake. Ordinary
+    requests (no body or a sized one) are answered here with the response
+    buffered and sized, and the connection stays open; chunked uploads and
+    "Expect" requests go through werkzeug and close. A kept-alive connection
+    holds a worker, so while other connections wait for one, responses say
+    "Connection: close", and an idle connection is closed after
+    SERVER_KEEPALIVE seconds (sooner if others are waiting). A client stalled
+    mid-request gives up its worker after SERVER_CLIENT_TIMEOUT.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    timeout = SERVER_CLIENT_TIMEOUT
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; don't let Nagle hold the body back
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.requests_served = 0
+
+    def handle_one_request(self):
+        if self.requests_served and not self._next_request_ready():
+            self.close_connection = True
+            return
+        self.requests_served += 1
+        super().handle_one_request()
+
+    def _request_buffered(self):
+        """True if rfile already holds bytes of the next (pipelined) request, which select() can't see"""
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def _next_request_ready(self):
+        if self._request_buffered():
+            return True
+        deadline = time.monotonic() + SERVER_KEEPALIVE
+        while True:
+            readable, _, _ = select.select([self.connection], [], [], 0.05)
+            if readable:
+                return True
+            if not self.server.pending.empty() or time.monotonic() >= deadline:
+                return False
+
+    def run_wsgi(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if (self.close_connection or length < 0 or self.headers.get('Expect')
+                or self.headers.get('Transfer-Encoding')):
+            self.close_connection = True
+            return super().run_wsgi()
+
+        self.environ = environ = self.make_environ()
+        body = _RequestBody(self.rfile, length)
+        environ['wsgi.input'] = body
+        try:
+            app_iter, status, headers = run_wsgi_app(self.server.app, environ, buffered=True)
+            data = b''.join(app_iter)
+        except Exception:
+            self.server.log('error', 'Error on request %s %s', self.command, self.path)
+            self.close_connection = True
+            status, headers, data = '500 INTERNAL SERVER ERROR', {'Content-Type': 'application/json'}, \
+                b'{"status": "error", "message": "internal server error"}'
+            headers = list(headers.items())
+        else:
+            headers = headers.to_wsgi_list()
+
+        code, _, reason = status.partition(' ')
+        self.send_response(int(code), reason)
+        for key, value in headers:
+            if key.lower() not in ('content-length', 'connection', 'transfer-encoding'):
+                self.send_header(key, value)
+        self.send_header('Content-Length', str(len(data)))
+        if self.close_connection or not self.server.pending.empty():
+            # Others are waiting for a worker: hand this one over after the response
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+        self.wfile.flush()
+        body.drain()
+
+class PooledWSGIServer(BaseWSGIServer):
+    """WSGI server with a fixed set of worker threads instead of one per request.
+
+    The accept loop hands connections to the workers through a bounded queue;
+    when it is full, new connections get an immediate 503 instead of piling up
+    threads on the Pi. Hardware-changing commands still serialize on the
+    command lock, so the pool only bounds how many requests wait for it.
+    """
+
+    multithread = True
+
+    def __init__(self, host, port, app, workers=SERVER_WORKERS, queue_size=SERVER_QUEUE):
+        super().__init__(host, port, app, handler=_PooledRequestHandler)
+        self.workers = workers
+        self.pending = queue.Queue(queue_size)
+        self.lock = threading.Lock()
+        self.busy = 0
+        self.stats = {'accepted': 0, 'rejected': 0}
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f'http-worker-{i}', daemon=True).start()
+
+    def process_request(self, request, client_address):
+        try:
+            self.pending.put_nowait((request, client_address))
+            self.stats['accepted'] += 1
+        except queue.Full:
+            self.stats['rejected'] += 1
+            hot_log.warning("http_overload", "⚠️ HTTP queue full, rejected %s", client_address[0])
+            try:
+                request.sendall(OVERLOADED_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def _worker(self):
+        while True:
+            request, client_address = self.pending.get()
+            with self.lock:
+                self.busy += 1
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+                with self.lock:
+                    self.busy -= 1
+
+    def get_stats(self):
+        return dict(self.stats, workers=self.workers, busy=self.busy, queued=self.pending.qsize(),
+                    queue_size=self.pending.maxsize)
+
+http_server = None  # set when serving with the worker pool
+
+@app.route('/api/server/metrics', methods=['GET'])
+def api_server_metrics():
+    """Request latency percentiles per endpoint, command lock waits, worker pool load and channel clients"""
+    return jsonify({
+        'status': 'success',
+        'mode': 'pool' if http_server else 'dev',
+        'pool': http_server.get_stats() if http_server else None,
+        'channel': channel_server.get_stats() if channel_server else None,
+        'metrics': request_metrics.snapshot()
+    })
+
 # ---------------------------
 # Run Enhanced Server
 # ---------------------------
@@ -853,12 +2186,31 @@ if __name__ == '__main__':
     print("OLED UI: EXACT test version layout with sequential footer messages")
     print("CORS: Enabled for cross-origin requests")
     
+    if CHANNEL_ENABLED:
+        try:
+            channel_server = CommandChannelServer(hw)
+            channel_server.start()
+        except OSError as e:
+            print(f"⚠️ Command channel unavailable: {e}")
+    
+    if STREAM_ENABLED:
+        try:
+            stream_server = PixelStreamServer(hw)
+            stream_server.start()
+        except OSError as e:
+            print(f"⚠️ Pixel stream unavailable: {e}")
+    
     try:
-        app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
+        if SERVER_MODE == 'dev':
+            app.run(host='0.0.0.0', port=SERVER_PORT, debug=False, threaded=True)
+        else:
+            http_server = PooledWSGIServer('0.0.0.0', SERVER_PORT, app)
+            print(f"HTTP: {SERVER_WORKERS} workers, queue {SERVER_QUEUE} on port {SERVER_PORT}")
+            http_server.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e:
         print(f"❌ Server error: {e}")
     finally:
-        hw.led_off()
+        hw.shutdown_leds()
         print("✅ Cleanup complete")
@@ -0,0 +1,38 @@
+"""Wire framing for the command channel between the app (pi_channel.py) and the Pi (pi_control.py).
+
+Each frame is a 4-byte big-endian length followed by that many bytes of UTF-8
+JSON. Deploy this file next to pi_control.py on the Pi.
+"""
+
+import json
+import struct
+
+FRAME_HEADER = struct.Struct('>I')
+MAX_FRAME_BYTES = 1 << 20
+
+
+def encode_frame(payload):
+    """Serialize one frame (header + JSON body) to bytes"""
+    data = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return FRAME_HEADER.pack(len(data)) + data
+
+
+def send_frame(sock, payload):
+    sock.sendall(encode_frame(payload))
+
+
+def recv_exact(sock, size):
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(size - len(buf))
+        if not chunk:
+            raise ConnectionError('channel closed')
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def recv_frame(sock):
+    (size,) = FRAME_HEADER.unpack(recv_exact(sock, FRAME_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f'frame too large: {size} bytes')
+    return json.loads(recv_exact(sock, size).decode('utf-8'))
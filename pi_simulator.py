@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+pi_simulator.py - Local stand-in for the Raspberry Pi server
+
+Serves the full pi_control.py API (HTTP routes, /api/batch and the command
+channel) on top of its in-memory DEMO hardware, with injectable latency,
+errors, timeouts and dropped connections. Point the app at it to load-test
+PiServerClient, request batching and retries on a laptop:
+
+    python pi_simulator.py --latency lognormal:20,0.6 --error-rate 0.05 --seed 42
+    PI_SERVER_URL=http://127.0.0.1:5001 python app.py
+
+Latency specs (milliseconds): "15", "fixed:15", "uniform:5,50",
+"normal:20,5" (mean, std) or "lognormal:20,0.6" (median, sigma).
+Faults can be changed while running via GET/POST /sim/faults.
+"""
+
+import argparse
+import math
+import random
+import socket
+import sys
+import threading
+import time
+
+# Always run on virtual hardware, even on a machine that has the Pi libraries
+for _module in ('rpi_ws281x', 'board', 'adafruit_dht', 'luma', 'luma.core', 'luma.oled'):
+    sys.modules[_module] = None
+
+import pi_control
+from flask import jsonify, request
+
+
+def parse_latency(spec):
+    """Turn a latency spec into a function returning a delay in seconds"""
+    spec = str(spec).strip()
+    kind, _, args = spec.partition(':')
+    if not args:
+        kind, args = 'fixed', kind
+    try:
+        values = [float(v) for v in args.split(',')]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000.0
+    if kind == 'uniform' and len(values) == 2:
+        low, high = values
+        return lambda rng: rng.uniform(low, high) / 1000.0
+    if kind == 'normal' and len(values) == 2:
+        mean, std = values
+        return lambda rng: max(rng.gauss(mean, std), 0.0) / 1000.0
+    if kind == 'lognormal' and len(values) == 2:
+        median, sigma = values
+        mu = math.log(max(median, 1e-6))
+        return lambda rng: rng.lognormvariate(mu, sigma) / 1000.0
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+
+class FaultInjector:
+    """Seeded source of per-request latency and faults, safe to share across threads"""
+
+    def __init__(self, latency='0', error_rate=0.0, timeout_rate=0.0,
+                 disconnect_rate=0.0, hang_seconds=10.0, seed=None):
+        self.lock = threading.Lock()
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.configure(latency=latency, error_rate=error_rate, timeout_rate=timeout_rate,
+                       disconnect_rate=disconnect_rate, hang_seconds=hang_seconds)
+        self.reset_stats()
+
+    def configure(self, **settings):
+        """Update any of latency, error_rate, timeout_rate, disconnect_rate, hang_seconds"""
+        with self.lock:
+            if 'latency' in settings:
+                self.sample_latency = parse_latency(settings['latency'])
+                self.latency = str(settings['latency'])
+            for name in ('error_rate', 'timeout_rate', 'disconnect_rate'):
+                if name in settings:
+                    value = float(settings[name])
+                    if not 0.0 <= value <= 1.0:
+                        raise ValueError(f"{name} must be between 0 and 1")
+                    setattr(self, name, value)
+            if 'hang_seconds' in settings:
+                self.hang_seconds = float(settings['hang_seconds'])
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats = {'requests': 0, 'errors': 0, 'timeouts': 0,
+                          'disconnects': 0, 'total_latency_ms': 0.0}
+
+    def next_fault(self):
+        """Draw (fault, delay_seconds) for one request; fault is None, 'error', 'timeout' or 'disconnect'"""
+        with self.lock:
+            delay = self.sample_latency(self.rng)
+            roll = self.rng.random()
+            fault = None
+            if roll < self.disconnect_rate:
+                fault = 'disconnect'
+            elif roll < self.disconnect_rate + self.timeout_rate:
+                fault = 'timeout'
+            elif roll < self.disconnect_rate + self.timeout_rate + self.error_rate:
+                fault = 'error'
+            self.stats['requests'] += 1
+            self.stats['total_latency_ms'] += delay * 1000
+            if fault:
+                self.stats[fault + 's'] += 1
+        return fault, delay
+
+    def snapshot(self):
+        with self.lock:
+            stats = dict(self.stats)
+            config = {
+                'latency': self.latency,
+                'error_rate': self.error_rate,
+                'timeout_rate': self.timeout_rate,
+                'disconnect_rate': self.disconnect_rate,
+                'hang_seconds': self.hang_seconds,
+                'seed': self.seed
+            }
+        stats['avg_latency_ms'] = round(stats['total_latency_ms'] / stats['requests'], 2) if stats['requests'] else 0.0
+        stats['total_latency_ms'] = round(stats['total_latency_ms'], 2)
+        return {'config': config, 'stats': stats}
+
+
+injector = FaultInjector()
+app = pi_control.app
+
+
+@app.before_request
+def inject_faults():
+    if request.path.startswith('/sim/'):
+        return None
+    fault, delay = injector.next_fault()
+    time.sleep(delay)
+    if fault == 'timeout':
+        time.sleep(injector.hang_seconds)
+    elif fault == 'error':
+        return jsonify({'status': 'error', 'message': 'Injected server error', 'simulated': True}), 500
+    elif fault == 'disconnect':
+        sock = request.environ.get('werkzeug.socket')
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        return jsonify({'status': 'error', 'message': 'Injected disconnect'}), 503
+    return None
+
+
+@app.route('/sim/faults', methods=['GET', 'POST'])
+def sim_faults():
+    """Read or change fault injection settings at runtime (POST {"reset_stats": true} clears counters)"""
+    if request.method == 'POST':
+        data = request.get_json(force=True, silent=True) or {}
+        settings = {k: v for k, v in data.items()
+                    if k in ('latency', 'error_rate', 'timeout_rate', 'disconnect_rate', 'hang_seconds')}
+        try:
+            injector.configure(**settings)
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+        if data.get('reset_stats'):
+            injector.reset_stats()
+    return jsonify(dict(injector.snapshot(), status='success'))
+
+
+class FaultyChannelServer(pi_control.CommandChannelServer):
+    """Command channel with the same latency and fault injection as the HTTP routes"""
+
+    def _handle(self, frame):
+        fault, delay = injector.next_fault()
+        time.sleep(delay)
+        if fault == 'timeout':
+            time.sleep(injector.hang_seconds)
+        elif fault == 'disconnect':
+            # Propagates out of _serve, which drops the connection
+            raise ConnectionError('injected disconnect')
+        elif fault == 'error':
+            return {'type': 'result', 'id': frame.get('id'),
+                    'result': {'status': 'error', 'message': 'Injected server error', 'simulated': True}}
+        return super()._handle(frame)
+
+
+def make_http_server(host, port, workers=None):
+    """Pooled server like pi_control.py's production mode, or thread-per-request when workers is None"""
+    from werkzeug.serving import make_server
+
+    if workers is None:
+        return make_server(host, port, app, threaded=True)
+    pi_control.http_server = pi_control.PooledWSGIServer(host, port, app, workers=workers)
+    return pi_control.http_server
+
+
+def start_channel(host, port):
+    """Start the fault-injecting command channel and register it for /api/server/metrics"""
+    pi_control.channel_server = FaultyChannelServer(pi_control.hw, host=host, port=port)
+    pi_control.channel_server.start()
+    return pi_control.channel_server
+
+
+def start_stream(host, port):
+    """Start the UDP pixel stream and register it for /api/virtual/stats"""
+    pi_control.stream_server = pi_control.PixelStreamServer(pi_control.hw, host=host, port=port)
+    pi_control.stream_server.start()
+    return pi_control.stream_server
+
+
+def start_in_background(host='127.0.0.1', port=0, channel_port=None, stream_port=None, workers=None, **faults):
+    """Run the simulator on daemon threads (for benchmarks and scripts); returns the base URL"""
+    injector.configure(**faults)
+    server = make_http_server(host, port, workers)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    if channel_port is not None:
+        start_channel(host, channel_port)
+    if stream_port is not None:
+        start_stream(host, stream_port)
+    return f"http://{host}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Pi server stand-in with fault injection')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--channel-port', type=int, default=pi_control.CHANNEL_PORT)
+    parser.add_argument('--no-channel', action='store_true', help='do not start the command channel')
+    parser.add_argument('--stream-port', type=int, default=pi_control.STREAM_PORT)
+    parser.add_argument('--no-stream', action='store_true', help='do not start the UDP pixel stream')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='serve with a pool of this many workers, as pi_control.py does in production')
+    parser.add_argument('--latency', default='0', help='latency spec in ms, e.g. lognormal:20,0.6')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--timeout-rate', type=float, default=0.0)
+    parser.add_argument('--disconnect-rate', type=float, default=0.0)
+    parser.add_argument('--hang-seconds', type=float, default=10.0, help='how long an injected timeout stalls')
+    parser.add_argument('--seed', type=int, default=None, help='seed for reproducible fault sequences')
+    args = parser.parse_args()
+
+    global injector
+    injector = FaultInjector(latency=args.latency, error_rate=args.error_rate,
+                             timeout_rate=args.timeout_rate, disconnect_rate=args.disconnect_rate,
+                             hang_seconds=args.hang_seconds, seed=args.seed)
+
+    print("🧪 Starting Pi simulator (virtual hardware)")
+    print(f"Faults: {injector.snapshot()['config']}")
+    if not args.no_channel:
+        start_channel(args.host, args.channel_port)
+    if not args.no_stream:
+        start_stream(args.host, args.stream_port)
+    server = make_http_server(args.host, args.port, args.workers)
+    print(f"HTTP: http://{args.host}:{server.server_port}" + (f" ({args.workers} workers)" if args.workers else ''))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Simulator stopped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import logging
+import math
+import socket
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Same datagram layout as PixelStreamServer in pi_control.py:
+# b'NX' + big-endian uint16 sequence + one RGB byte triple per pixel
+STREAM_MAGIC = b'NX'
+STREAM_HEADER = struct.Struct('>2sH')
+
+# Spectrum emotions -> RGB, matching the Pi's emotion palette where they overlap
+EMOTION_COLORS = {
+    'anger': (255, 0, 0),
+    'disgust': (0, 160, 60),
+    'fear': (128, 0, 128),
+    'joy': (255, 255, 0),
+    'sadness': (0, 100, 255),
+    'surprise': (255, 255, 255),
+    'neutral': (180, 180, 180),
+}
+
+
+class PixelStreamSender:
+    """Sends raw LED frames to the Pi's UDP pixel stream.
+
+    Fire-and-forget: a lost datagram is simply replaced by the next frame, and
+    the sequence number lets the Pi drop frames that arrive out of order.
+    """
+
+    def __init__(self, host, port=5003, led_count=16):
+        self.address = (host, port)
+        self.led_count = led_count
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.seq = 0
+        self.stats = {'frames_sent': 0, 'send_errors': 0}
+
+    def send(self, pixels):
+        """Send one frame of (r, g, b) tuples; extra pixels are ignored"""
+        payload = bytearray(STREAM_HEADER.pack(STREAM_MAGIC, self.seq))
+        for r, g, b in pixels[:self.led_count]:
+            payload += bytes((max(0, min(255, int(r))), max(0, min(255, int(g))), max(0, min(255, int(b)))))
+        self.seq = (self.seq + 1) & 0xFFFF
+        try:
+            self.sock.sendto(payload, self.address)
+            self.stats['frames_sent'] += 1
+            return True
+        except OSError as e:
+            self.stats['send_errors'] += 1
+            logger.debug("Pixel stream send failed: %s", e)
+            return False
+
+    def get_stats(self):
+        return dict(self.stats, endpoint=f"{self.address[0]}:{self.address[1]}")
+
+
+class EmotionLightStreamer:
+    """Streams an emotion-driven light effect to the Pi at a steady frame rate.
+
+    The color eases toward the live dominant emotion's color and the breathing
+    wave speeds up with analysis confidence, so lighting follows the camera
+    analysis smoothly instead of jumping with each LED request.
+    `get_emotion` returns (emotion, confidence).
+    """
+
+    def __init__(self, sender, get_emotion, fps=30):
+        self.sender = sender
+        self.get_emotion = get_emotion
+        self.fps = fps
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        logger.info("🌈 Emotion light stream started (%s fps)", self.fps)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        count = self.sender.led_count
+        color = list(EMOTION_COLORS['neutral'])
+        phase = 0.0
+        deadline = time.monotonic()
+        while not self.stop_event.is_set():
+            try:
+                emotion, confidence = self.get_emotion()
+            except Exception as e:
+                logger.debug("Emotion source failed: %s", e)
+                emotion, confidence = 'neutral', 0.0
+            target = EMOTION_COLORS.get(emotion, EMOTION_COLORS['neutral'])
+            # Ease about 8% of the way per frame (~0.5 s to settle at 30 fps)
+            color = [c + (t - c) * 0.08 for c, t in zip(color, target)]
+            phase += interval * (0.2 + 0.6 * max(0.0, min(1.0, confidence or 0.0)))
+
+            pixels = []
+            for i in range(count):
+                level = 0.55 + 0.45 * math.sin(2 * math.pi * (phase + i / count))
+                pixels.append((color[0] * level, color[1] * level, color[2] * level))
+            self.sender.send(pixels)
+
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay < 0:
+                deadline = time.monotonic()
+                delay = 0
+            self.stop_event.wait(delay)
+
+    def get_stats(self):
+        return dict(self.sender.get_stats(), running=self.running, fps=self.fps)
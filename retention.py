@@ -0,0 +1,164 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+
+from history import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+class ColdArchive:
+    """Gzip-compressed NDJSON segments for history that has aged out of the hot JSON logs.
+
+    Each segment holds a contiguous, time-ordered run of records and is named
+    <kind>_<first_us>_<last_us>.ndjson.gz (plus _<n> when an earlier segment
+    already spans the same range), so time-range lookups pick segments from
+    the directory listing alone and only decompress the ones they need, one
+    at a time.
+    """
+
+    SUFFIX = '.ndjson.gz'
+
+    def __init__(self, archive_dir=os.path.join('logs', 'archive'), compresslevel=6):
+        self.archive_dir = archive_dir
+        self.compresslevel = compresslevel
+        self.lock = threading.Lock()
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+    @staticmethod
+    def _record_ts(record):
+        try:
+            return parse_timestamp(record.get('timestamp'))
+        except ValueError:
+            return None
+
+    def archive(self, kind, records):
+        """Write records (oldest first) as one compressed segment and return its path"""
+        if not records:
+            return None
+        stamps = [ts for ts in (self._record_ts(r) for r in records) if ts is not None]
+        first_ts = min(stamps) if stamps else time.time()
+        last_ts = max(stamps) if stamps else first_ts
+        stem = f"{kind}_{int(first_ts * 1e6)}_{int(last_ts * 1e6)}"
+        with self.lock:
+            # Same boundary timestamps as an existing segment: number this one, never overwrite
+            path = os.path.join(self.archive_dir, stem + self.SUFFIX)
+            seq = 0
+            while os.path.exists(path):
+                seq += 1
+                path = os.path.join(self.archive_dir, f"{stem}_{seq}{self.SUFFIX}")
+            tmp_path = path + '.tmp'
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=self.compresslevel) as f:
+                for record in records:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            # Never leave a half-written segment visible to readers
+            os.replace(tmp_path, path)
+        return path
+
+    def segments(self, kind, since=None, until=None):
+        """List segments of one kind overlapping [since, until], oldest first"""
+        found = []
+        prefix = f"{kind}_"
+        for name in os.listdir(self.archive_dir):
+            if not (name.startswith(prefix) and name.endswith(self.SUFFIX)):
+                continue
+            try:
+                first_us, last_us, *seq = name[len(prefix):-len(self.SUFFIX)].split('_')
+                first_ts, last_ts = int(first_us) / 1e6, int(last_us) / 1e6
+                seq = int(seq[0]) if seq else 0
+            except (ValueError, IndexError):
+                continue
+            if (since is not None and last_ts < since) or (until is not None and first_ts > until):
+                continue
+            path = os.path.join(self.archive_dir, name)
+            found.append({
+                'path': path,
+                'first_ts': first_ts,
+                'last_ts': last_ts,
+                'seq': seq,
+                'bytes': os.path.getsize(path)
+            })
+        found.sort(key=lambda s: (s['first_ts'], s['last_ts'], s['seq']))
+        return found
+
+    def _read_segment(self, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    def iter_records(self, kind, since=None, until=None, reverse=False, segments=None):
+        """Stream archived records within [since, until], decompressing one segment at a time.
+
+        Pass a segments list taken earlier to read a consistent snapshot; segments
+        deleted since then are skipped.
+        """
+        segments = list(segments) if segments is not None else self.segments(kind, since, until)
+        if reverse:
+            segments.reverse()
+        for segment in segments:
+            if not os.path.exists(segment['path']):
+                continue
+            records = self._read_segment(segment['path'])
+            if reverse:
+                # Segments are small and bounded, so reversing one in memory is cheap
+                records = reversed(list(records))
+            for record in records:
+                ts = self._record_ts(record)
+                if ts is None:
+                    continue
+                if (since is not None and ts < since) or (until is not None and ts > until):
+                    continue
+                yield ts, record
+
+    def prune(self, kind, older_than):
+        """Delete segments whose newest record is older than the given epoch time"""
+        removed = 0
+        with self.lock:
+            for segment in self.segments(kind):
+                if segment['last_ts'] < older_than:
+                    os.remove(segment['path'])
+                    removed += 1
+        return removed
+
+    def clear(self, kind):
+        """Delete every segment of one kind"""
+        with self.lock:
+            for segment in self.segments(kind):
+                os.remove(segment['path'])
+
+    def stats(self, kind):
+        """Segment count, compressed size and covered time range for one kind"""
+        segments = self.segments(kind)
+        return {
+            'segments': len(segments),
+            'bytes': sum(s['bytes'] for s in segments),
+            'oldest_ts': segments[0]['first_ts'] if segments else None,
+            'newest_ts': max(s['last_ts'] for s in segments) if segments else None
+        }
+
+
+def apply_retention(archive, kind, records, hot_entries, segment_entries, archive_days=0):
+    """Move the oldest records of an over-full hot log into a compressed segment.
+
+    Archiving happens in batches: the hot list may grow to hot_entries +
+    segment_entries before the excess is written out, so each segment holds a
+    meaningful run of records. Returns the records that stay hot.
+    """
+    if len(records) <= hot_entries + segment_entries:
+        return records
+    excess = len(records) - hot_entries
+    try:
+        archive.archive(kind, records[:excess])
+    except Exception as e:
+        # Keep everything hot and retry on the next write rather than losing data
+        logger.warning("⚠️ Archiving %s failed, keeping records hot: %s", kind, e)
+        return records
+    if archive_days:
+        archive.prune(kind, time.time() - archive_days * 86400)
+    logger.info("🗄️ Archived %s %s records to %s", excess, kind, archive.archive_dir)
+    return records[excess:]
@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from history import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Bucket width in seconds and how many buckets to retain per resolution
+ROLLUP_RESOLUTIONS = {
+    'minute': (60, 24 * 60),      # last 24 hours
+    'hour': (3600, 30 * 24),      # last 30 days
+}
+
+
+def bucket_start(ts, width):
+    """Start of the bucket holding ts, on local wall-clock boundaries.
+
+    Aligning to the UTC epoch would put hour buckets at :30 or :45 in
+    half- and quarter-hour timezones (e.g. IST), and the dashboard labels
+    them by local hour.
+    """
+    offset = datetime.fromtimestamp(ts).astimezone().utcoffset().total_seconds()
+    return ts - (ts + offset) % width
+
+
+class _RollupBucket:
+    """Running sums for one time bucket, so means are cheap to read"""
+
+    __slots__ = ('start', 'count', 'emotion_counts', 'spectrum_sums',
+                 'confidence_sum', 'bio_sums', 'bio_counts')
+
+    def __init__(self, start):
+        self.start = start
+        self.count = 0
+        self.emotion_counts = {}
+        self.spectrum_sums = {}
+        self.confidence_sum = 0.0
+        self.bio_sums = {}
+        self.bio_counts = {}
+
+    def add(self, entry):
+        self.count += 1
+        dominant = entry.get('dominant_emotion', 'unknown')
+        self.emotion_counts[dominant] = self.emotion_counts.get(dominant, 0) + 1
+        for emotion, value in (entry.get('emotion_spectrum') or {}).items():
+            self.spectrum_sums[emotion] = self.spectrum_sums.get(emotion, 0.0) + float(value)
+        self.confidence_sum += float(entry.get('quantum_confidence', 0) or 0)
+        for metric, value in (entry.get('bio_metrics') or {}).items():
+            if isinstance(value, (int, float)):
+                self.bio_sums[metric] = self.bio_sums.get(metric, 0.0) + float(value)
+                self.bio_counts[metric] = self.bio_counts.get(metric, 0) + 1
+
+    def to_state(self):
+        return [self.start, self.count, self.emotion_counts, self.spectrum_sums,
+                self.confidence_sum, self.bio_sums, self.bio_counts]
+
+    @classmethod
+    def from_state(cls, state):
+        bucket = cls(state[0])
+        (bucket.count, bucket.emotion_counts, bucket.spectrum_sums,
+         bucket.confidence_sum, bucket.bio_sums, bucket.bio_counts) = state[1:]
+        return bucket
+
+    def to_dict(self):
+        count = self.count or 1
+        return {
+            'bucket_start': datetime.fromtimestamp(self.start).isoformat(),
+            'timestamp': self.start,
+            'count': self.count,
+            'emotion_counts': dict(self.emotion_counts),
+            'mean_spectrum': {k: round(v / count, 4) for k, v in self.spectrum_sums.items()},
+            'mean_confidence': round(self.confidence_sum / count, 4),
+            'mean_bio_metrics': {
+                k: round(v / self.bio_counts[k], 4) for k, v in self.bio_sums.items()
+            }
+        }
+
+
+class EmotionRollups:
+    """Incremental per-minute and per-hour aggregates of logged emotion samples.
+
+    The buckets are saved to state_file each time a new minute bucket opens.
+    On restart the snapshot is reloaded and only hot-log samples newer than it
+    are replayed; without a snapshot the buckets are rebuilt from the cold
+    archive (when one is attached) and the hot log.
+    """
+
+    def __init__(self, log_file=os.path.join('logs', 'emotions.json'),
+                 state_file=os.path.join('logs', 'rollups.json'), archive=None, archive_kind='emotions'):
+        self.log_file = log_file
+        self.state_file = state_file
+        self.archive = archive
+        self.archive_kind = archive_kind
+        self.lock = threading.Lock()
+        self._buckets = {name: OrderedDict() for name in ROLLUP_RESOLUTIONS}
+        self._through = None  # timestamp of the newest sample folded in
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        restored = self._load_state()
+        if not restored and self.archive is not None:
+            width, retain = ROLLUP_RESOLUTIONS['hour']
+            cutoff = time.time() - width * retain
+            records = self.archive.iter_records(self.archive_kind, since=cutoff)
+            try:
+                for _, entry in records:
+                    self._add(entry)
+            finally:
+                records.close()
+        if not os.path.exists(self.log_file):
+            return
+        try:
+            with open(self.log_file, 'r') as f:
+                entries = json.load(f).get('emotion_logs', [])
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("⚠️ Rollups could not read %s: %s", self.log_file, e)
+            return
+        through = self._through if restored else None
+        for entry in entries:
+            if through is not None:
+                try:
+                    ts = parse_timestamp(entry.get('timestamp'))
+                except ValueError:
+                    continue
+                if ts is None or ts <= through:
+                    continue
+            self._add(entry)
+
+    def _load_state(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return False
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            buckets = {
+                name: OrderedDict(
+                    (bucket.start, bucket) for bucket in map(_RollupBucket.from_state, state['buckets'].get(name, []))
+                )
+                for name in ROLLUP_RESOLUTIONS
+            }
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning("⚠️ Rollups could not read %s: %s", self.state_file, e)
+            return False
+        # Saved under another alignment or timezone: rebuild rather than mix bucket grids
+        for name, (width, _) in ROLLUP_RESOLUTIONS.items():
+            if any(bucket_start(start, width) != start for start in buckets[name]):
+                return False
+        self._buckets = buckets
+        self._through = state.get('through')
+        return True
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        state = {
+            'through': self._through,
+            'buckets': {
+                name: [bucket.to_state() for bucket in buckets.values()]
+                for name, buckets in self._buckets.items()
+            }
+        }
+        tmp_path = self.state_file + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            logger.warning("⚠️ Rollups could not save %s: %s", self.state_file, e)
+
+    def _add(self, entry):
+        """Fold one sample in; returns True when it opened a new minute bucket"""
+        try:
+            ts = parse_timestamp(entry.get('timestamp'))
+        except ValueError:
+            return False
+        if ts is None:
+            return False
+        opened = False
+        for name, (width, retain) in ROLLUP_RESOLUTIONS.items():
+            buckets = self._buckets[name]
+            start = bucket_start(ts, width)
+            bucket = buckets.get(start)
+            if bucket is None:
+                opened = opened or name == 'minute'
+                newest = next(reversed(buckets), None)
+                bucket = buckets[start] = _RollupBucket(start)
+                # Out-of-order samples are rare; keep buckets sorted when they happen
+                if newest is not None and start < newest:
+                    for key in sorted(buckets):
+                        buckets.move_to_end(key)
+                while len(buckets) > retain:
+                    buckets.popitem(last=False)
+            bucket.add(entry)
+        if self._through is None or ts > self._through:
+            self._through = ts
+        return opened
+
+    def add(self, entry):
+        """Fold one logged emotion sample into every resolution"""
+        with self.lock:
+            self._ensure_loaded()
+            if self._add(entry):
+                self._save_state()
+
+    def clear(self):
+        """Drop all aggregates"""
+        with self.lock:
+            self._buckets = {name: OrderedDict() for name in ROLLUP_RESOLUTIONS}
+            self._through = None
+            self._loaded = True
+            self._save_state()
+
+    def query(self, resolution='minute', since=None, until=None):
+        """Return the buckets of one resolution within [since, until], oldest first"""
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        width = ROLLUP_RESOLUTIONS[resolution][0]
+        with self.lock:
+            self._ensure_loaded()
+            return [
+                bucket.to_dict() for start, bucket in self._buckets[resolution].items()
+                if (since is None or start + width > since) and (until is None or start <= until)
+            ]
@@ -3,6 +3,8 @@ import json
 import logging
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class SparkAPI:
     def __init__(self):
         # Google AI API endpoints
@@ -21,7 +23,7 @@ class SparkAPI:
         self.session_id = f"nexus_session_{int(datetime.now().timestamp())}"
         self.conversation_context = []
         
-        print(f"🚀 Using Google AI Model: {self.current_model}")
+        logger.info("🚀 Using Google AI Model: %s", self.current_model)
     
     def get_ai_response(self, message, emotion_context=None, conversation_history=None):
         """
@@ -73,8 +75,7 @@ class SparkAPI:
             }
             
             url = f"{self.base_url}/{self.current_model}:generateContent?key={self.api_key}"
-            print(f"🔌 Calling Google AI: {self.current_model}")
-            print(f"📤 Message: {message[:50]}...")
+            logger.debug("🔌 Calling Google AI: %s, message: %.50s...", self.current_model, message)
             
             # Make API call to Google AI
             response = requests.post(
@@ -84,7 +85,7 @@ class SparkAPI:
                 timeout=15
             )
             
-            print(f"📡 Google AI response status: {response.status_code}")
+            logger.debug("📡 Google AI response status: %s", response.status_code)
             
             if response.status_code == 200:
                 result = response.json()
@@ -93,12 +94,11 @@ class SparkAPI:
                 if 'candidates' in result and len(result['candidates']) > 0:
                     ai_response = result['candidates'][0]['content']['parts'][0]['text']
                     
-                    print(f"✅ Google AI success: {ai_response[:80]}...")
+                    logger.debug("✅ Google AI success: %.80s...", ai_response)
                     
                     return ai_response
                 else:
-                    error_msg = "No response candidate in Google AI response"
-                    print(f"❌ {error_msg}")
+                    logger.warning("❌ No response candidate in Google AI response")
                     return self._get_fallback_response(message, emotion_context)
                     
             else:
@@ -109,24 +109,20 @@ class SparkAPI:
                         error_msg += f" - {error_data.get('error', {}).get('message', 'Unknown error')}"
                     except:
                         error_msg += f" - {response.text[:100]}"
-                logging.error(error_msg)
-                print(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 return self._get_fallback_response(message, emotion_context)
                 
         except requests.exceptions.Timeout:
             error_msg = "Google AI API timeout - service not responding"
-            logging.error(error_msg)
-            print(f"⏰ {error_msg}")
+            logger.error("⏰ %s", error_msg)
             return self._get_fallback_response(message, emotion_context)
         except requests.exceptions.ConnectionError:
             error_msg = "Google AI API connection failed - check internet"
-            logging.error(error_msg)
-            print(f"🔌 {error_msg}")
+            logger.error("🔌 %s", error_msg)
             return self._get_fallback_response(message, emotion_context)
         except Exception as e:
             error_msg = f"Google AI API call failed: {e}"
-            logging.error(error_msg)
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             return self._get_fallback_response(message, emotion_context)
     
     def _create_system_prompt(self, emotion_context):
@@ -224,7 +220,7 @@ Please acknowledge this emotional state naturally in your response and provide a
             return insight_response
             
         except Exception as e:
-            print(f"❌ Emotional insight generation failed: {e}")
+            logger.error("❌ Emotional insight generation failed: %s", e)
             return self._get_fallback_insight(emotion_data)
     
     def _get_fallback_insight(self, emotion_data):
@@ -247,8 +243,8 @@ Please acknowledge this emotional state naturally in your response and provide a
         """Switch to a different Gemini model"""
         if model_name in self.available_models:
             self.current_model = model_name
-            print(f"🔄 Switched to model: {model_name}")
+            logger.info("🔄 Switched to model: %s", model_name)
             return True
         else:
-            print(f"❌ Model {model_name} not in available models")
+            logger.warning("❌ Model %s not in available models", model_name)
             return False
\ No newline at end of file
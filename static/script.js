@@ -2125,10 +2125,29 @@ class NexusAIDashboard {
     }
   }
 
+  async fetchEmotionHistory() {
+    // The first page is the newest 50 entries. When it is scoped to the current
+    // session, follow next_cursor so the whole session comes back, as before paging.
+    const entries = [];
+    let path = "/api/memory/history";
+    let data;
+    while (true) {
+      data = await this.callFlaskEndpoint(path);
+      if (data.status !== "success") return data;
+      // Pages walk back from the newest entry; each page is chronological
+      entries.unshift(...(data.emotion_history || []));
+      if (!data.has_more || !data.next_cursor || !data.session_id) break;
+      path =
+        `/api/memory/history?limit=1000&session_id=${encodeURIComponent(data.session_id)}` +
+        `&cursor=${encodeURIComponent(data.next_cursor)}`;
+    }
+    return { ...data, emotion_history: entries };
+  }
+
   async loadMemoryData() {
     try {
       this.isLoadingMemory = true;
-      const data = await this.callFlaskEndpoint("/api/memory/history");
+      const data = await this.fetchEmotionHistory();
 
       if (data.status === "success") {
         this.memoryData = data.emotion_history || [];
@@ -2823,11 +2842,14 @@ class NexusAIDashboard {
   }
 
   async loadAnalyticsData() {
-    console.log("📊 Loading analytics data from emotion.json...");
+    console.log("📊 Loading analytics data...");
+
+    // Server-side rollups cover the whole history; raw samples are only a fallback
+    if (await this.loadAnalyticsRollups()) return;
 
     try {
       // Try to get data from the emotion.json file via Flask
-      const emotionData = await this.callFlaskEndpoint("/api/memory/history");
+      const emotionData = await this.fetchEmotionHistory();
 
       if (emotionData.status === "success" && emotionData.emotion_history) {
         this.analyticsData = emotionData.emotion_history;
@@ -2837,27 +2859,19 @@ class NexusAIDashboard {
 
         // Also update memory data for consistency
         this.memoryData = this.analyticsData;
-
-        if (this.analyticsData.length === 0) {
-          this.showPlaceholderData();
-        } else {
-          this.updateAllCharts(this.analyticsData);
-          this.updateMetricsOverview(this.analyticsData);
-          this.updateAnalyticsInsights(this.analyticsData);
-        }
       } else {
         // Fallback to local session data if no file data
         this.analyticsData =
           this.memoryData.length > 0 ? this.memoryData : this.emotionHistory;
         console.log("📊 Using session data as fallback");
+      }
 
-        if (this.analyticsData.length === 0) {
-          this.showPlaceholderData();
-        } else {
-          this.updateAllCharts(this.analyticsData);
-          this.updateMetricsOverview(this.analyticsData);
-          this.updateAnalyticsInsights(this.analyticsData);
-        }
+      if (this.analyticsData.length === 0) {
+        this.showPlaceholderData();
+      } else {
+        this.updateAllCharts(this.analyticsData);
+        this.updateMetricsOverview(this.analyticsData);
+        this.updateAnalyticsInsights(this.analyticsData);
       }
     } catch (error) {
       console.error("❌ Analytics data loading failed:", error);
@@ -2865,6 +2879,153 @@ class NexusAIDashboard {
     }
   }
 
+  async loadAnalyticsRollups() {
+    // Per-minute points drive the recent charts, per-hour points the whole-history ones
+    try {
+      const [minute, hour] = await Promise.all([
+        this.callFlaskEndpoint("/api/analytics/rollups?resolution=minute"),
+        this.callFlaskEndpoint("/api/analytics/rollups?resolution=hour"),
+      ]);
+      if (hour.status !== "success" || !hour.rollups?.length) return false;
+
+      const recent =
+        minute.status === "success" && minute.rollups?.length
+          ? minute.rollups
+          : hour.rollups;
+      const points = recent.map((bucket) => this.rollupAsSample(bucket));
+      console.log(
+        `📊 Loaded ${recent.length} minute and ${hour.rollups.length} hour rollups`
+      );
+
+      this.updateTrendChart(points);
+      this.updateStressChart(points);
+      this.updateRadarChart(points);
+      this.updateDistributionFromRollups(hour.rollups);
+      this.updateHourlyFromRollups(hour.rollups);
+      this.updateMetricsFromRollups(hour.rollups);
+      this.updateAnalyticsInsights(points);
+      return true;
+    } catch (error) {
+      console.error("📊 Rollup loading failed, using raw samples:", error);
+      return false;
+    }
+  }
+
+  rollupAsSample(bucket) {
+    // Shape a rollup bucket like a logged sample so the per-sample charts can draw it
+    const counts = Object.entries(bucket.emotion_counts || {});
+    const dominant = counts.length
+      ? counts.reduce((a, b) => (a[1] >= b[1] ? a : b))[0]
+      : undefined;
+    return {
+      timestamp: bucket.bucket_start,
+      dominant_emotion: dominant,
+      emotion_spectrum: bucket.mean_spectrum || {},
+      bio_metrics: bucket.mean_bio_metrics || {},
+      quantum_confidence: bucket.mean_confidence || 0,
+    };
+  }
+
+  updateMetricsFromRollups(rollups) {
+    let total = 0;
+    let joy = 0;
+    let stress = 0;
+    let confidence = 0;
+    let engagement = 0;
+    const emotionCounts = {};
+
+    rollups.forEach((bucket) => {
+      const n = bucket.count || 0;
+      const spectrum = bucket.mean_spectrum || {};
+      const bio = bucket.mean_bio_metrics || {};
+      total += n;
+      joy += (spectrum.joy || 0) * n;
+      stress += (bio.stress_index || 0) * n;
+      confidence += (bucket.mean_confidence || 0) * n;
+      engagement += (bio.engagement ?? 0.5) * n;
+      Object.entries(bucket.emotion_counts || {}).forEach(([emotion, count]) => {
+        emotionCounts[emotion] = (emotionCounts[emotion] || 0) + count;
+      });
+    });
+    if (total === 0) return;
+
+    const percent = (sum) => `${Math.round((sum / total) * 100)}%`;
+    const uniqueEmotions = Object.keys(emotionCounts).length;
+    const stabilityScore = Math.max(0, 100 - (uniqueEmotions / total) * 50);
+    const mostCommon = uniqueEmotions
+      ? this.capitalize(
+          Object.entries(emotionCounts).reduce((a, b) => (a[1] > b[1] ? a : b))[0]
+        )
+      : "--";
+
+    this.updateElementText("totalAnalyses", total);
+    this.updateElementText("avgPositivity", percent(joy));
+    this.updateElementText("avgStress", percent(stress));
+    this.updateElementText("stabilityScore", `${Math.round(stabilityScore)}%`);
+    this.updateElementText("engagementScore", percent(engagement));
+    this.updateElementText("dataPointsCount", total);
+    this.updateElementText("mostCommonEmotion", mostCommon);
+    this.updateElementText("avgConfidence", percent(confidence));
+  }
+
+  updateDistributionFromRollups(rollups) {
+    if (!this.distributionChart) return;
+
+    const emotionCounts = {
+      joy: 0,
+      neutral: 0,
+      sadness: 0,
+      anger: 0,
+      fear: 0,
+      surprise: 0,
+    };
+
+    rollups.forEach((bucket) => {
+      Object.entries(bucket.emotion_counts || {}).forEach(([emotion, count]) => {
+        if (emotionCounts.hasOwnProperty(emotion)) {
+          emotionCounts[emotion] += count;
+        }
+      });
+    });
+
+    const total = Object.values(emotionCounts).reduce((a, b) => a + b, 0);
+    const percentages = Object.values(emotionCounts).map((count) =>
+      total > 0 ? Math.round((count / total) * 100) : 0
+    );
+
+    this.distributionChart.data.datasets[0].data = percentages;
+    this.distributionChart.update("active");
+  }
+
+  updateHourlyFromRollups(rollups) {
+    if (!this.hourlyChart) return;
+
+    const hourlyData = Array(6)
+      .fill(0)
+      .map(() => ({ sum: 0, count: 0 }));
+    const hours = [6, 9, 12, 15, 18, 21];
+
+    rollups.forEach((bucket) => {
+      const hour = new Date(bucket.bucket_start).getHours();
+      for (let i = 0; i < hours.length; i++) {
+        if (hour >= hours[i] && hour < hours[i] + 3) {
+          const joy = (bucket.mean_spectrum || {}).joy || 0;
+          // Weight each bucket by its sample count to match the per-sample average
+          hourlyData[i].sum += joy * 100 * bucket.count;
+          hourlyData[i].count += bucket.count;
+          break;
+        }
+      }
+    });
+
+    const averages = hourlyData.map((data) =>
+      data.count > 0 ? Math.round(data.sum / data.count) : 0
+    );
+
+    this.hourlyChart.data.datasets[0].data = averages;
+    this.hourlyChart.update("active");
+  }
+
   showPlaceholderData() {
     console.log("📊 Showing placeholder data");
 
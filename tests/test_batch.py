@@ -0,0 +1,89 @@
+import pytest
+
+# Imported first so pi_control always comes up on virtual hardware
+import pi_simulator  # noqa: F401
+import pi_control
+
+
+@pytest.fixture
+def applied(monkeypatch):
+    """Record every operation that reaches the hardware"""
+    calls = []
+    real_run_operation = pi_control.run_operation
+
+    def run_operation(name, params=None):
+        calls.append(name)
+        return real_run_operation(name, params)
+
+    monkeypatch.setattr(pi_control, 'run_operation', run_operation)
+    return calls
+
+
+def _hardware_state():
+    hw = pi_control.hw
+    return hw.led_on_state, hw.led_brightness_percent, hw.current_color
+
+
+@pytest.mark.parametrize('bad_op, message', [
+    ({'op': 'led_sparkle'}, 'unknown operation: led_sparkle'),
+    ({'op': 'led_brightness'}, 'brightness parameter missing'),
+    ({'op': 'led_brightness', 'params': {'brightness': 'max'}}, 'brightness must be an integer'),
+    ({'op': 'led_on', 'params': {'zone': 'ceiling'}}, 'unknown LED zone: ceiling'),
+    ({'op': 'led_on', 'params': ['zone']}, 'params must be an object'),
+    ('led_on', 'operation must be an object'),
+])
+def test_invalid_entry_rejects_whole_batch(applied, bad_op, message):
+    before = _hardware_state()
+    operations = [
+        {'op': 'led_brightness', 'params': {'brightness': 17}},
+        {'op': 'led_on'},
+        bad_op,
+        {'op': 'display_update', 'params': {'message': 'never shown'}},
+    ]
+    payload, status = pi_control.run_batch(operations)
+
+    assert status == 400
+    assert payload['message'] == 'batch rejected, nothing applied'
+    assert [r['status'] for r in payload['results']] == ['skipped', 'skipped', 'error', 'skipped']
+    assert payload['results'][2]['message'] == message
+    assert applied == []
+    assert _hardware_state() == before
+
+
+@pytest.mark.parametrize('operations', [None, [], {'op': 'led_on'}])
+def test_missing_operations_rejected(applied, operations):
+    payload, status = pi_control.run_batch(operations)
+    assert status == 400
+    assert payload['message'] == 'operations list missing'
+    assert applied == []
+
+
+def test_oversized_batch_rejected(applied):
+    operations = [{'op': 'system_status'}] * (pi_control.MAX_BATCH_OPERATIONS + 1)
+    payload, status = pi_control.run_batch(operations)
+    assert status == 400
+    assert 'too many operations' in payload['message']
+    assert applied == []
+
+
+def test_valid_batch_applies_in_order(applied):
+    operations = [
+        {'op': 'led_brightness', 'params': {'brightness': 42}},
+        {'op': 'system_status'},
+    ]
+    payload, status = pi_control.run_batch(operations)
+    assert status == 200
+    assert payload['status'] == 'success'
+    assert [r['op'] for r in payload['results']] == ['led_brightness', 'system_status']
+    assert applied == ['led_brightness', 'system_status']
+
+
+def test_batch_endpoint_rejects_without_applying(applied):
+    before = _hardware_state()
+    response = pi_control.app.test_client().post('/api/batch', json={
+        'operations': [{'op': 'led_on'}, {'op': 'display_update'}]
+    })
+    assert response.status_code == 400
+    assert response.get_json()['results'][1]['message'] == 'message parameter missing'
+    assert applied == []
+    assert _hardware_state() == before
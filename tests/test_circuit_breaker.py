@@ -0,0 +1,81 @@
+import pytest
+
+import pi_client
+from pi_client import CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pi_client.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=5.0)
+    assert not breaker.record_failure()
+    assert not breaker.record_failure()
+    assert breaker.allow_request()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.get_stats()['rejected_requests'] == 1
+    assert breaker.get_stats()['times_opened'] == 1
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    assert not breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_only_after_reset_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0)
+    breaker.record_failure()
+    clock[0] += 4.9
+    assert not breaker.try_half_open()
+    clock[0] += 0.1
+    assert breaker.try_half_open()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Normal traffic stays blocked until the probe succeeds
+    assert not breaker.allow_request()
+    assert not breaker.try_half_open()
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0)
+    breaker.record_failure()
+    clock[0] += 5.0
+    breaker.try_half_open()
+    assert breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+    assert breaker.reset_timeout == 5.0
+
+
+def test_half_open_probe_failure_reopens_with_backoff(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, max_reset_timeout=12.0)
+    breaker.record_failure()
+    for expected in (10.0, 12.0, 12.0):
+        clock[0] += breaker.reset_timeout
+        assert breaker.try_half_open()
+        # Re-opening from half-open is not a new outage
+        assert not breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.reset_timeout == expected
+    assert breaker.get_stats()['times_opened'] == 1
+
+    clock[0] += breaker.reset_timeout
+    breaker.try_half_open()
+    breaker.record_success()
+    assert breaker.reset_timeout == 5.0
+
+
+def test_trip_opens_immediately(clock):
+    breaker = CircuitBreaker(failure_threshold=3)
+    assert breaker.trip()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.trip()
+    assert breaker.get_stats()['times_opened'] == 1
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from history import HistoryIndex, decode_cursor
+from retention import ColdArchive
+
+# Archived and hot timestamps, with runs of equal timestamps on both sides of
+# the boundary and one timestamp shared by the newest archived and oldest hot entry
+ARCHIVED = [100, 101, 101, 101, 102, 103, 103, 104, 104, 104, 104, 105]
+HOT = [105, 106, 106, 107, 108, 108, 108, 109]
+
+
+def _entries(stamps, start_id):
+    return [{'timestamp': float(ts), 'id': start_id + i} for i, ts in enumerate(stamps)]
+
+
+@pytest.fixture
+def index(tmp_path):
+    archive = ColdArchive(str(tmp_path / 'archive'))
+    archived = _entries(ARCHIVED, 0)
+    archive.archive('emotions', archived[:6])
+    archive.archive('emotions', archived[6:])
+    log_file = tmp_path / 'emotions.json'
+    log_file.write_text(json.dumps({'emotion_logs': _entries(HOT, len(ARCHIVED))}))
+    return HistoryIndex(str(log_file), archive=archive)
+
+
+def _walk(index, order, limit, **filters):
+    pages, cursor = [], None
+    while True:
+        result = index.query(limit=limit, cursor=cursor, order=order, **filters)
+        pages.append([entry['id'] for entry in result['entries']])
+        if not result['has_more']:
+            return pages
+        cursor = decode_cursor(result['next_cursor'])
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, 4, 5, 7, 12, 50])
+def test_desc_pages_cross_into_archive(index, limit):
+    pages = _walk(index, 'desc', limit)
+    ids = [i for page in pages for i in page]
+    assert sorted(ids) == list(range(len(ARCHIVED) + len(HOT)))
+    # Newest page first; entries inside a page stay chronological
+    assert [i for page in reversed(pages) for i in page] == list(range(len(ARCHIVED) + len(HOT)))
+    assert all(len(page) <= limit for page in pages)
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, 4, 5, 7, 12, 50])
+def test_asc_pages_cross_into_hot_log(index, limit):
+    pages = _walk(index, 'asc', limit)
+    assert [i for page in pages for i in page] == list(range(len(ARCHIVED) + len(HOT)))
+    assert all(len(page) <= limit for page in pages)
+
+
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+def test_time_range_keeps_equal_timestamp_runs_whole(index, order):
+    pages = _walk(index, order, 2, since=104, until=106)
+    ids = sorted(i for page in pages for i in page)
+    expected = [i for i, ts in enumerate(ARCHIVED + HOT) if 104 <= ts <= 106]
+    assert ids == expected
+
+
+def test_hot_count_ignores_archive(index):
+    result = index.query(limit=5)
+    assert result['hot_count'] == len(HOT)
+    assert len(index) == len(HOT)
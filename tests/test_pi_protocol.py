@@ -0,0 +1,75 @@
+import socket
+import threading
+
+import pytest
+
+from pi_protocol import FRAME_HEADER, MAX_FRAME_BYTES, encode_frame, recv_frame, send_frame
+
+
+@pytest.fixture
+def pair():
+    a, b = socket.socketpair()
+    a.settimeout(5)
+    b.settimeout(5)
+    yield a, b
+    a.close()
+    b.close()
+
+
+def test_round_trip(pair):
+    a, b = pair
+    payload = {'id': 7, 'op': 'display_update', 'params': {'message': 'Héllo ✨'}}
+    send_frame(a, payload)
+    assert recv_frame(b) == payload
+
+
+def test_back_to_back_frames_stay_separate(pair):
+    a, b = pair
+    a.sendall(encode_frame({'n': 1}) + encode_frame({'n': 2}) + encode_frame([]))
+    assert [recv_frame(b) for _ in range(3)] == [{'n': 1}, {'n': 2}, []]
+
+
+def test_frame_split_across_partial_writes(pair):
+    a, b = pair
+    data = encode_frame({'text': 'x' * 5000})
+
+    def trickle():
+        # Split inside the header and inside the body
+        for chunk in (data[:2], data[2:7], data[7:4000], data[4000:]):
+            a.sendall(chunk)
+
+    writer = threading.Thread(target=trickle)
+    writer.start()
+    assert recv_frame(b) == {'text': 'x' * 5000}
+    writer.join()
+
+
+def test_header_matches_body_length():
+    data = encode_frame({'a': 1})
+    (size,) = FRAME_HEADER.unpack(data[:FRAME_HEADER.size])
+    assert size == len(data) - FRAME_HEADER.size == len(b'{"a":1}')
+
+
+def test_oversized_frame_rejected_before_reading_body(pair):
+    a, b = pair
+    a.sendall(FRAME_HEADER.pack(MAX_FRAME_BYTES + 1))
+    with pytest.raises(ValueError, match='frame too large'):
+        recv_frame(b)
+
+
+def test_largest_allowed_frame_accepted(pair):
+    a, b = pair
+    body = b'"' + b'x' * (MAX_FRAME_BYTES - 2) + b'"'
+    writer = threading.Thread(target=a.sendall, args=(FRAME_HEADER.pack(len(body)) + body,))
+    writer.start()
+    assert len(recv_frame(b)) == MAX_FRAME_BYTES - 2
+    writer.join()
+
+
+@pytest.mark.parametrize('cut', [0, 2, FRAME_HEADER.size, FRAME_HEADER.size + 3])
+def test_truncated_frame_raises_connection_error(pair, cut):
+    a, b = pair
+    a.sendall(encode_frame({'message': 'cut short'})[:cut])
+    a.shutdown(socket.SHUT_WR)
+    with pytest.raises(ConnectionError):
+        recv_frame(b)